@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Capacity Planning Simulation
+
+This script simulates the Chapter 2 deployment topologies under 1-500
+interactive users with the vectorized queueing engine in
+tool_capacity_simulator_example.py. Tool service times are fitted to recorded
+latencies: a span file from tool_tracing_example.SpanTracer (for example one
+recorded by component_attribution_benchmark.py) or a JSON array of
+milliseconds. The scaling curves are written in the data format of
+resources/benchmarks/visualizations/architecture_scaling_visualization.py:
+
+    python capacity_simulation.py --latencies spans.jsonl --output scaling.json
+    python ../visualizations/render_all.py --data architecture_scaling_visualization=scaling.json
+
+Topologies can be replaced with --topologies, a JSON object mapping
+architecture names to stage lists (see DEFAULT_TOPOLOGIES).
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+# Make the Tool Registry examples importable
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(script_dir, '..', '..', 'code_examples'))
+
+from tool_capacity_simulator_example import (  # noqa: E402
+    CapacitySimulator, ServiceTimeModel, DEFAULT_TOPOLOGIES, load_latency_samples
+)
+
+DEFAULT_USERS = [1, 10, 50, 100, 200, 300, 400, 500]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--latencies", help="Span file or JSON array of tool latencies (ms) to fit")
+    parser.add_argument("--span-name", default="handler", help="Span whose durations are fitted")
+    parser.add_argument("--model", choices=["lognormal", "empirical"], default="lognormal",
+                        help="Service time distribution fitted to the latencies")
+    parser.add_argument("--median-ms", type=float, default=150.0,
+                        help="Median tool latency when no latencies are given")
+    parser.add_argument("--sigma", type=float, default=0.5,
+                        help="Log-standard deviation when no latencies are given")
+    parser.add_argument("--topologies", help="JSON file of architecture stage definitions")
+    parser.add_argument("--users", type=int, nargs="+", default=DEFAULT_USERS, help="Concurrent user counts")
+    parser.add_argument("--think-time-ms", type=float, default=1000.0, help="Mean user think time")
+    parser.add_argument("--requests", type=int, default=100000, help="Requests simulated per evaluation")
+    parser.add_argument("--seed", type=int, default=1, help="Random seed")
+    parser.add_argument("--output", help="Write the scaling curves as chart data to this file")
+    args = parser.parse_args()
+
+    if args.latencies:
+        model = ServiceTimeModel(load_latency_samples(args.latencies, args.span_name), kind=args.model)
+    else:
+        model = ServiceTimeModel.lognormal(args.median_ms, args.sigma)
+    topologies = DEFAULT_TOPOLOGIES
+    if args.topologies:
+        with open(args.topologies) as f:
+            topologies = json.load(f)
+
+    described = model.describe()
+    print(f"Service time: {described['kind']}, median {described['median_ms']:.1f}ms, "
+          f"mean {described['mean_ms']:.1f}ms")
+    start = time.perf_counter()
+    simulator = CapacitySimulator(model, requests=args.requests, think_time_ms=args.think_time_ms, seed=args.seed)
+    curves = simulator.scaling_curves(topologies, args.users)
+    elapsed = time.perf_counter() - start
+
+    print(f"{'architecture':14} {'capacity':>10} {'breakpoint':>11} " +
+          " ".join(f"{users:>8}" for users in args.users))
+    for name, values in curves["response_time_ms"].items():
+        print(f"{name:14} {curves['capacity_rps'][name]:8.1f}/s {curves['breakpoints'][name]:11.0f} " +
+              " ".join(f"{value:8.0f}" for value in values))
+    print(f"(mean response time in ms per user count; simulated in {elapsed:.1f}s)")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(curves, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Component Latency Attribution Benchmark
+
+This script records tracing spans (tool_tracing_example.py) while driving
+ToolRegistry dispatch with a mix of IO-bound and CPU-bound tools, then derives
+the component latency-attribution matrix from the recorded spans. The matrix
+is written in the data format of
+resources/benchmarks/visualizations/component_performance_heatmap.py:
+
+    python component_attribution_benchmark.py --heatmap-output attribution.json
+    python ../visualizations/render_all.py --data component_performance_heatmap=attribution.json
+
+An existing span file (e.g. recorded in production) can be analyzed instead of
+running the synthetic workload with --spans.
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+# Make the Tool Registry examples importable
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(script_dir, '..', '..', 'code_examples'))
+
+from tool_registry_example import (  # noqa: E402
+    ToolRegistry, ToolCategory, ToolPermissionLevel, logger as registry_logger
+)
+from tool_tracing_example import SpanTracer, load_spans, attribute_latency, heatmap_data  # noqa: E402
+
+SCHEMA = {"type": "object", "required": ["query"],
+          "properties": {"query": {"type": "string", "description": "Query text"},
+                         "limit": {"type": "integer", "description": "Maximum results",
+                                   "minimum": 1, "maximum": 100}}}
+
+
+def record_workload(span_path: str, requests: int, io_ms: float, cpu_iterations: int,
+                    io_fraction: float, seed: int) -> None:
+    """Run traced requests against a registry with an IO-bound and a CPU-bound tool."""
+    def io_tool(query: str, limit: int = 10) -> dict:
+        time.sleep(io_ms / 1000)
+        return {"query": query, "results": limit}
+
+    def cpu_tool(query: str, limit: int = 10) -> dict:
+        total = 0
+        for i in range(cpu_iterations):
+            total = (total + i * len(query)) % 1000003
+        return {"query": query, "checksum": total}
+
+    registry = ToolRegistry()
+    io_id = registry.register_tool("search_index", "Query a remote index", SCHEMA, io_tool,
+                                   ToolCategory.EXTERNAL_SERVICE, ToolPermissionLevel.SAFE)
+    cpu_id = registry.register_tool("rank_results", "Rank results locally", SCHEMA, cpu_tool,
+                                    ToolCategory.CODE_ANALYSIS, ToolPermissionLevel.SAFE)
+
+    chooser = random.Random(seed)
+    with SpanTracer(span_path) as tracer:
+        registry.set_tracer(tracer)
+        for i in range(requests):
+            tool_id = io_id if chooser.random() < io_fraction else cpu_id
+            with tracer.span("request"):
+                registry.invoke_tool(tool_id, {"query": f"request {i}", "limit": 5}, validate=True,
+                                     permission_level=ToolPermissionLevel.SAFE)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--spans", help="Analyze this span file instead of recording a workload")
+    parser.add_argument("--requests", type=int, default=2000, help="Requests in the synthetic workload")
+    parser.add_argument("--io-ms", type=float, default=2.0, help="Service time of the IO-bound tool")
+    parser.add_argument("--cpu-iterations", type=int, default=20000, help="Loop iterations per CPU-bound call")
+    parser.add_argument("--io-fraction", type=float, default=0.5, help="Share of IO-bound requests")
+    parser.add_argument("--seed", type=int, default=1, help="Random seed for the request mix")
+    parser.add_argument("--output", help="Write the attribution (milliseconds) as JSON to this file")
+    parser.add_argument("--heatmap-output", help="Write heatmap data (percent of traced time) to this file")
+    args = parser.parse_args()
+
+    registry_logger.setLevel("WARNING")
+    if args.spans:
+        spans = load_spans(args.spans)
+    else:
+        with tempfile.TemporaryDirectory() as directory:
+            span_path = os.path.join(directory, "spans.jsonl")
+            record_workload(span_path, args.requests, args.io_ms, args.cpu_iterations,
+                            args.io_fraction, args.seed)
+            spans = load_spans(span_path)
+
+    attribution = attribute_latency(spans)
+    components = attribution["components"]
+    print(f"{len(spans)} spans, {attribution['traced_ms']:.1f}ms traced")
+    print(f"{'calling component':22} " + " ".join(f"{c[:12]:>12}" for c in components))
+    for component, row in zip(components, attribution["matrix_ms"]):
+        print(f"{component:22} " + " ".join(f"{value:12.2f}" for value in row))
+    print("(ms of self time in the column component, called from the row component)")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(attribution, f, indent=2)
+    if args.heatmap_output:
+        with open(args.heatmap_output, "w") as f:
+            json.dump(heatmap_data(attribution), f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+"""
+Dispatch Load Benchmark
+
+This script drives ToolRegistry.invoke_tool from tool_registry_example.py with
+synthetic IO-bound and CPU-bound tools and measures throughput, latency
+percentiles, CPU usage and resident memory at each concurrency level. Its JSON
+output can regenerate the tables in
+resources/benchmarks/chapter4/concurrent_execution_benchmarks.md.
+
+Two load models are supported:
+- closed loop: N workers each issue a call as soon as their previous call returns
+- open loop: calls arrive at a fixed rate and are dispatched to N workers;
+  latency is measured from the scheduled arrival, so queueing delay is included
+"""
+
+import argparse
+import json
+import os
+import random
+import resource
+import socket
+import socketserver
+import statistics
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# Make the Tool Registry example importable
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(script_dir, '..', '..', 'code_examples'))
+
+from tool_registry_example import (  # noqa: E402
+    ToolRegistry, ToolCategory, ToolPermissionLevel, logger as registry_logger
+)
+
+DEFAULT_CONCURRENCY = [1, 2, 4, 8, 16, 32, 64, 128, 256]
+_EMPTY_SCHEMA = {"type": "object", "properties": {}}
+
+
+class _StubServiceHandler(socketserver.StreamRequestHandler):
+    """Replies to each request line after the configured service delay."""
+
+    def handle(self) -> None:
+        for line in self.rfile:
+            time.sleep(self.server.delay_s)  # type: ignore[attr-defined]
+            self.wfile.write(line)
+
+
+class StubService:
+    """Local TCP service standing in for a remote dependency of an IO-bound tool."""
+
+    def __init__(self, delay_ms: float):
+        self._server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), _StubServiceHandler)
+        self._server.daemon_threads = True
+        self._server.request_queue_size = 512
+        self._server.delay_s = delay_ms / 1000  # type: ignore[attr-defined]
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        self.address = self._server.server_address
+
+    def close(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+def make_io_tool(delay_ms: float, service: StubService = None):
+    """Build an IO-bound handler that sleeps, or makes a request to the stub service."""
+    if service is None:
+        def io_tool() -> dict:
+            time.sleep(delay_ms / 1000)
+            return {"ok": True}
+    else:
+        def io_tool() -> dict:
+            with socket.create_connection(service.address) as connection:
+                connection.sendall(b"ping\n")
+                connection.recv(16)
+            return {"ok": True}
+    return io_tool
+
+
+def make_cpu_tool(iterations: int):
+    """Build a CPU-bound handler running pure-Python arithmetic (holds the GIL)."""
+    def cpu_tool() -> dict:
+        total = 0
+        for i in range(iterations):
+            total = (total + i * i) % 1000003
+        return {"checksum": total}
+    return cpu_tool
+
+
+def run_level(registry: ToolRegistry, tool_ids: list, weights: list, mode: str,
+              concurrency: int, duration_s: float, rate: float, seed: int) -> dict:
+    """Run one load level and summarize it."""
+    chooser = random.Random(seed)
+    latencies = []
+    errors = 0
+    lock = threading.Lock()
+
+    def call(tool_id: str, scheduled: float) -> None:
+        nonlocal errors
+        try:
+            registry.invoke_tool(tool_id)
+        except Exception:
+            with lock:
+                errors += 1
+            return
+        latency_ms = (time.perf_counter() - scheduled) * 1000
+        with lock:
+            latencies.append(latency_ms)
+
+    cpu_start = time.process_time()
+    start = time.perf_counter()
+    deadline = start + duration_s
+
+    if mode == "closed":
+        def worker(worker_seed: int) -> None:
+            worker_chooser = random.Random(worker_seed)
+            while time.perf_counter() < deadline:
+                call(worker_chooser.choices(tool_ids, weights)[0], time.perf_counter())
+
+        threads = [threading.Thread(target=worker, args=(seed + i,)) for i in range(concurrency)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    else:
+        interval = 1 / rate
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            arrival = start
+            while arrival < deadline:
+                delay = arrival - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                executor.submit(call, chooser.choices(tool_ids, weights)[0], arrival)
+                arrival += interval
+
+    elapsed_s = time.perf_counter() - start
+    cpu_s = time.process_time() - cpu_start
+    return summarize(latencies, errors, elapsed_s, cpu_s, mode, concurrency, rate)
+
+
+def summarize(latencies: list, errors: int, elapsed_s: float, cpu_s: float,
+              mode: str, concurrency: int, rate: float) -> dict:
+    """Compute the reported metrics for one level."""
+    ordered = sorted(latencies)
+
+    def percentile(p: float) -> float:
+        if not ordered:
+            return 0.0
+        return ordered[min(len(ordered) - 1, int(round(p / 100 * (len(ordered) - 1))))]
+
+    return {
+        "mode": mode,
+        "concurrency": concurrency,
+        "offered_rate": rate if mode == "open" else None,
+        "completed": len(ordered),
+        "errors": errors,
+        "elapsed_s": elapsed_s,
+        "throughput_ops": len(ordered) / elapsed_s,
+        "latency_ms": {
+            "mean": statistics.fmean(ordered) if ordered else 0.0,
+            "p50": percentile(50),
+            "p95": percentile(95),
+            "p99": percentile(99),
+            "max": ordered[-1] if ordered else 0.0,
+            "stdev": statistics.pstdev(ordered) if len(ordered) > 1 else 0.0,
+        },
+        "cpu_percent": cpu_s / elapsed_s * 100,
+        "rss_mb": current_rss_mb(),
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def current_rss_mb() -> float:
+    """Current resident set size (falls back to the peak where /proc is unavailable)."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2 ** 20
+    except (OSError, ValueError):
+        return peak_rss_mb()
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 2 ** 20 if sys.platform == "darwin" else peak / 1024
+
+
+def markdown_tables(results: dict) -> str:
+    """Render the chapter 4 table layouts from benchmark results."""
+    lines = []
+    # Section 1: throughput of every workload side by side
+    for mode in results["modes"]:
+        throughput = {(run["workload"], run["concurrency"]): run["throughput_ops"]
+                      for run in results["runs"] if run["mode"] == mode}
+        if not throughput:
+            continue
+        workloads = [workload for workload in results["workloads"]
+                     if any(key[0] == workload for key in throughput)]
+        levels = sorted({concurrency for _, concurrency in throughput})
+        lines += [f"### Throughput, {mode} loop", "",
+                  "| Concurrency Level | " + " | ".join(f"{workload} tools (ops/sec)" for workload in workloads) + " |",
+                  "|------------------|" + "|".join("-" * 22 for _ in workloads) + "|"]
+        for concurrency in levels:
+            cells = [f"{throughput[(workload, concurrency)]:.1f}" if (workload, concurrency) in throughput else "-"
+                     for workload in workloads]
+            lines.append(f"| {concurrency} | " + " | ".join(cells) + " |")
+        lines.append("")
+    for workload in results["workloads"]:
+        for mode in results["modes"]:
+            runs = [run for run in results["runs"] if run["workload"] == workload and run["mode"] == mode]
+            if not runs:
+                continue
+            lines += [f"### {workload} tools, {mode} loop", "",
+                      "| Concurrency Level | Average Latency (ms) | CPU Usage (%) | Memory Usage (MB) "
+                      "| Throughput (ops/sec) |",
+                      "|------------------|---------------------|--------------|------------------"
+                      "|---------------------|"]
+            for run in runs:
+                lines.append(f"| {run['concurrency']} | {run['latency_ms']['mean']:.1f} | "
+                             f"{run['cpu_percent']:.1f} | {run['rss_mb']:.0f} | {run['throughput_ops']:.1f} |")
+            lines += ["", "| Concurrency Level | Avg Latency (ms) | 50th Percentile (ms) | 95th Percentile (ms) "
+                          "| 99th Percentile (ms) | Std Deviation |",
+                      "|------------------|------------------|--------------------|---------------------"
+                      "|---------------------|---------------|"]
+            for run in runs:
+                latency = run["latency_ms"]
+                lines.append(f"| {run['concurrency']} | {latency['mean']:.1f} | {latency['p50']:.1f} | "
+                             f"{latency['p95']:.1f} | {latency['p99']:.1f} | {latency['stdev']:.1f} |")
+            lines.append("")
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--workload", nargs="+", choices=["io", "cpu", "mixed"], default=["io", "cpu"],
+                        help="Tool workloads to run")
+    parser.add_argument("--mode", nargs="+", choices=["closed", "open"], default=["closed", "open"],
+                        help="Load models to run")
+    parser.add_argument("--concurrency", type=lambda value: [int(v) for v in value.split(",")],
+                        default=DEFAULT_CONCURRENCY, help="Comma-separated worker counts (default 1..256)")
+    parser.add_argument("--duration", type=float, default=2.0, help="Seconds per concurrency level")
+    parser.add_argument("--rate", type=float, default=200.0, help="Arrival rate (calls/s) for open loop")
+    parser.add_argument("--io-ms", type=float, default=50.0, help="Service time of the IO-bound tool")
+    parser.add_argument("--io-backend", choices=["sleep", "socket"], default="sleep",
+                        help="Simulate IO with time.sleep or a request to a local stub service")
+    parser.add_argument("--cpu-iterations", type=int, default=20000, help="Loop iterations per CPU-bound call")
+    parser.add_argument("--io-fraction", type=float, default=0.8, help="Share of IO-bound calls in the mixed workload")
+    parser.add_argument("--seed", type=int, default=1, help="Random seed for tool selection")
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    parser.add_argument("--markdown", action="store_true", help="Print results as chapter 4 markdown tables")
+    args = parser.parse_args()
+
+    registry_logger.setLevel("WARNING")
+    service = StubService(args.io_ms) if args.io_backend == "socket" else None
+    registry = ToolRegistry()
+    io_id = registry.register_tool("io_tool", "Synthetic IO-bound tool", _EMPTY_SCHEMA,
+                                   make_io_tool(args.io_ms, service), ToolCategory.UTILITY, ToolPermissionLevel.SAFE)
+    cpu_id = registry.register_tool("cpu_tool", "Synthetic CPU-bound tool", _EMPTY_SCHEMA,
+                                    make_cpu_tool(args.cpu_iterations), ToolCategory.UTILITY, ToolPermissionLevel.SAFE)
+    workloads = {
+        "io": ([io_id], [1.0]),
+        "cpu": ([cpu_id], [1.0]),
+        "mixed": ([io_id, cpu_id], [args.io_fraction, 1 - args.io_fraction]),
+    }
+
+    results = {
+        "python": sys.version.split()[0],
+        "cpu_count": os.cpu_count(),
+        "workloads": args.workload,
+        "modes": args.mode,
+        "parameters": {"duration_s": args.duration, "rate": args.rate, "io_ms": args.io_ms,
+                       "io_backend": args.io_backend, "cpu_iterations": args.cpu_iterations,
+                       "io_fraction": args.io_fraction},
+        "runs": [],
+    }
+    try:
+        for workload in args.workload:
+            tool_ids, weights = workloads[workload]
+            for mode in args.mode:
+                for concurrency in args.concurrency:
+                    run = run_level(registry, tool_ids, weights, mode, concurrency,
+                                    args.duration, args.rate, args.seed)
+                    run["workload"] = workload
+                    results["runs"].append(run)
+                    if not args.markdown:
+                        latency = run["latency_ms"]
+                        print(f"{workload:5} {mode:6} c={concurrency:<4} {run['throughput_ops']:8.1f} ops/s  "
+                              f"p50 {latency['p50']:7.1f}ms  p99 {latency['p99']:7.1f}ms  "
+                              f"cpu {run['cpu_percent']:5.1f}%  rss {run['rss_mb']:.0f}MB")
+    finally:
+        if service is not None:
+            service.close()
+
+    if args.markdown:
+        print(markdown_tables(results))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
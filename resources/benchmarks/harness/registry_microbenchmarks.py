@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+"""
+Registry Micro-Benchmarks
+
+This script times the core ToolRegistry operations from tool_registry_example.py
+(register_tool, get_tool, list_tools with each filter, search_tools,
+update_tool_metadata, record_tool_usage and the paginated/authorization paths)
+at several catalog sizes, and measures the memory each operation allocates.
+
+Results are written as JSON. Two result files can be compared to flag
+regressions. Every timed round is normalized by a fixed reference workload
+measured right before it, and the gate tolerates the round-to-round spread of
+each operation, so two runs of an unchanged tree pass:
+
+    python registry_microbenchmarks.py --output before.json
+    # ... change the registry ...
+    python registry_microbenchmarks.py --output after.json
+    python registry_microbenchmarks.py --compare before.json after.json
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+
+# Make the Tool Registry example importable
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(script_dir, '..', '..', 'code_examples'))
+
+from tool_registry_example import (  # noqa: E402
+    ToolRegistry, ToolCategory, ToolPermissionLevel, logger as registry_logger
+)
+
+DEFAULT_SIZES = [100, 10000, 100000]
+# Peak allocations vary by a few dozen bytes between runs (e.g. timestamp strings)
+ALLOC_SLACK_BYTES = 64
+CATEGORIES = list(ToolCategory)
+LEVELS = list(ToolPermissionLevel)
+SCHEMA = {"type": "object", "required": ["query"],
+          "properties": {"query": {"type": "string", "description": "Query text"}}}
+
+
+def noop_handler(**parameters) -> dict:
+    """Handler used for every benchmark tool."""
+    return parameters
+
+
+def register_tools(registry: ToolRegistry, count: int, offset: int = 0) -> list:
+    """Register count tools with a spread of categories and permission levels."""
+    return [registry.register_tool(
+        name=f"tool_{i}",
+        description=f"Benchmark tool {i} for {CATEGORIES[i % len(CATEGORIES)].value} tasks",
+        schema=SCHEMA,
+        handler_func=noop_handler,
+        category=CATEGORIES[i % len(CATEGORIES)],
+        permission_level=LEVELS[i % len(LEVELS)]) for i in range(offset, offset + count)]
+
+
+# Fixed pure-Python work timed next to every round, so results can be
+# normalized for the machine's speed at that moment (frequency scaling,
+# noisy neighbours) which otherwise dominates run-to-run differences
+REFERENCE_RECORD = {f"field_{i}": i for i in range(16)}
+REFERENCE_CALLS = 5000
+
+
+def reference_operation(i: int) -> int:
+    """Reference work: copy a small record and sort its values."""
+    record = dict(REFERENCE_RECORD, index=i)
+    return sorted(record.values())[-1]
+
+
+def time_reference() -> float:
+    """Per-call seconds of the reference work, measured now."""
+    start = time.perf_counter()
+    for i in range(REFERENCE_CALLS):
+        reference_operation(i)
+    return (time.perf_counter() - start) / REFERENCE_CALLS
+
+
+def time_operation(operation, min_time_s: float, rounds: int) -> dict:
+    """
+    Time an operation (called with the call index) in calibrated batches.
+
+    Returns the median and best per-call time and every round's per-call time.
+    """
+    batch = 1
+    while True:
+        start = time.perf_counter()
+        for i in range(batch):
+            operation(i)
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time_s / rounds or batch >= 1 << 20:
+            break
+        batch *= 2
+
+    per_call = []
+    references = []
+    for round_index in range(rounds):
+        base = (round_index + 1) * batch
+        references.append(time_reference())
+        start = time.perf_counter()
+        for i in range(batch):
+            operation(base + i)
+        per_call.append((time.perf_counter() - start) / batch)
+    return round_statistics(per_call, references, batch)
+
+
+def round_statistics(per_call: list, references: list, calls_per_round: int) -> dict:
+    """
+    Summarize per-call times (seconds) measured in several rounds.
+
+    relative_rounds holds each round's time in units of the reference work
+    timed just before it.
+    """
+    relative = [value / reference for value, reference in zip(per_call, references)]
+    return {"ns_per_op": statistics.median(per_call) * 1e9,
+            "ns_per_op_min": min(per_call) * 1e9,
+            "ns_per_op_rounds": [value * 1e9 for value in per_call],
+            "relative": statistics.median(relative),
+            "relative_rounds": relative,
+            "calls_per_round": calls_per_round}
+
+
+def measure_allocations(operation, calls: int) -> dict:
+    """Measure the memory one call allocates at peak and the memory retained per call."""
+    operation(0)  # warm caches so they are not charged to the measured calls
+    tracemalloc.start()
+    try:
+        peaks = []
+        for i in range(min(calls, 25)):
+            tracemalloc.reset_peak()
+            base, _ = tracemalloc.get_traced_memory()
+            operation(i + 1)
+            peaks.append(tracemalloc.get_traced_memory()[1] - base)
+        before, _ = tracemalloc.get_traced_memory()
+        for i in range(calls):
+            operation(i)
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {"peak_bytes_per_op": statistics.median(peaks),
+            "retained_bytes_per_op": max(0, after - before) / calls}
+
+
+def benchmark_size(size: int, min_time_s: float, rounds: int, seed: int) -> dict:
+    """Run every operation against a registry holding size tools."""
+    chooser = random.Random(seed)
+    results = {}
+
+    # Registration is measured while building the catalog itself, one round per slice
+    registry = ToolRegistry()
+    tool_ids = []
+    per_call = []
+    references = []
+    slice_size = max(1, size // rounds)
+    while len(tool_ids) < size:
+        count = min(slice_size, size - len(tool_ids))
+        references.append(time_reference())
+        start = time.perf_counter()
+        tool_ids += register_tools(registry, count, offset=len(tool_ids))
+        per_call.append((time.perf_counter() - start) / count)
+    probe = ToolRegistry()
+    register_tools(probe, 1)
+    results["register_tool"] = round_statistics(per_call, references, slice_size)
+    results["register_tool"].update(measure_allocations(
+        lambda i: register_tools(probe, 1, offset=1 + i), min(size, 200)))
+
+    # Disable a slice so the enabled_only filter has something to skip
+    for tool_id in tool_ids[::10]:
+        registry.disable_tool(tool_id)
+
+    sample = [chooser.choice(tool_ids) for _ in range(1024)]
+    first_page = registry.list_tools_page(limit=50)
+    search_query = "tool_1" + "0" * max(0, len(str(size)) - 3)
+
+    operations = {
+        "get_tool": lambda i: registry.get_tool(sample[i & 1023]),
+        "list_tools": lambda i: registry.list_tools(),
+        "list_tools[category]": lambda i: registry.list_tools(category=ToolCategory.UTILITY),
+        "list_tools[permission_level]": lambda i: registry.list_tools(permission_level=ToolPermissionLevel.SAFE),
+        "list_tools[enabled_only=False]": lambda i: registry.list_tools(enabled_only=False),
+        "list_tools[category+permission_level]": lambda i: registry.list_tools(
+            category=ToolCategory.UTILITY, permission_level=ToolPermissionLevel.SAFE),
+        "list_tools_page[limit=50]": lambda i: registry.list_tools_page(limit=50, cursor=first_page["next_cursor"]),
+        "search_tools": lambda i: registry.search_tools(search_query),
+        "is_tool_allowed": lambda i: registry.is_tool_allowed(sample[i & 1023], ToolPermissionLevel.SAFE),
+        "record_tool_usage": lambda i: registry.record_tool_usage(sample[i & 1023], 1.5),
+        "update_tool_metadata": lambda i: registry.update_tool_metadata(
+            sample[i & 1023], {"description": f"Updated description {i}"}),
+    }
+    for name, operation in operations.items():
+        result = time_operation(operation, min_time_s, rounds)
+        result.update(measure_allocations(operation, min(result["calls_per_round"], 200)))
+        results[name] = result
+    return results
+
+
+def relative_spread(result: dict) -> float:
+    """
+    Spread of an operation's normalized rounds relative to their median.
+
+    With five or more rounds the best and worst are dropped, so a single
+    outlier (e.g. a garbage collection) does not widen the tolerance.
+    """
+    rounds = sorted(result["relative_rounds"])
+    if len(rounds) >= 5:
+        rounds = rounds[1:-1]
+    return (rounds[-1] - rounds[0]) / statistics.median(rounds)
+
+
+def compare(baseline_path: str, current_path: str, threshold: float) -> int:
+    """
+    Print per-operation ratios between two result files.
+
+    Time ratios compare the medians of the timed rounds, each normalized by
+    the reference work timed next to it, so a machine that is slower overall
+    during one run does not show up as a regression. An operation is flagged
+    only if it slows down by more than the threshold plus the round-to-round
+    spread observed in either run, so operations too noisy to measure on this
+    machine widen their own tolerance instead of failing. Allocation growth
+    is flagged beyond the threshold and ALLOC_SLACK_BYTES.
+    Returns the number of operations flagged as regressions.
+    """
+    with open(baseline_path) as f:
+        baseline = json.load(f)
+    with open(current_path) as f:
+        current = json.load(f)
+
+    regressions = 0
+    print(f"{'size':>7}  {'operation':40} {'time ratio':>10} {'tolerance':>10} {'peak alloc ratio':>16}")
+    for size, operations in current["results"].items():
+        for name, result in operations.items():
+            before = baseline["results"].get(size, {}).get(name)
+            if before is None:
+                print(f"{size:>7}  {name:40} {'new':>10}")
+                continue
+            time_ratio = result["relative"] / before["relative"]
+            tolerance = threshold + max(relative_spread(before), relative_spread(result))
+            alloc_ratio = (result["peak_bytes_per_op"] + 1) / (before["peak_bytes_per_op"] + 1)
+            flags = []
+            if time_ratio > 1 + tolerance:
+                flags.append("TIME REGRESSION")
+            alloc_growth = result["peak_bytes_per_op"] - before["peak_bytes_per_op"]
+            if alloc_ratio > 1 + threshold and alloc_growth > ALLOC_SLACK_BYTES:
+                flags.append("ALLOC REGRESSION")
+            regressions += bool(flags)
+            print(f"{size:>7}  {name:40} {time_ratio:10.2f} {1 + tolerance:10.2f} {alloc_ratio:16.2f}  "
+                  f"{' '.join(flags)}")
+    print(f"{regressions} regression(s) beyond {threshold:.0%} plus measurement spread")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=lambda value: [int(v) for v in value.split(",")],
+                        default=DEFAULT_SIZES, help="Comma-separated catalog sizes (default 100,10000,100000)")
+    parser.add_argument("--min-time", type=float, default=0.5, help="Approximate seconds spent timing each operation")
+    parser.add_argument("--rounds", type=int, default=7, help="Timed rounds per operation")
+    parser.add_argument("--seed", type=int, default=1, help="Random seed for sampled tool IDs")
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    parser.add_argument("--compare", nargs=2, metavar=("BASELINE", "CURRENT"),
+                        help="Compare two result files instead of running the benchmarks")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="Relative slowdown (beyond the measured spread) or allocation growth "
+                             "flagged as a regression")
+    args = parser.parse_args()
+
+    if args.compare:
+        sys.exit(1 if compare(args.compare[0], args.compare[1], args.threshold) else 0)
+
+    registry_logger.setLevel("WARNING")
+    results = {"python": sys.version.split()[0], "sizes": args.sizes, "results": {}}
+    for size in args.sizes:
+        results["results"][str(size)] = benchmark_size(size, args.min_time, args.rounds, args.seed)
+        for name, result in results["results"][str(size)].items():
+            print(f"{size:>7}  {name:40} {result['ns_per_op'] / 1000:12.2f} us/op  "
+                  f"{result['peak_bytes_per_op']:10.0f} B peak  {result['retained_bytes_per_op']:9.0f} B retained")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
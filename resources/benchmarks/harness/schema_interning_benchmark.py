@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Schema Interning Benchmark
+
+This script measures what the content-addressed schema store in
+tool_registry_example.py saves on a catalog with heavy schema reuse, compared
+with storing a private copy of every schema and example block per tool and
+validating with jsonschema.validate on every call (the registry's previous
+behavior).
+
+It reports the memory held by stored schemas and examples, registration
+(meta-schema validation) time and per-call parameter validation time.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+import jsonschema
+
+# Make the Tool Registry example importable
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(script_dir, '..', '..', 'code_examples'))
+
+from tool_registry_example import (  # noqa: E402
+    ToolRegistry, ToolSchemaValidator, ToolCategory, ToolPermissionLevel, logger as registry_logger
+)
+
+
+def make_schema(variant: int) -> dict:
+    """Build one of the distinct parameter schemas shared across the catalog."""
+    properties = {
+        "query": {"type": "string", "description": "The search query", "minLength": 1},
+        "file_types": {"type": "array", "description": "File extensions to search"},
+        "max_results": {"type": "integer", "description": "Maximum number of results",
+                        "default": 10, "minimum": 1, "maximum": 100},
+        "path": {"type": "string", "description": "Root directory for the operation"},
+    }
+    properties[f"option_{variant}"] = {"type": "string", "description": f"Variant option {variant}",
+                                       "enum": [f"mode_{i}" for i in range(8)]}
+    return {"type": "object", "required": ["query"], "properties": properties}
+
+
+def make_examples(variant: int) -> list:
+    """Build the example block that accompanies a schema variant."""
+    return [{"description": f"Example {i} for variant {variant}",
+             "parameters": {"query": f"def handler_{i}", "max_results": 5}} for i in range(3)]
+
+
+def load_tool_definition(variant: int) -> tuple:
+    """Simulate loading a tool definition from configuration (a fresh object per tool)."""
+    return json.loads(json.dumps(make_schema(variant))), json.loads(json.dumps(make_examples(variant)))
+
+
+def run_baseline(tools: int, distinct: int, calls: int) -> dict:
+    """Per-record copies, per-registration meta-validation, per-call jsonschema.validate."""
+    validator = ToolSchemaValidator()
+    meta_schema = validator.tool_meta_schema
+
+    start = time.perf_counter()
+    records = []
+    for i in range(tools):
+        schema, examples = load_tool_definition(i % distinct)
+        jsonschema.validate(schema, meta_schema)
+        records.append({"schema": schema, "examples": examples})
+    register_s = time.perf_counter() - start
+    retained = sum(_deep_size(record["schema"]) + _deep_size(record["examples"]) for record in records)
+
+    parameters = {"query": "def example", "max_results": 5}
+    start = time.perf_counter()
+    for i in range(calls):
+        jsonschema.validate(parameters, records[i % tools]["schema"])
+    validate_s = time.perf_counter() - start
+
+    return {"retained_bytes": retained, "register_s": register_s, "validate_s": validate_s}
+
+
+def run_interned(tools: int, distinct: int, calls: int) -> dict:
+    """Registry with the content-addressed schema store."""
+    registry = ToolRegistry()
+
+    start = time.perf_counter()
+    tool_ids = []
+    for i in range(tools):
+        schema, examples = load_tool_definition(i % distinct)
+        tool_ids.append(registry.register_tool(
+            name=f"tool_{i}", description="Benchmark tool", schema=schema, handler_func=print,
+            category=ToolCategory.UTILITY, permission_level=ToolPermissionLevel.SAFE,
+            examples=examples))
+    register_s = time.perf_counter() - start
+
+    # Shared store entries plus the two content hashes each record now carries
+    shared = {}
+    for tool_id in tool_ids:
+        tool = registry.get_tool(tool_id)
+        shared[tool["schema_hash"]] = tool["schema"]
+        shared[tool["examples_hash"]] = tool["examples"]
+    hash_bytes = sys.getsizeof(next(iter(shared))) * 2 * tools
+    retained = sum(_deep_size(value) for value in shared.values()) + hash_bytes
+
+    parameters = {"query": "def example", "max_results": 5}
+    start = time.perf_counter()
+    for i in range(calls):
+        registry.validate_parameters(tool_ids[i % tools], parameters)
+    validate_s = time.perf_counter() - start
+
+    return {"retained_bytes": retained, "register_s": register_s, "validate_s": validate_s,
+            "store": registry.get_schema_store_stats()}
+
+
+def _deep_size(value) -> int:
+    """Approximate the memory held by a JSON-like value."""
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(_deep_size(k) + _deep_size(v) for k, v in value.items())
+    elif isinstance(value, (list, tuple)):
+        size += sum(_deep_size(item) for item in value)
+    return size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--tools", type=int, default=1000, help="Number of registered tools")
+    parser.add_argument("--distinct", type=int, default=25, help="Number of distinct schemas")
+    parser.add_argument("--calls", type=int, default=1000, help="Parameter validations to time")
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    args = parser.parse_args()
+
+    registry_logger.setLevel("WARNING")
+    baseline = run_baseline(args.tools, args.distinct, args.calls)
+    interned = run_interned(args.tools, args.distinct, args.calls)
+    results = {
+        "tools": args.tools,
+        "distinct_schemas": args.distinct,
+        "validation_calls": args.calls,
+        "baseline": baseline,
+        "interned": interned,
+        "memory_saving": 1 - interned["retained_bytes"] / baseline["retained_bytes"],
+        "registration_speedup": baseline["register_s"] / interned["register_s"],
+        "validation_speedup": baseline["validate_s"] / interned["validate_s"],
+    }
+
+    print(f"{args.tools} tools sharing {args.distinct} schemas")
+    print(f"Schema/example memory: {baseline['retained_bytes'] / 1024:.0f} KiB -> "
+          f"{interned['retained_bytes'] / 1024:.0f} KiB ({results['memory_saving']:.1%} saved)")
+    print(f"Registration: {baseline['register_s'] * 1000:.0f} ms -> "
+          f"{interned['register_s'] * 1000:.0f} ms ({results['registration_speedup']:.1f}x)")
+    print(f"Parameter validation: {baseline['validate_s'] / args.calls * 1e6:.1f} us -> "
+          f"{interned['validate_s'] / args.calls * 1e6:.1f} us per call "
+          f"({results['validation_speedup']:.1f}x)")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Registry Import and Cold-Start Benchmark
+
+This script measures what a short-lived CLI or worker pays before its first
+tool call. Every measurement runs in a fresh interpreter:
+1. An import-time breakdown of tool_registry_example from python -X importtime
+   (self and cumulative time of each top-level import)
+2. Wall-clock cold start, from process launch to the first completed dispatch,
+   for three startup paths: importing only, registering the catalog (schema
+   validation) and loading it with ToolRegistry.from_snapshot()
+
+Bytecode is cached in a temporary directory (PYTHONPYCACHEPREFIX) and warmed
+before timing, so results reflect a deployed install rather than compilation.
+Pass an earlier --output file as --baseline to print the change per metric:
+
+    python startup_benchmark.py --output before.json
+    # ... change the registry ...
+    python startup_benchmark.py --baseline before.json
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+code_examples_dir = os.path.abspath(os.path.join(script_dir, '..', '..', 'code_examples'))
+
+MODULE = "tool_registry_example"
+
+# Handler module imported by the benchmark processes
+HANDLER_MODULE = '''
+def lookup(query, limit=10):
+    return {"query": query, "results": limit}
+'''
+
+SETUP = f'''
+import sys
+sys.path[:0] = [{code_examples_dir!r}, {{work_dir!r}}]
+'''
+
+SCENARIOS = {
+    "import": '''
+import tool_registry_example
+''',
+    "register_and_invoke": '''
+import json
+from tool_registry_example import ToolRegistry, ToolCategory, ToolPermissionLevel
+from startup_tools import lookup
+registry = ToolRegistry()
+with open({catalog_path!r}) as f:
+    catalog = json.load(f)
+for record in catalog:
+    registry.register_tool(record["name"], record["description"], record["schema"], lookup,
+                           ToolCategory(record["category"]), ToolPermissionLevel(record["permission_level"]))
+registry.invoke_tool(registry.list_tools()[0]["id"], {{"query": "cold start"}})
+''',
+    "snapshot_invoke": '''
+from tool_registry_example import ToolRegistry
+registry = ToolRegistry.from_snapshot({snapshot_path!r})
+registry.invoke_tool(registry.list_tools()[0]["id"], {{"query": "cold start"}})
+''',
+}
+
+
+def catalog_records(tools: int) -> list:
+    """Tool definitions with distinct schemas, so each one is meta-validated."""
+    return [{
+        "name": f"lookup_{i}",
+        "description": f"Look up records in index {i}",
+        "schema": {"type": "object", "required": ["query"],
+                   "properties": {"query": {"type": "string", "description": f"Query for index {i}"},
+                                  "limit": {"type": "integer", "description": "Maximum results",
+                                            "minimum": 1, "maximum": 100}}},
+        "category": "research",
+        "permission_level": 0,
+    } for i in range(tools)]
+
+
+def run_python(arguments: list, env: dict) -> tuple:
+    """Run an interpreter; returns (elapsed seconds, stderr)."""
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable] + arguments, env=env, capture_output=True, text=True)
+    elapsed = time.perf_counter() - start
+    if result.returncode != 0:
+        raise RuntimeError(f"Benchmark process failed:\n{result.stderr}")
+    return elapsed, result.stderr
+
+
+def import_breakdown(env: dict, setup: str) -> dict:
+    """Parse -X importtime output into the module's own and per-import times (microseconds)."""
+    _, stderr = run_python(["-X", "importtime", "-c", setup + f"import {MODULE}"], env)
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append((name.rstrip(), int(self_us), int(cumulative_us)))
+
+    # Imports nested directly under the module are indented one level deeper than it
+    module_index = next(i for i, row in enumerate(rows) if row[0].strip() == MODULE)
+    module_depth = len(rows[module_index][0]) - len(MODULE)
+    children = {}
+    for name, self_us, cumulative_us in reversed(rows[:module_index]):
+        depth = len(name) - len(name.lstrip())
+        if depth <= module_depth:
+            break
+        if depth == module_depth + 2:
+            children[name.strip()] = cumulative_us
+    return {
+        "total_us": rows[module_index][2],
+        "self_us": rows[module_index][1],
+        "imports_us": dict(sorted(children.items(), key=lambda item: -item[1])),
+        "loads_jsonschema": any(row[0].strip() == "jsonschema" for row in rows),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--tools", type=int, default=200, help="Catalog size for the startup scenarios")
+    parser.add_argument("--runs", type=int, default=15, help="Timed processes per scenario")
+    parser.add_argument("--top", type=int, default=10, help="Imports shown in the breakdown")
+    parser.add_argument("--baseline", help="Earlier --output file to compare against")
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        env = dict(os.environ, PYTHONPYCACHEPREFIX=os.path.join(work_dir, "pycache"))
+        env.pop("PYTHONDONTWRITEBYTECODE", None)
+        with open(os.path.join(work_dir, "startup_tools.py"), "w") as f:
+            f.write(HANDLER_MODULE)
+
+        # Build the catalog file and its snapshot in a separate process
+        paths = {"work_dir": work_dir,
+                 "catalog_path": os.path.join(work_dir, "catalog.json"),
+                 "snapshot_path": os.path.join(work_dir, "snapshot.json")}
+        with open(paths["catalog_path"], "w") as f:
+            json.dump(catalog_records(args.tools), f)
+        setup = SETUP.format(**paths)
+        run_python(["-c", setup + SCENARIOS["register_and_invoke"].format(**paths) +
+                    f"registry.save_snapshot({paths['snapshot_path']!r})\n"], env)
+
+        breakdown = import_breakdown(env, setup)
+        interpreter_s = [run_python(["-c", "pass"], env)[0] for _ in range(args.runs)]
+        results = {"tools": args.tools, "import_breakdown": breakdown,
+                   "interpreter_ms": statistics.median(interpreter_s) * 1000, "cold_start_ms": {}}
+        for name, body in SCENARIOS.items():
+            code = setup + body.format(**paths)
+            run_python(["-c", code], env)
+            timings = [run_python(["-c", code], env)[0] for _ in range(args.runs)]
+            results["cold_start_ms"][name] = {"median": statistics.median(timings) * 1000,
+                                              "min": min(timings) * 1000}
+
+    print(f"import {MODULE}: {breakdown['total_us'] / 1000:.1f}ms "
+          f"(module body {breakdown['self_us'] / 1000:.1f}ms, "
+          f"jsonschema {'loaded' if breakdown['loads_jsonschema'] else 'not loaded'})")
+    for name, cumulative_us in list(breakdown["imports_us"].items())[:args.top]:
+        print(f"  {name:24} {cumulative_us / 1000:8.1f}ms")
+    print(f"\nCold start to first dispatch ({args.tools} tools, median of {args.runs} processes; "
+          f"interpreter alone {results['interpreter_ms']:.1f}ms):")
+    for name, timing in results["cold_start_ms"].items():
+        print(f"  {name:24} {timing['median']:8.1f}ms")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        print("\nChange against baseline:")
+        metrics = [("import", baseline["import_breakdown"]["total_us"] / 1000, breakdown["total_us"] / 1000)]
+        metrics += [(name, baseline["cold_start_ms"][name]["median"], timing["median"])
+                    for name, timing in results["cold_start_ms"].items() if name in baseline["cold_start_ms"]]
+        for name, before, after in metrics:
+            print(f"  {name:24} {before:8.1f}ms -> {after:8.1f}ms ({(after - before) / before * 100:+.0f}%)")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
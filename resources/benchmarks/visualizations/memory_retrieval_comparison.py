@@ -4,71 +4,82 @@ Memory Retrieval Performance Comparison Visualization
 
 This script generates a bar chart comparing different memory retrieval methods
 based on data from Chapter 6 memory retrieval benchmarks.
+
+The chart data is read from data/memory_retrieval_comparison.json. Use
+render_all.py to regenerate every figure.
 """
 
-import matplotlib.pyplot as plt
-import numpy as np
+import json
 import os
 
-# Set up the output directory
+# Set up the data and output locations
 script_dir = os.path.dirname(os.path.abspath(__file__))
-output_dir = script_dir
-os.makedirs(output_dir, exist_ok=True)
-
-# Data from Chapter 6 Memory Retrieval Benchmarks
-retrieval_methods = [
-    'Exact Match',
-    'Vector Search (Cosine)',
-    'Vector Search (Dot)',
-    'Vector Search (Euclidean)',
-    'Hybrid (Vector + Tag)',
-    'Two-Stage Retrieval'
-]
-
-# Performance metrics (in milliseconds) for different database sizes
-# [10k items, 100k items, 1M items]
-latency_small = [4, 12, 18, 20, 25, 30]
-latency_medium = [8, 35, 40, 45, 50, 45]
-latency_large = [15, 85, 95, 100, 85, 65]
-
-# Set width of bars
-barWidth = 0.25
-positions1 = np.arange(len(retrieval_methods))
-positions2 = [x + barWidth for x in positions1]
-positions3 = [x + barWidth for x in positions2]
-
-# Create figure
-plt.figure(figsize=(12, 7))
-
-# Create bars
-plt.bar(positions1, latency_small, width=barWidth, label='10K Items', color='#3498db', edgecolor='grey')
-plt.bar(positions2, latency_medium, width=barWidth, label='100K Items', color='#f39c12', edgecolor='grey')
-plt.bar(positions3, latency_large, width=barWidth, label='1M Items', color='#e74c3c', edgecolor='grey')
-
-# Add x-axis labels
-plt.xlabel('Retrieval Method', fontweight='bold', fontsize=12)
-plt.ylabel('Average Latency (ms)', fontweight='bold', fontsize=12)
-plt.title('Memory Retrieval Performance by Method and Database Size', fontweight='bold', fontsize=14)
-
-# Adjust x-axis ticks
-plt.xticks([r + barWidth for r in range(len(retrieval_methods))], retrieval_methods, rotation=45, ha='right')
-
-# Add legends and grid
-plt.legend()
-plt.grid(True, linestyle='--', alpha=0.7)
-
-# Annotate the best performer
-min_index = np.argmin(latency_large)
-plt.annotate('Best for Large DBs',
-             xy=(positions3[min_index], latency_large[min_index]),
-             xytext=(positions3[min_index]-0.2, latency_large[min_index]+20),
-             arrowprops=dict(facecolor='black', shrink=0.05, width=1.5),
-             fontsize=10)
-
-# Tight layout and save
-plt.tight_layout()
-plt.savefig(os.path.join(output_dir, 'memory_retrieval_comparison.png'), dpi=300)
-print(f"Visualization saved to {os.path.join(output_dir, 'memory_retrieval_comparison.png')}")
-
-# Show plot if running interactively
-plt.show()
+DATA_FILE = os.path.join(script_dir, 'data', 'memory_retrieval_comparison.json')
+OUTPUT_FILE = 'memory_retrieval_comparison.png'
+
+# Bar colors, in database size order
+COLORS = ['#3498db', '#f39c12', '#e74c3c', '#2ecc71', '#9b59b6']
+
+
+def render(data, output_path, dpi=300):
+    """
+    Render the grouped bar chart.
+
+    Args:
+        data: Contents of memory_retrieval_comparison.json (retrieval_methods and
+            latency_ms per database size, smallest first)
+        output_path: PNG file to write
+        dpi: Output resolution
+    """
+    import matplotlib.pyplot as plt
+    import numpy as np
+
+    retrieval_methods = data['retrieval_methods']
+    latencies = data['latency_ms']
+
+    # Set width of bars
+    barWidth = min(0.25, 0.8 / len(latencies))
+    positions = np.arange(len(retrieval_methods))
+
+    # Create figure
+    fig = plt.figure(figsize=(12, 7))
+
+    # Create bars
+    for i, (label, values) in enumerate(latencies.items()):
+        plt.bar(positions + i * barWidth, values, width=barWidth, label=label,
+                color=COLORS[i % len(COLORS)], edgecolor='grey')
+
+    # Add x-axis labels
+    plt.xlabel('Retrieval Method', fontweight='bold', fontsize=12)
+    plt.ylabel('Average Latency (ms)', fontweight='bold', fontsize=12)
+    plt.title('Memory Retrieval Performance by Method and Database Size', fontweight='bold', fontsize=14)
+
+    # Adjust x-axis ticks
+    plt.xticks(positions + barWidth * (len(latencies) - 1) / 2, retrieval_methods, rotation=45, ha='right')
+
+    # Add legends and grid
+    plt.legend()
+    plt.grid(True, linestyle='--', alpha=0.7)
+
+    # Annotate the best performer on the largest database
+    latency_large = list(latencies.values())[-1]
+    largest_positions = positions + (len(latencies) - 1) * barWidth
+    min_index = int(np.argmin(latency_large))
+    plt.annotate('Best for Large DBs',
+                 xy=(largest_positions[min_index], latency_large[min_index]),
+                 xytext=(largest_positions[min_index] - 0.2, latency_large[min_index] + 20),
+                 arrowprops=dict(facecolor='black', shrink=0.05, width=1.5),
+                 fontsize=10)
+
+    # Tight layout and save
+    plt.tight_layout()
+    plt.savefig(output_path, dpi=dpi)
+    plt.close(fig)
+
+
+if __name__ == "__main__":
+    with open(DATA_FILE) as f:
+        chart_data = json.load(f)
+    output_path = os.path.join(script_dir, OUTPUT_FILE)
+    render(chart_data, output_path)
+    print(f"Visualization saved to {output_path}")
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Render All Visualizations
+
+This script regenerates every benchmark figure in this directory. Each figure
+script exposes render(data, output_path, dpi) and names its data file
+(DATA_FILE) and image (OUTPUT_FILE). This entry point:
+1. Forces the non-interactive Agg backend, so it never blocks on a display
+2. Renders figures in parallel worker processes
+3. Skips figures whose script, data file and resolution are unchanged since the
+   last render (tracked in .render_cache.json next to the images)
+
+Usage:
+    python render_all.py                      # render what changed
+    python render_all.py --force --dpi 150    # re-render everything at draft resolution
+    python render_all.py --data component_performance_heatmap=matrix.json component_performance_heatmap
+"""
+
+import argparse
+import hashlib
+import importlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# Worker processes inherit the backend choice before matplotlib is imported
+os.environ["MPLBACKEND"] = "Agg"
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, script_dir)
+
+FIGURES = [
+    "architecture_scaling_visualization",
+    "benchmark_navigation_diagram",
+    "component_performance_heatmap",
+    "memory_retrieval_comparison",
+    "readability_levels_diagram",
+]
+CACHE_FILE = ".render_cache.json"
+
+
+def figure_hash(module_name: str, data_path: str, dpi: int) -> str:
+    """Hash a figure's script, input data and resolution."""
+    digest = hashlib.sha256()
+    for path in (os.path.join(script_dir, f"{module_name}.py"), data_path):
+        with open(path, "rb") as f:
+            digest.update(f.read())
+        digest.update(b"\0")
+    digest.update(str(dpi).encode("ascii"))
+    return digest.hexdigest()
+
+
+def render_figure(module_name: str, data_path: str, output_path: str, dpi: int) -> float:
+    """Render one figure in a worker process; returns the render time in seconds."""
+    import matplotlib
+    matplotlib.use("Agg", force=True)
+
+    start = time.perf_counter()
+    module = importlib.import_module(module_name)
+    with open(data_path) as f:
+        data = json.load(f)
+    module.render(data, output_path, dpi=dpi)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("figures", nargs="*", help="Figure scripts to render (default: all)")
+    parser.add_argument("--output-dir", default=script_dir, help="Directory for the rendered images")
+    parser.add_argument("--dpi", type=int, default=300, help="Output resolution")
+    parser.add_argument("--jobs", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--force", action="store_true", help="Render even if nothing changed")
+    parser.add_argument("--data", action="append", default=[], metavar="FIGURE=PATH",
+                        help="Use another JSON data file for a figure (e.g. benchmark results)")
+    args = parser.parse_args()
+
+    unknown = [name for name in args.figures if name not in FIGURES]
+    if unknown:
+        parser.error(f"Unknown figures: {', '.join(unknown)} (choose from {', '.join(FIGURES)})")
+    overrides = {}
+    for override in args.data:
+        name, _, path = override.partition("=")
+        matches = [figure for figure in FIGURES if figure == name or figure.startswith(name)]
+        if len(matches) != 1 or not path:
+            parser.error(f"--data expects FIGURE=PATH with one matching figure, got {override!r}")
+        overrides[matches[0]] = os.path.abspath(path)
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    cache_path = os.path.join(args.output_dir, CACHE_FILE)
+    try:
+        with open(cache_path) as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        cache = {}
+
+    jobs = {}
+    for module_name in args.figures or FIGURES:
+        module = importlib.import_module(module_name)
+        data_path = overrides.get(module_name, module.DATA_FILE)
+        output_path = os.path.join(args.output_dir, module.OUTPUT_FILE)
+        current = figure_hash(module_name, data_path, args.dpi)
+        if not args.force and cache.get(module.OUTPUT_FILE) == current and os.path.exists(output_path):
+            print(f"{module.OUTPUT_FILE}: up to date")
+            continue
+        jobs[module_name] = (data_path, output_path, current)
+
+    failures = 0
+    if jobs:
+        with ProcessPoolExecutor(max_workers=min(args.jobs or os.cpu_count() or 1, len(jobs))) as executor:
+            futures = {executor.submit(render_figure, module_name, data_path, output_path, args.dpi): module_name
+                       for module_name, (data_path, output_path, _) in jobs.items()}
+            for future in as_completed(futures):
+                module_name = futures[future]
+                data_path, output_path, current = jobs[module_name]
+                try:
+                    elapsed = future.result()
+                except Exception as e:
+                    failures += 1
+                    print(f"{os.path.basename(output_path)}: failed ({type(e).__name__}: {e})")
+                    continue
+                cache[os.path.basename(output_path)] = current
+                print(f"{os.path.basename(output_path)}: rendered in {elapsed:.1f}s")
+
+        with open(cache_path, "w") as f:
+            json.dump(cache, f, indent=2)
+
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+import os
+import tracemalloc
+
+from tool_profiler_example import ToolInvocationProfiler
+
+
+def retain(size):
+    return bytearray(size)
+
+
+def allocate(size):
+    return bytearray(size)
+
+
+def site(function):
+    return f"{os.path.basename(__file__)}:{function.__code__.co_firstlineno + 1}"
+
+
+def test_allocation_sites_cover_only_the_profiled_call():
+    tracemalloc.start()
+    try:
+        # Memory that is already live when the call starts is not the call's doing
+        live = [retain(1 << 20) for _ in range(4)]
+        profiler = ToolInvocationProfiler(sample_rate=1.0)
+
+        with profiler.profile("tool"):
+            result = allocate(256 * 1024)
+
+        sites = dict(profiler.get_profile("tool", top=50)["allocation_sites"])
+        assert site(retain) not in sites
+        assert sites[site(allocate)] >= 256 * 1024
+        del live, result
+    finally:
+        tracemalloc.stop()
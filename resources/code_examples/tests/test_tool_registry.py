@@ -0,0 +1,232 @@
+import asyncio
+import contextlib
+import copy
+import json
+import pickle
+import time
+
+import pytest
+
+from tool_registry_example import ToolRegistry, ToolCategory, ToolHandler, ToolPermissionLevel
+
+
+COUNT_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "max_results": {"type": "integer", "description": "Maximum number of results"}
+    }
+}
+
+
+def register(registry, handler, name="count", **options):
+    return registry.register_tool(
+        name=name, description="Count upwards", schema=COUNT_SCHEMA,
+        handler_func=handler, category=ToolCategory.UTILITY,
+        permission_level=ToolPermissionLevel.SAFE, **options)
+
+
+class TransactionalCounter(ToolHandler):
+    """Pooled streaming handler that records how each call's context ended."""
+
+    outcomes = []
+    health_checks = 0
+
+    @contextlib.contextmanager
+    def _transaction(self):
+        try:
+            yield
+        except BaseException:
+            TransactionalCounter.outcomes.append("rollback")
+            raise
+        TransactionalCounter.outcomes.append("commit")
+
+    def call_context(self):
+        return self._transaction()
+
+    def __call__(self, max_results=None):
+        for i in range(100):
+            yield i
+
+    def health_check(self):
+        TransactionalCounter.health_checks += 1
+        return True
+
+
+@pytest.mark.parametrize("buffer_size", [0, 8])
+def test_pooled_stream_stopped_by_max_results_commits_and_stays_healthy(buffer_size):
+    TransactionalCounter.outcomes = []
+    TransactionalCounter.health_checks = 0
+    registry = ToolRegistry()
+    tool_id = register(registry, TransactionalCounter,
+                       pool_options={"min_size": 1, "max_size": 1, "health_check_interval_s": 3600})
+
+    chunks = list(registry.stream_tool(tool_id, {"max_results": 3}, buffer_size=buffer_size))
+    assert chunks == [0, 1, 2]
+    assert TransactionalCounter.outcomes == ["commit"]
+
+    # A cleanly released instance is reused without a forced health check
+    assert list(registry.stream_tool(tool_id, {"max_results": 1}, buffer_size=buffer_size)) == [0]
+    assert TransactionalCounter.health_checks == 0
+    assert registry.get_pool_stats(tool_id)["unhealthy"] == 0
+    assert registry.get_pool_stats(tool_id)["created"] == 1
+
+
+def make_counter(produced, delay=0.0):
+    def count(max_results=None):
+        for i in range(100):
+            if delay:
+                time.sleep(delay)
+            produced.append(i)
+            yield i
+    return count
+
+
+def make_async_counter(produced):
+    async def count(max_results=None):
+        for i in range(100):
+            await asyncio.sleep(0)
+            produced.append(i)
+            yield i
+    return count
+
+
+@pytest.mark.parametrize("buffer_size", [0, 8])
+def test_max_results_stops_the_handler(buffer_size):
+    produced = []
+    registry = ToolRegistry()
+    tool_id = register(registry, make_counter(produced))
+
+    results = list(registry.stream_tool(tool_id, {"max_results": 3}, buffer_size=buffer_size))
+    assert results == [0, 1, 2]
+    assert produced == [0, 1, 2]
+
+
+def test_unbuffered_stream_advances_only_on_demand():
+    produced = []
+    registry = ToolRegistry()
+    stream = registry.stream_tool(register(registry, make_counter(produced)), buffer_size=0)
+
+    assert next(stream) == 0
+    time.sleep(0.05)
+    assert produced == [0]
+    stream.close()
+    assert produced == [0]
+
+
+def test_buffered_stream_blocks_the_handler_when_the_buffer_is_full():
+    produced = []
+    registry = ToolRegistry()
+    stream = registry.stream_tool(register(registry, make_counter(produced)), buffer_size=4)
+
+    assert next(stream) == 0
+    time.sleep(0.1)
+    # Four chunks wait in the buffer and the producer holds one more it cannot hand over
+    assert len(produced) == 6
+    stream.close()
+    assert len(produced) == 6
+
+
+@pytest.mark.parametrize("buffer_size", [0, 8])
+def test_astream_tool_runs_async_handlers_inside_a_running_loop(buffer_size):
+    produced = []
+    registry = ToolRegistry()
+    tool_id = register(registry, make_async_counter(produced))
+
+    async def consume():
+        return [chunk async for chunk in registry.astream_tool(
+            tool_id, {"max_results": 3}, buffer_size=buffer_size)]
+
+    assert asyncio.run(consume()) == [0, 1, 2]
+    assert produced == [0, 1, 2]
+    assert registry.get_tool(tool_id)["usage_count"] == 1
+
+
+@pytest.mark.parametrize("buffer_size", [0, 8])
+def test_astream_tool_runs_blocking_handlers_off_the_loop(buffer_size):
+    produced = []
+    registry = ToolRegistry()
+    tool_id = register(registry, make_counter(produced, delay=0.01))
+
+    async def consume():
+        ticks = 0
+
+        async def tick():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.001)
+                ticks += 1
+
+        ticker = asyncio.ensure_future(tick())
+        chunks = [chunk async for chunk in registry.astream_tool(
+            tool_id, {"max_results": 5}, buffer_size=buffer_size)]
+        ticker.cancel()
+        return chunks, ticks
+
+    chunks, ticks = asyncio.run(consume())
+    assert chunks == [0, 1, 2, 3, 4]
+    assert produced == [0, 1, 2, 3, 4]
+    assert ticks > 5
+
+
+class AsyncTransactionalCounter(TransactionalCounter):
+    """Pooled async generator handler."""
+
+    async def __call__(self, max_results=None):
+        for i in range(100):
+            yield i
+
+
+@pytest.mark.parametrize("buffer_size", [0, 8])
+def test_pooled_async_stream_commits_from_sync_and_async_consumers(buffer_size):
+    TransactionalCounter.outcomes = []
+    registry = ToolRegistry()
+    tool_id = register(registry, AsyncTransactionalCounter, pool_options={"max_size": 1})
+
+    assert list(registry.stream_tool(tool_id, {"max_results": 2}, buffer_size=buffer_size)) == [0, 1]
+
+    async def consume():
+        return [chunk async for chunk in registry.astream_tool(
+            tool_id, {"max_results": 2}, buffer_size=buffer_size)]
+
+    assert asyncio.run(consume()) == [0, 1]
+    assert TransactionalCounter.outcomes == ["commit", "commit"]
+    assert registry.get_pool_stats(tool_id)["created"] == 1
+
+
+def test_tool_records_survive_copy_deepcopy_and_pickle():
+    registry = ToolRegistry()
+    tool_id = register(registry, make_counter([]), examples=[{"max_results": 1}])
+    tool = registry.get_tool(tool_id)
+
+    for clone in (copy.copy(tool), copy.deepcopy(tool), pickle.loads(pickle.dumps(tool))):
+        assert clone == tool
+        assert json.dumps(clone, sort_keys=True) == json.dumps(tool, sort_keys=True)
+        with pytest.raises(TypeError):
+            clone["schema"]["type"] = "array"
+
+
+def test_duplicate_tool_id_does_not_leak_interned_entries():
+    registry = ToolRegistry()
+    tool_id = register(registry, make_counter([]))
+    before = registry.get_schema_store_stats()
+
+    with pytest.raises(ValueError):
+        registry.register_tool(
+            name="other", description="A different tool",
+            schema={"type": "object", "properties": {
+                "path": {"type": "string", "description": "A path"}}},
+            handler_func=make_counter([]), category=ToolCategory.UTILITY,
+            permission_level=ToolPermissionLevel.SAFE, examples=[{"path": "x"}], tool_id=tool_id)
+    assert registry.get_schema_store_stats() == before
+
+
+def test_failed_pool_setup_releases_interned_entries():
+    class BrokenHandler(ToolHandler):
+        def setup(self):
+            raise OSError("no backend")
+
+    registry = ToolRegistry()
+    before = registry.get_schema_store_stats()
+    with pytest.raises(OSError):
+        register(registry, BrokenHandler)
+    assert registry.get_schema_store_stats() == before
@@ -0,0 +1,50 @@
+from tool_registry_example import ToolRegistry, ToolCategory, ToolPermissionLevel
+from tool_registry_replication_example import InProcessTransport, ReplicationFollower, ReplicationLeader
+
+
+def lookup(term: str) -> dict:
+    return {"term": term}
+
+
+def make_leader():
+    registry = ToolRegistry()
+    registry.register_tool(
+        name="lookup", description="Look up a term",
+        schema={
+            "type": "object",
+            "required": ["term"],
+            "properties": {"term": {"type": "string", "description": "Term to look up"}}
+        },
+        handler_func=lookup, category=ToolCategory.RESEARCH,
+        permission_level=ToolPermissionLevel.SAFE,
+        examples=[{"term": "fair queueing"}])
+    return registry, ReplicationLeader(registry)
+
+
+def test_resync_from_an_identical_snapshot_changes_nothing():
+    leader_registry, leader = make_leader()
+    follower_registry = ToolRegistry()
+    follower = ReplicationFollower(follower_registry, InProcessTransport(leader), "follower-1",
+                                   handler_resolver=lambda record: lookup)
+    follower.sync()
+    revision = follower_registry.revision
+
+    # A follower ahead of the leader (e.g. after a leader restart) resyncs from a snapshot
+    follower.leader_revision = leader_registry.revision + 10
+    assert follower.sync() == 0
+    assert follower_registry.revision == revision
+    assert follower.leader_revision == leader_registry.revision
+
+
+def test_resync_applies_only_changed_tools():
+    leader_registry, leader = make_leader()
+    follower_registry = ToolRegistry()
+    follower = ReplicationFollower(follower_registry, InProcessTransport(leader), "follower-1",
+                                   handler_resolver=lambda record: lookup)
+    follower.sync()
+    tool_id = leader_registry.list_tools()[0]["id"]
+    leader_registry.update_tool_metadata(tool_id, {"description": "Look up a glossary term"})
+
+    follower.leader_revision = leader_registry.revision + 10
+    assert follower.sync() == 1
+    assert follower_registry.get_tool(tool_id)["description"] == "Look up a glossary term"
@@ -0,0 +1,29 @@
+import sys
+import threading
+
+from tool_registry_shared_example import SharedUsageCounters
+
+
+def test_threads_of_one_worker_do_not_lose_updates(tmp_path):
+    counters = SharedUsageCounters(str(tmp_path / "counters"), max_workers=2, max_tools=4)
+    threads, calls = 8, 5000
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        def record():
+            for _ in range(calls):
+                counters.record(0, 1, 2.0)
+
+        workers = [threading.Thread(target=record) for _ in range(threads)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+    finally:
+        sys.setswitchinterval(interval)
+
+    totals = counters.totals(1)
+    assert totals["usage_count"] == threads * calls
+    assert totals["total_execution_time_ms"] == threads * calls * 2.0
+    assert sum(totals["latency_buckets"]) == threads * calls
+    counters.close()
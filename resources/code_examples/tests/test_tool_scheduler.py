@@ -0,0 +1,52 @@
+from tool_registry_example import ToolRegistry, ToolCategory, ToolPermissionLevel
+from tool_scheduler_example import ToolInvocationScheduler
+
+
+def echo(value: int) -> int:
+    return value
+
+
+def make_scheduler():
+    registry = ToolRegistry()
+    tool_id = registry.register_tool(
+        name="echo", description="Echo a value",
+        schema={"type": "object", "properties": {"value": {"type": "integer", "description": "Value to return"}}},
+        handler_func=echo, category=ToolCategory.UTILITY,
+        permission_level=ToolPermissionLevel.SAFE)
+    # Without workers the test drives dispatch itself
+    return ToolInvocationScheduler(registry, max_workers=0), tool_id
+
+
+def dispatch(scheduler):
+    with scheduler._condition:
+        return scheduler._next_invocation()
+
+
+def test_tenants_are_dropped_once_the_scheduler_drains():
+    scheduler, tool_id = make_scheduler()
+    for i in range(100):
+        scheduler.submit(tool_id, {"value": i}, session_id=f"s{i}", tenant_id=f"t{i}")
+    while dispatch(scheduler) is not None:
+        pass
+    assert scheduler._tenants == {}
+    assert scheduler._idle_tenants == []
+
+
+def test_idle_tenant_keeps_its_finish_tag_while_virtual_time_is_behind():
+    scheduler, tool_id = make_scheduler()
+    for i in range(3):
+        scheduler.submit(tool_id, {"value": i}, tenant_id="heavy")
+    for i in range(6):
+        scheduler.submit(tool_id, {"value": i}, tenant_id="light")
+
+    served = [dispatch(scheduler)[0] for _ in range(5)]
+    assert served == ["heavy", "light", "heavy", "light", "heavy"]
+    # heavy is idle but ahead of virtual time, so re-submitting must not reset its share
+    assert "heavy" in scheduler._tenants
+    scheduler.submit(tool_id, {"value": 9}, tenant_id="heavy")
+    assert scheduler._tenants["heavy"].start_tag > scheduler._virtual_time
+    assert dispatch(scheduler)[0] == "light"
+
+    while dispatch(scheduler) is not None:
+        pass
+    assert scheduler._tenants == {}
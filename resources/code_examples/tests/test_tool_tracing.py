@@ -0,0 +1,36 @@
+import pytest
+
+from tool_tracing_example import (
+    ERROR_HANDLING, INTERACTION_LAYER, OPERATION_PIPELINE, RESOURCE_INTERACTION, TOOL_MANAGEMENT,
+    attribute_latency, heatmap_data
+)
+
+
+def span(span_id, parent, component, duration_us):
+    return {"pid": 1, "span": span_id, "parent": parent, "component": component, "duration_us": duration_us}
+
+
+SPANS = [
+    span(1, None, INTERACTION_LAYER, 1000.0),
+    span(2, 1, OPERATION_PIPELINE, 900.0),
+    span(3, 2, TOOL_MANAGEMENT, 100.0),
+    span(4, 2, RESOURCE_INTERACTION, 700.0),
+]
+
+
+def test_attribution_counts_each_microsecond_once():
+    attribution = attribute_latency(SPANS)
+    components = attribution["components"]
+    matrix = dict(zip(components, (dict(zip(components, row)) for row in attribution["matrix_ms"])))
+
+    assert sum(map(sum, attribution["matrix_ms"])) == pytest.approx(attribution["traced_ms"])
+    assert matrix[INTERACTION_LAYER][INTERACTION_LAYER] == pytest.approx(0.1)
+    assert matrix[INTERACTION_LAYER][OPERATION_PIPELINE] == pytest.approx(0.1)
+    assert matrix[OPERATION_PIPELINE][RESOURCE_INTERACTION] == pytest.approx(0.7)
+    assert attribution["self_time_ms"][TOOL_MANAGEMENT] == pytest.approx(0.1)
+    assert sum(map(sum, heatmap_data(attribution)["impact_matrix"])) == pytest.approx(100.0)
+
+
+def test_only_components_present_in_the_spans_are_included_by_default():
+    assert ERROR_HANDLING not in attribute_latency(SPANS)["components"]
+    assert ERROR_HANDLING in attribute_latency(SPANS, components=[ERROR_HANDLING])["components"]
@@ -0,0 +1,330 @@
+"""
+Tool Capacity Simulator Example
+
+This file demonstrates capacity planning for tool dispatch with a vectorized
+discrete-event simulation, as described in Chapter 2 of "Unified Agentic Systems: The Ultimate Guide to AI-Driven Tool Integration."
+
+Each deployment topology is modeled as a sequence of stages. A stage is a set
+of registry dispatchers, each a FIFO single-server queue, that receives
+requests round-robin. The simulator:
+1. Fits service-time distributions to recorded tool latencies (tracing spans or
+   plain latency samples)
+2. Computes every request's departure from a queue at once with the Lindley
+   recursion in closed form, d = C + max.accumulate(a - C_prev), so a million
+   requests take a fraction of a second
+3. Finds the response time for N interactive users (with think time) as the
+   fixed point of the response-time law, X = N / (R(X) + Z)
+4. Reports scaling curves and the scaling breakpoint, the user count at which
+   the topology's throughput saturates
+
+Requires numpy.
+"""
+
+import json
+import logging
+from typing import Dict, List, Any, Sequence
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Deployment topologies compared in the Chapter 2 architecture benchmarks.
+# Per stage: servers (dispatchers), service_ms (fixed server time per request),
+# tool_share (fraction of the sampled tool time spent on this stage's servers)
+# and overhead_ms (latency before the stage that occupies no server, e.g. a network hop).
+DEFAULT_TOPOLOGIES = {
+    "Monolithic": [
+        {"name": "application", "servers": 8, "service_ms": 5.0, "tool_share": 1.0, "overhead_ms": 0.0},
+    ],
+    "Microservices": [
+        {"name": "gateway", "servers": 16, "service_ms": 2.0, "tool_share": 0.0, "overhead_ms": 5.0},
+        {"name": "registry", "servers": 16, "service_ms": 3.0, "tool_share": 0.0, "overhead_ms": 5.0},
+        {"name": "tool_services", "servers": 64, "service_ms": 2.0, "tool_share": 1.0, "overhead_ms": 10.0},
+    ],
+    "Hybrid": [
+        {"name": "application", "servers": 16, "service_ms": 5.0, "tool_share": 0.3, "overhead_ms": 0.0},
+        {"name": "tool_workers", "servers": 32, "service_ms": 2.0, "tool_share": 0.7, "overhead_ms": 5.0},
+    ],
+    "Event-driven": [
+        {"name": "broker", "servers": 4, "service_ms": 1.0, "tool_share": 0.0, "overhead_ms": 10.0},
+        {"name": "workers", "servers": 48, "service_ms": 2.0, "tool_share": 1.0, "overhead_ms": 5.0},
+    ],
+    "Plugin-based": [
+        {"name": "plugin_host", "servers": 12, "service_ms": 8.0, "tool_share": 1.0, "overhead_ms": 0.0},
+    ],
+}
+
+
+class ServiceTimeModel:
+    """
+    Distribution of tool service times, fitted to recorded latencies.
+
+    "lognormal" fits the log-mean and log-standard deviation of the samples;
+    "empirical" resamples the recorded latencies directly.
+    """
+
+    def __init__(self, samples_ms: Sequence[float], kind: str = "lognormal"):
+        """
+        Fit the model.
+
+        Args:
+            samples_ms: Recorded tool latencies in milliseconds
+            kind: "lognormal" or "empirical"
+        """
+        samples = np.asarray(samples_ms, dtype=float)
+        samples = samples[samples > 0]
+        if samples.size < 2:
+            raise ValueError("At least two positive latency samples are needed")
+        if kind not in ("lognormal", "empirical"):
+            raise ValueError(f"Unknown service time model: {kind}")
+        self.kind = kind
+        self._samples = samples
+        logs = np.log(samples)
+        self.mu = float(logs.mean())
+        self.sigma = float(logs.std())
+
+    @classmethod
+    def lognormal(cls, median_ms: float, sigma: float) -> "ServiceTimeModel":
+        """Build a lognormal model from its median and log-standard deviation."""
+        model = cls([median_ms, median_ms * 2])
+        model.mu, model.sigma = float(np.log(median_ms)), sigma
+        return model
+
+    @property
+    def mean_ms(self) -> float:
+        """Mean service time."""
+        if self.kind == "empirical":
+            return float(self._samples.mean())
+        return float(np.exp(self.mu + self.sigma ** 2 / 2))
+
+    def sample(self, rng: np.random.Generator, count: int) -> np.ndarray:
+        """Draw count service times in milliseconds."""
+        if self.kind == "empirical":
+            return rng.choice(self._samples, size=count)
+        return rng.lognormal(self.mu, self.sigma, size=count)
+
+    def describe(self) -> Dict[str, Any]:
+        """Summarize the fitted model."""
+        return {"kind": self.kind, "mean_ms": self.mean_ms, "median_ms": float(np.exp(self.mu)),
+                "sigma": self.sigma, "samples": int(self._samples.size)}
+
+
+def load_latency_samples(path: str, span_name: str = "handler") -> List[float]:
+    """
+    Load recorded tool latencies.
+
+    Args:
+        path: A span file from tool_tracing_example.SpanTracer (JSON lines), or a
+            JSON array of latencies in milliseconds
+        span_name: Span whose durations are used when reading a span file
+
+    Returns:
+        Latencies in milliseconds
+    """
+    with open(path) as f:
+        text = f.read()
+    if text.lstrip().startswith("["):
+        return [float(value) for value in json.loads(text)]
+    latencies = []
+    for line in text.splitlines():
+        if line.strip():
+            span = json.loads(line)
+            if span["name"] == span_name:
+                latencies.append(span["duration_us"] / 1000)
+    return latencies
+
+
+def fifo_departures(arrivals: np.ndarray, service: np.ndarray, servers: int) -> np.ndarray:
+    """
+    Departure times from a stage of FIFO single-server queues fed round-robin.
+
+    For one queue with sorted arrivals a and service times S the Lindley
+    recursion d[k] = max(a[k], d[k-1]) + S[k] unrolls to
+    d[k] = C[k] + max over j <= k of (a[j] - C[j-1]), with C the cumulative
+    service time, which numpy evaluates without a Python loop. Request k goes
+    to server k % servers, so reshaping to (rounds, servers) turns every
+    column into one server's queue.
+
+    Args:
+        arrivals: Sorted arrival times
+        service: Service time of each request
+        servers: Number of servers in the stage
+
+    Returns:
+        Departure time of each request, in arrival order
+    """
+    count = arrivals.size
+    rounds = -(-count // servers)
+    padding = rounds * servers - count
+    if padding:
+        arrivals = np.concatenate([arrivals, np.full(padding, arrivals[-1])])
+        service = np.concatenate([service, np.zeros(padding)])
+    a = arrivals.reshape(rounds, servers)
+    s = service.reshape(rounds, servers)
+    completed = np.cumsum(s, axis=0)
+    departures = completed + np.maximum.accumulate(a - (completed - s), axis=0)
+    return departures.reshape(-1)[:count]
+
+
+def simulate_topology(stages: List[Dict[str, Any]],
+                      arrivals: np.ndarray,
+                      tool_service: np.ndarray) -> np.ndarray:
+    """
+    Push requests through a topology's stages.
+
+    Args:
+        stages: Stage definitions (see DEFAULT_TOPOLOGIES)
+        arrivals: Sorted arrival times in milliseconds
+        tool_service: Sampled tool service time of each request
+
+    Returns:
+        Response time of each request in milliseconds
+    """
+    times = arrivals
+    for stage in stages:
+        ready = times + stage.get("overhead_ms", 0.0)
+        service = stage.get("service_ms", 0.0) + stage.get("tool_share", 0.0) * tool_service
+        order = np.argsort(ready, kind="stable")
+        departures = np.empty_like(ready)
+        departures[order] = fifo_departures(ready[order], service[order], stage["servers"])
+        times = departures
+    return times - arrivals
+
+
+class CapacitySimulator:
+    """
+    Simulates topologies under interactive load.
+
+    All evaluations reuse one set of random draws (common random numbers), so
+    response time is a smooth, monotone function of the arrival rate and the
+    fixed-point search converges quickly.
+    """
+
+    def __init__(self,
+                 service_model: ServiceTimeModel,
+                 requests: int = 200000,
+                 think_time_ms: float = 1000.0,
+                 warmup_fraction: float = 0.1,
+                 seed: int = 1):
+        """
+        Initialize the simulator.
+
+        Args:
+            service_model: Tool service-time distribution
+            requests: Requests simulated per evaluation
+            think_time_ms: Mean user think time between a response and the next request
+            warmup_fraction: Leading share of requests excluded from averages
+            seed: Random seed
+        """
+        rng = np.random.default_rng(seed)
+        self.service_model = service_model
+        self.think_time_ms = think_time_ms
+        self._unit_gaps = np.cumsum(rng.exponential(1.0, size=requests))
+        self._tool_service = service_model.sample(rng, requests)
+        self._measured = slice(int(requests * warmup_fraction), None)
+
+    def capacity(self, stages: List[Dict[str, Any]]) -> float:
+        """Maximum throughput (requests/ms) of a topology, set by its slowest stage."""
+        mean_tool = self.service_model.mean_ms
+        return min(stage["servers"] / (stage.get("service_ms", 0.0) + stage.get("tool_share", 0.0) * mean_tool)
+                   for stage in stages)
+
+    def open_response_time(self, stages: List[Dict[str, Any]], rate: float) -> float:
+        """Mean response time (ms) with Poisson arrivals at rate requests/ms."""
+        response = simulate_topology(stages, self._unit_gaps / rate, self._tool_service)
+        return float(response[self._measured].mean())
+
+    def closed_response_time(self, stages: List[Dict[str, Any]], users: int, iterations: int = 40) -> Dict[str, float]:
+        """
+        Response time and throughput for a number of interactive users.
+
+        Solves users = X * (R(X) + Z) for the throughput X by bisection. When
+        even near-capacity throughput leaves users waiting, the topology is
+        saturated: X is its capacity and R follows from the response-time law.
+
+        Args:
+            stages: Stage definitions
+            users: Concurrent users
+            iterations: Bisection steps
+
+        Returns:
+            Dictionary with response_time_ms and throughput_rps
+        """
+        capacity = self.capacity(stages)
+        high = capacity * 0.98
+        if high * (self.open_response_time(stages, high) + self.think_time_ms) < users:
+            return {"response_time_ms": users / capacity - self.think_time_ms, "throughput_rps": capacity * 1000}
+        low = 0.0
+        for _ in range(iterations):
+            rate = (low + high) / 2
+            if rate * (self.open_response_time(stages, rate) + self.think_time_ms) < users:
+                low = rate
+            else:
+                high = rate
+        rate = (low + high) / 2
+        return {"response_time_ms": users / rate - self.think_time_ms, "throughput_rps": rate * 1000}
+
+    def breakpoint(self, stages: List[Dict[str, Any]]) -> float:
+        """
+        Scaling breakpoint: the user count where the light-load and saturation
+        asymptotes of throughput meet, N* = (R0 + Z) * X_max.
+        """
+        unloaded = self.open_response_time(stages, self.capacity(stages) * 1e-3)
+        return (unloaded + self.think_time_ms) * self.capacity(stages)
+
+    def scaling_curves(self,
+                       topologies: Dict[str, List[Dict[str, Any]]],
+                       users: Sequence[int]) -> Dict[str, Any]:
+        """
+        Simulate every topology at every user count.
+
+        Args:
+            topologies: Mapping of architecture names to stage definitions
+            users: Concurrent user counts
+
+        Returns:
+            Data in the format of architecture_scaling_visualization.py, with
+            per-architecture throughput, capacity and breakpoints added
+        """
+        result: Dict[str, Any] = {
+            "source": "Discrete-event capacity simulation",
+            "concurrent_users": list(users),
+            "response_time_ms": {},
+            "throughput_rps": {},
+            "capacity_rps": {},
+            "breakpoints": {},
+            "service_model": self.service_model.describe(),
+            "think_time_ms": self.think_time_ms,
+            "annotations": [],
+        }
+        for name, stages in topologies.items():
+            points = [self.closed_response_time(stages, count) for count in users]
+            result["response_time_ms"][name] = [round(point["response_time_ms"], 1) for point in points]
+            result["throughput_rps"][name] = [round(point["throughput_rps"], 2) for point in points]
+            result["capacity_rps"][name] = round(self.capacity(stages) * 1000, 2)
+            result["breakpoints"][name] = round(self.breakpoint(stages), 1)
+            logger.info(f"Simulated {name}: breakpoint at {result['breakpoints'][name]:.0f} users")
+        # The chart marks where the first architecture stops scaling
+        result["breakpoint_users"] = min(result["breakpoints"].values())
+        return result
+
+
+# Example usage
+if __name__ == "__main__":
+    import time
+
+    model = ServiceTimeModel.lognormal(median_ms=150, sigma=0.5)
+
+    # Raw engine throughput: one million requests through a three-stage topology
+    rng = np.random.default_rng(0)
+    count = 1_000_000
+    arrivals = np.cumsum(rng.exponential(1 / 0.3, size=count))
+    start = time.perf_counter()
+    response = simulate_topology(DEFAULT_TOPOLOGIES["Microservices"], arrivals, model.sample(rng, count))
+    print(f"Simulated {count:,} requests in {time.perf_counter() - start:.2f}s "
+          f"(mean response {response.mean():.0f}ms)")
+
+    simulator = CapacitySimulator(model, requests=50000)
+    curves = simulator.scaling_curves(DEFAULT_TOPOLOGIES, [1, 10, 50, 100, 500])
+    for name, values in curves["response_time_ms"].items():
+        print(f"{name:14} {values}  breakpoint {curves['breakpoints'][name]:.0f} users")
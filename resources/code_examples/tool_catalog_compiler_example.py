@@ -0,0 +1,228 @@
+"""
+Tool Catalog Compiler Example
+
+This file demonstrates cached, incrementally updated serialization of the tool
+manifest sent to the model, as described in Chapter 4 of "Unified Agentic Systems: The Ultimate Guide to AI-Driven Tool Integration."
+
+Building the manifest with json.dumps(registry.list_tools()) on every agent turn
+re-serializes an unchanged catalog over and over. The compiler instead:
+1. Keeps a pre-serialized JSON fragment per tool
+2. Re-serializes only tools whose catalog revision changed since the last build
+3. Assembles filtered manifests (category, permission ceiling, token budget)
+   by joining cached fragments
+4. Caches each assembled manifest until the catalog changes
+
+Requires tool_registry_example.py from the same directory.
+"""
+
+import json
+import logging
+import threading
+from typing import Dict, List, Optional, Any, Callable, Tuple
+
+from tool_registry_example import (
+    ToolRegistry, ToolPermissionLevel, ToolCategory, ChangeLogTruncatedError, configure_logging
+)
+
+logger = logging.getLogger(__name__)
+
+
+def default_manifest_entry(tool: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Build the model-facing description of a tool.
+
+    Args:
+        tool: Tool record as returned by ToolRegistry.get_tool
+
+    Returns:
+        Manifest entry with name, description and input schema
+    """
+    return {
+        "name": tool["name"],
+        "description": tool["description"],
+        "input_schema": tool["schema"]
+    }
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Roughly estimate the number of model tokens in a JSON text.
+
+    Args:
+        text: Serialized manifest fragment
+
+    Returns:
+        Estimated token count (about four characters per token)
+    """
+    return len(text) // 4 + 1
+
+
+class ToolCatalogCompiler:
+    """
+    Compiles registry contents into serialized tool manifests.
+
+    Fragments are cached per tool together with the catalog revision they were
+    built from, so a build after a single update re-serializes a single tool.
+    """
+
+    def __init__(self,
+                 registry: ToolRegistry,
+                 entry_builder: Callable[[Dict[str, Any]], Dict[str, Any]] = default_manifest_entry,
+                 token_counter: Callable[[str], int] = estimate_tokens):
+        """
+        Initialize the compiler.
+
+        Args:
+            registry: Registry whose catalog is compiled
+            entry_builder: Converts a tool record into its manifest entry
+            token_counter: Estimates the token cost of a serialized fragment
+        """
+        self._registry = registry
+        self._entry_builder = entry_builder
+        self._token_counter = token_counter
+
+        self._fragments: Dict[str, Dict[str, Any]] = {}
+        self._compiled_revision = -1
+        self._manifests: Dict[Tuple, str] = {}
+        self._stats = {"fragments_serialized": 0, "manifest_cache_hits": 0, "manifests_assembled": 0}
+        self._lock = threading.Lock()
+
+    def build_manifest(self,
+                       category: Optional[ToolCategory] = None,
+                       permission_level: Optional[ToolPermissionLevel] = None,
+                       token_budget: Optional[int] = None) -> str:
+        """
+        Build a JSON array manifest of enabled tools.
+
+        Args:
+            category: Only include tools of this category
+            permission_level: Only include tools at or below this permission level
+            token_budget: Maximum estimated tokens; tools are added in registration
+                order and any tool that does not fit in the remaining budget is skipped
+
+        Returns:
+            Serialized manifest
+        """
+        key = (category.value if category else None,
+               permission_level.value if permission_level else None,
+               token_budget)
+        with self._lock:
+            self._refresh()
+            manifest = self._manifests.get(key)
+            if manifest is not None:
+                self._stats["manifest_cache_hits"] += 1
+                return manifest
+
+            parts: List[str] = []
+            remaining = token_budget
+            for fragment in self._fragments.values():
+                if not fragment["is_enabled"]:
+                    continue
+                if key[0] is not None and fragment["category"] != key[0]:
+                    continue
+                if key[1] is not None and fragment["permission_level"] > key[1]:
+                    continue
+                if remaining is not None:
+                    if fragment["tokens"] > remaining:
+                        continue
+                    remaining -= fragment["tokens"]
+                parts.append(fragment["json"])
+
+            manifest = "[" + ",".join(parts) + "]"
+            self._manifests[key] = manifest
+            self._stats["manifests_assembled"] += 1
+            return manifest
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get compiler statistics.
+
+        Returns:
+            Dictionary with cached fragment count, serialization and cache hit counters
+        """
+        with self._lock:
+            return dict(self._stats, cached_fragments=len(self._fragments),
+                        compiled_revision=self._compiled_revision)
+
+    def _refresh(self) -> None:
+        """Re-serialize the tools that changed since the last build. Caller holds the lock."""
+        if self._registry.revision == self._compiled_revision:
+            return
+
+        # The change feed names the changed tools directly; after a gap too large
+        # for the change log, compare per-tool revisions across the whole catalog
+        try:
+            revisions = {}
+            for event in self._registry.changes_since(max(self._compiled_revision, 0)):
+                revisions[event["tool_id"]] = event["revision"]
+        except ChangeLogTruncatedError:
+            revisions = self._registry.get_tool_revisions()
+
+        changed = 0
+        for tool_id, revision in revisions.items():
+            cached = self._fragments.get(tool_id)
+            if cached is not None and cached["revision"] == revision:
+                continue
+            tool = self._registry.get_tool(tool_id)
+            if tool is None:
+                continue
+            self._fragments[tool_id] = self._build_fragment(tool, revision)
+            changed += 1
+
+        self._compiled_revision = max(revisions.values(), default=self._compiled_revision)
+        if changed:
+            self._manifests.clear()
+            self._stats["fragments_serialized"] += changed
+            logger.debug(f"Catalog compiler re-serialized {changed} tools")
+
+    def _build_fragment(self, tool: Dict[str, Any], revision: int) -> Dict[str, Any]:
+        """Serialize one tool and keep the fields needed for filtering."""
+        text = json.dumps(self._entry_builder(tool), separators=(",", ":"))
+        return {
+            "json": text,
+            "tokens": self._token_counter(text),
+            "category": tool["category"],
+            "permission_level": tool["permission_level"],
+            "is_enabled": tool.get("is_enabled", True),
+            "revision": revision
+        }
+
+
+# Example usage
+if __name__ == "__main__":
+    import time
+
+    configure_logging()
+
+    registry = ToolRegistry()
+    for i in range(200):
+        registry.register_tool(
+            name=f"tool_{i}",
+            description=f"Example tool number {i}",
+            schema={"type": "object", "required": ["query"],
+                    "properties": {"query": {"type": "string", "description": "Query text"}}},
+            handler_func=print,
+            category=ToolCategory.CODE_ANALYSIS if i % 2 else ToolCategory.FILE_SYSTEM,
+            permission_level=ToolPermissionLevel(i % 4))
+
+    compiler = ToolCatalogCompiler(registry)
+    turns = 1000
+
+    start = time.perf_counter()
+    for _ in range(turns):
+        json.dumps(registry.list_tools())
+    baseline_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    for _ in range(turns):
+        compiler.build_manifest()
+    compiled_ms = (time.perf_counter() - start) * 1000
+
+    print(f"{turns} turns: json.dumps(list_tools()) {baseline_ms:.0f}ms, "
+          f"compiled manifest {compiled_ms:.1f}ms")
+
+    # One update re-serializes one fragment
+    registry.update_tool_metadata(next(iter(registry.get_tool_revisions())), {"description": "Updated"})
+    safe_manifest = compiler.build_manifest(permission_level=ToolPermissionLevel.SAFE, token_budget=500)
+    print(f"SAFE manifest within 500 tokens: {len(json.loads(safe_manifest))} tools")
+    print(f"Compiler stats: {compiler.stats()}")
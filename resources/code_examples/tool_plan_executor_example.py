@@ -0,0 +1,403 @@
+"""
+Tool Plan Executor Example
+
+This file demonstrates dependency-driven execution of multi-tool plans, as
+described in Chapter 7 of "Unified Agentic Systems: The Ultimate Guide to AI-Driven Tool Integration."
+
+Agent plans often form a graph (search code, analyze several of the results,
+then generate a patch). The executor provides:
+1. A plan DAG whose step arguments can reference earlier step outputs
+2. Parallel execution of independent branches within a concurrency limit
+3. Streaming of step results as each node completes
+4. Per-node and critical-path timings matching the Chapter 7 operation
+   pipeline benchmarks
+
+Requires tool_registry_example.py from the same directory.
+"""
+
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Dict, List, Optional, Any, Iterator
+
+from tool_registry_example import ToolRegistry, ToolPermissionLevel, ToolCategory, configure_logging
+
+logger = logging.getLogger(__name__)
+
+# Argument values of the form {"$ref": "step_id.path.to.value"} are replaced
+# with the referenced part of an earlier step's output before dispatch.
+REF_KEY = "$ref"
+
+
+class ToolPlan:
+    """
+    A directed acyclic graph of tool calls.
+
+    Dependencies are inferred from "$ref" arguments and can be extended with
+    explicit depends_on entries for ordering-only constraints.
+    """
+
+    def __init__(self):
+        """Initialize an empty plan."""
+        self._steps: Dict[str, Dict[str, Any]] = {}
+
+    def add_step(self,
+                 step_id: str,
+                 tool_id: str,
+                 arguments: Optional[Dict[str, Any]] = None,
+                 depends_on: Optional[List[str]] = None) -> str:
+        """
+        Add a tool call to the plan.
+
+        Args:
+            step_id: Unique name of the step within the plan
+            tool_id: Registry ID of the tool to invoke
+            arguments: Handler arguments, possibly containing {"$ref": ...} values
+            depends_on: Additional steps that must finish first
+
+        Returns:
+            The step ID
+
+        Raises:
+            ValueError: If the step ID is already used
+        """
+        if step_id in self._steps:
+            raise ValueError(f"Duplicate plan step: {step_id}")
+
+        arguments = arguments or {}
+        dependencies = set(depends_on or [])
+        dependencies.update(ref.split(".", 1)[0] for ref in _find_refs(arguments))
+
+        self._steps[step_id] = {
+            "id": step_id,
+            "tool_id": tool_id,
+            "arguments": arguments,
+            "depends_on": sorted(dependencies)
+        }
+        return step_id
+
+    @property
+    def steps(self) -> Dict[str, Dict[str, Any]]:
+        """The plan steps keyed by step ID."""
+        return self._steps
+
+    def topological_order(self) -> List[str]:
+        """
+        Order the steps so that every step follows its dependencies.
+
+        Returns:
+            List of step IDs
+
+        Raises:
+            ValueError: If a dependency is unknown or the plan contains a cycle
+        """
+        remaining = {}
+        for step_id, step in self._steps.items():
+            for dependency in step["depends_on"]:
+                if dependency not in self._steps:
+                    raise ValueError(f"Step {step_id} depends on unknown step {dependency}")
+            remaining[step_id] = len(step["depends_on"])
+
+        dependents = self.dependents()
+        ready = [step_id for step_id, count in remaining.items() if count == 0]
+        order = []
+        while ready:
+            step_id = ready.pop()
+            order.append(step_id)
+            for dependent in dependents[step_id]:
+                remaining[dependent] -= 1
+                if remaining[dependent] == 0:
+                    ready.append(dependent)
+
+        if len(order) != len(self._steps):
+            raise ValueError("Plan contains a dependency cycle")
+        return order
+
+    def dependents(self) -> Dict[str, List[str]]:
+        """Map each step to the steps that depend on it."""
+        dependents: Dict[str, List[str]] = {step_id: [] for step_id in self._steps}
+        for step_id, step in self._steps.items():
+            for dependency in step["depends_on"]:
+                dependents[dependency].append(step_id)
+        return dependents
+
+
+class ToolPlanExecutor:
+    """
+    Executes tool plans through the registry, running independent branches in parallel.
+    """
+
+    def __init__(self, registry: ToolRegistry, max_concurrency: int = 4):
+        """
+        Initialize the executor.
+
+        Args:
+            registry: Registry used to dispatch each step
+            max_concurrency: Maximum number of steps running at once
+        """
+        self._registry = registry
+        self._max_concurrency = max_concurrency
+
+    def execute_iter(self, plan: ToolPlan) -> Iterator[Dict[str, Any]]:
+        """
+        Execute a plan, yielding each step's result as soon as it completes.
+
+        Steps whose dependencies failed are yielded with status "skipped".
+
+        Args:
+            plan: The plan to execute
+
+        Yields:
+            Step result records with status, result or error, and timings in
+            milliseconds relative to the start of the plan
+        """
+        order = plan.topological_order()
+        dependents = plan.dependents()
+        steps = plan.steps
+        waiting = {step_id: len(steps[step_id]["depends_on"]) for step_id in order}
+        outputs: Dict[str, Any] = {}
+        finished_at: Dict[str, float] = {}
+        plan_start = time.perf_counter()
+
+        def elapsed_ms(timestamp: float) -> float:
+            return (timestamp - plan_start) * 1000
+
+        def run_step(step_id: str, arguments: Dict[str, Any]) -> tuple:
+            started = time.perf_counter()
+            try:
+                result = self._registry.invoke_tool(steps[step_id]["tool_id"], arguments)
+            except Exception as e:
+                return started, None, str(e), time.perf_counter()
+            return started, result, None, time.perf_counter()
+
+        with ThreadPoolExecutor(max_workers=self._max_concurrency) as pool:
+            running = {}
+            ready = [step_id for step_id in order if waiting[step_id] == 0]
+
+            while ready or running:
+                for step_id in ready:
+                    try:
+                        arguments = _resolve_refs(steps[step_id]["arguments"], outputs)
+                    except (LookupError, TypeError, ValueError) as e:
+                        # An upstream result lacks the referenced index or key
+                        error = f"Unresolvable reference: {type(e).__name__}: {e}"
+                        logger.warning(f"Plan step {step_id} failed: {error}")
+                        now = elapsed_ms(time.perf_counter())
+                        dependencies_done = max(
+                            (finished_at[d] for d in steps[step_id]["depends_on"]), default=plan_start)
+                        yield _step_record(step_id, "failed", None, error,
+                                           elapsed_ms(dependencies_done), now, now)
+                        for skipped in self._skip_dependents(step_id, dependents, waiting):
+                            yield _step_record(skipped, "skipped", None,
+                                               f"Dependency {step_id} failed", None, None, None)
+                        continue
+                    running[pool.submit(run_step, step_id, arguments)] = step_id
+                ready = []
+                if not running:
+                    continue
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    step_id = running.pop(future)
+                    dependencies_done = max(
+                        (finished_at[d] for d in steps[step_id]["depends_on"]), default=plan_start)
+                    started, result, error, finished = future.result()
+                    if error is not None:
+                        logger.warning(f"Plan step {step_id} failed: {error}")
+                        yield _step_record(step_id, "failed", None, error,
+                                           elapsed_ms(dependencies_done),
+                                           elapsed_ms(started), elapsed_ms(finished))
+                        for skipped in self._skip_dependents(step_id, dependents, waiting):
+                            yield _step_record(skipped, "skipped", None,
+                                               f"Dependency {step_id} failed", None, None, None)
+                        continue
+
+                    outputs[step_id] = result
+                    finished_at[step_id] = finished
+                    yield _step_record(step_id, "success", result, None,
+                                       elapsed_ms(dependencies_done),
+                                       elapsed_ms(started), elapsed_ms(finished))
+
+                    for dependent in dependents[step_id]:
+                        waiting[dependent] -= 1
+                        if waiting[dependent] == 0:
+                            ready.append(dependent)
+
+    def execute(self, plan: ToolPlan) -> Dict[str, Any]:
+        """
+        Execute a plan to completion and report its timings.
+
+        Args:
+            plan: The plan to execute
+
+        Returns:
+            Dictionary with per-step results and the timing report
+        """
+        records = {record["id"]: record for record in self.execute_iter(plan)}
+        report = plan_timing_report(plan, records)
+        report["steps"] = records
+        return report
+
+    @staticmethod
+    def _skip_dependents(step_id: str,
+                         dependents: Dict[str, List[str]],
+                         waiting: Dict[str, int]) -> List[str]:
+        """Mark every transitive dependent of a failed step as never runnable."""
+        skipped = []
+        pending = list(dependents[step_id])
+        while pending:
+            dependent = pending.pop()
+            if waiting.get(dependent, 0) < 0:
+                continue
+            waiting[dependent] = -1
+            skipped.append(dependent)
+            pending.extend(dependents[dependent])
+        return skipped
+
+
+def plan_timing_report(plan: ToolPlan, records: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Compute per-node and critical-path timings for an executed plan.
+
+    The critical path is the dependency chain with the largest summed execution
+    time; it is the lower bound on plan latency however much concurrency is
+    available. Queue time is how long a step waited for a free slot after its
+    dependencies had finished.
+
+    Args:
+        plan: The executed plan
+        records: Step result records keyed by step ID
+
+    Returns:
+        Dictionary with node timings, critical path, total and serial time
+    """
+    node_timings = {}
+    path_cost: Dict[str, float] = {}
+    previous: Dict[str, Optional[str]] = {}
+
+    for step_id in plan.topological_order():
+        record = records.get(step_id)
+        if record is None or record["status"] != "success":
+            continue
+        duration = record["finished_ms"] - record["started_ms"]
+        node_timings[step_id] = {
+            "queue_ms": record["started_ms"] - record["ready_ms"],
+            "execution_ms": duration,
+            "finished_ms": record["finished_ms"]
+        }
+        best = max((d for d in plan.steps[step_id]["depends_on"] if d in path_cost),
+                   key=lambda d: path_cost[d], default=None)
+        path_cost[step_id] = duration + (path_cost[best] if best else 0.0)
+        previous[step_id] = best
+
+    critical_path: List[str] = []
+    if path_cost:
+        step_id: Optional[str] = max(path_cost, key=lambda s: path_cost[s])
+        while step_id:
+            critical_path.append(step_id)
+            step_id = previous[step_id]
+        critical_path.reverse()
+
+    total_ms = max((t["finished_ms"] for t in node_timings.values()), default=0.0)
+    serial_ms = sum(t["execution_ms"] for t in node_timings.values())
+    return {
+        "node_timings": node_timings,
+        "critical_path": critical_path,
+        "critical_path_ms": path_cost[critical_path[-1]] if critical_path else 0.0,
+        "total_ms": total_ms,
+        "serial_ms": serial_ms,
+        "parallel_speedup": serial_ms / total_ms if total_ms else 1.0
+    }
+
+
+def _step_record(step_id: str, status: str, result: Any, error: Optional[str],
+                 ready_ms: Optional[float], started_ms: Optional[float],
+                 finished_ms: Optional[float]) -> Dict[str, Any]:
+    """Build the result record yielded for a plan step."""
+    return {
+        "id": step_id,
+        "status": status,
+        "result": result,
+        "error": error,
+        "ready_ms": ready_ms,
+        "started_ms": started_ms,
+        "finished_ms": finished_ms
+    }
+
+
+def _find_refs(value: Any) -> List[str]:
+    """Collect all reference paths contained in an argument structure."""
+    if isinstance(value, dict):
+        if set(value) == {REF_KEY}:
+            return [value[REF_KEY]]
+        return [ref for item in value.values() for ref in _find_refs(item)]
+    if isinstance(value, list):
+        return [ref for item in value for ref in _find_refs(item)]
+    return []
+
+
+def _resolve_refs(value: Any, outputs: Dict[str, Any]) -> Any:
+    """Replace reference placeholders with values from earlier step outputs."""
+    if isinstance(value, dict):
+        if set(value) == {REF_KEY}:
+            step_id, _, path = value[REF_KEY].partition(".")
+            resolved = outputs[step_id]
+            for part in path.split(".") if path else []:
+                resolved = resolved[int(part)] if isinstance(resolved, list) else resolved[part]
+            return resolved
+        return {key: _resolve_refs(item, outputs) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_resolve_refs(item, outputs) for item in value]
+    return value
+
+
+# Example usage
+if __name__ == "__main__":
+    configure_logging()
+
+    def search_code(query: str) -> Dict[str, Any]:
+        """Example search handler returning matching files."""
+        time.sleep(0.05)
+        return {"results": [{"file": "auth.py"}, {"file": "session.py"}, {"file": "views.py"}]}
+
+    def analyze_file(file: str) -> Dict[str, Any]:
+        """Example analysis handler."""
+        time.sleep(0.1)
+        return {"file": file, "issues": 1}
+
+    def generate_patch(analyses: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Example patch generation handler."""
+        time.sleep(0.05)
+        return {"files_changed": [analysis["file"] for analysis in analyses]}
+
+    def simple_schema(parameter: str, parameter_type: str) -> Dict[str, Any]:
+        return {"type": "object", "required": [parameter],
+                "properties": {parameter: {"type": parameter_type, "description": parameter}}}
+
+    registry = ToolRegistry()
+    search_id = registry.register_tool(
+        "code_search", "Search code", simple_schema("query", "string"), search_code,
+        ToolCategory.CODE_ANALYSIS, ToolPermissionLevel.SAFE)
+    analyze_id = registry.register_tool(
+        "analyze_file", "Analyze a file", simple_schema("file", "string"), analyze_file,
+        ToolCategory.CODE_ANALYSIS, ToolPermissionLevel.SAFE)
+    patch_id = registry.register_tool(
+        "generate_patch", "Generate a patch", simple_schema("analyses", "array"), generate_patch,
+        ToolCategory.CODE_GENERATION, ToolPermissionLevel.USER_CONFIRMED)
+
+    plan = ToolPlan()
+    plan.add_step("search", search_id, {"query": "login"})
+    for i in range(3):
+        plan.add_step(f"analyze_{i}", analyze_id, {"file": {"$ref": f"search.results.{i}.file"}})
+    plan.add_step("patch", patch_id,
+                  {"analyses": [{"$ref": f"analyze_{i}"} for i in range(3)]})
+
+    executor = ToolPlanExecutor(registry, max_concurrency=3)
+    for record in executor.execute_iter(plan):
+        print(f"{record['id']}: {record['status']} at {record['finished_ms']:.0f}ms")
+
+    report = executor.execute(plan)
+    print(f"Critical path: {' -> '.join(report['critical_path'])} "
+          f"({report['critical_path_ms']:.0f}ms)")
+    print(f"Total: {report['total_ms']:.0f}ms, serial: {report['serial_ms']:.0f}ms, "
+          f"speedup: {report['parallel_speedup']:.2f}x")
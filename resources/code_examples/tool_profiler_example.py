@@ -0,0 +1,413 @@
+"""
+Tool Invocation Profiler Example
+
+This file demonstrates sampled profiling of tool invocations, as described in
+Chapter 9 of "Unified Agentic Systems: The Ultimate Guide to AI-Driven Tool Integration."
+
+When a tool's average_execution_time_ms creeps up, the registry's usage metrics
+say that it got slower but not why. Attached to a ToolRegistry, the profiler:
+1. Profiles a configurable fraction of calls per tool
+2. Captures either a stack-sampling profile or a cProfile profile
+3. Records tracemalloc allocation statistics for sampled calls
+4. Aggregates profiles per tool_id and exports collapsed-stack files for flame graphs
+
+With a sample rate of 0 the registry's hot path only pays one dictionary
+lookup and comparison per call.
+
+Requires tool_registry_example.py from the same directory.
+"""
+
+import contextlib
+import logging
+import os
+import random
+import sys
+import threading
+from collections import Counter
+from typing import Dict, List, Optional, Any, Iterator
+
+from tool_registry_example import ToolRegistry, ToolPermissionLevel, ToolCategory, configure_logging
+
+logger = logging.getLogger(__name__)
+
+SAMPLING_MODE = "sampling"
+CPROFILE_MODE = "cprofile"
+
+# Frames and allocations from these files are profiler overhead, not tool work
+_PROFILER_FILES = (contextlib.__file__, threading.__file__)
+
+
+class ToolInvocationProfiler:
+    """
+    Collects profiles for a sample of tool invocations.
+
+    In sampling mode a helper thread records the invoking thread's stack every
+    sampling_interval_s, which yields real call stacks for flame graphs and works
+    for concurrent calls. In cProfile mode each sampled call is traced
+    deterministically; only one call is traced at a time because the
+    interpreter supports a single active profiler, so overlapping samples are
+    skipped.
+    """
+
+    def __init__(self,
+                 sample_rate: float = 0.0,
+                 mode: str = SAMPLING_MODE,
+                 sampling_interval_s: float = 0.001,
+                 trace_allocations: bool = True,
+                 max_stack_depth: int = 64):
+        """
+        Initialize the profiler.
+
+        Args:
+            sample_rate: Default fraction of calls to profile for every tool (0-1)
+            mode: SAMPLING_MODE or CPROFILE_MODE
+            sampling_interval_s: Interval between stack samples in sampling mode
+            trace_allocations: Record tracemalloc statistics for sampled calls
+            max_stack_depth: Maximum frames kept per sampled stack
+        """
+        if mode not in (SAMPLING_MODE, CPROFILE_MODE):
+            raise ValueError(f"Unknown profiling mode: {mode}")
+        self._default_rate = sample_rate
+        self._rates: Dict[str, float] = {}
+        self._mode = mode
+        self._sampling_interval_s = sampling_interval_s
+        self._trace_allocations = trace_allocations
+        self._max_stack_depth = max_stack_depth
+
+        self._profiles: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._cprofile_lock = threading.Lock()
+        self._tracemalloc_users = 0
+        # Whether the profiler started tracemalloc, and so owns stopping it
+        self._tracemalloc_started = False
+
+    def set_sample_rate(self, tool_id: str, sample_rate: float) -> None:
+        """
+        Override the sample rate for a single tool.
+
+        Args:
+            tool_id: The unique identifier of the tool
+            sample_rate: Fraction of calls to profile (0-1)
+        """
+        self._rates[tool_id] = sample_rate
+
+    def should_sample(self, tool_id: str) -> bool:
+        """
+        Decide whether to profile the next call of a tool.
+
+        Args:
+            tool_id: The unique identifier of the tool
+
+        Returns:
+            True if the call should be profiled
+        """
+        rate = self._rates.get(tool_id, self._default_rate)
+        return rate > 0 and (rate >= 1 or random.random() < rate)
+
+    @contextlib.contextmanager
+    def profile(self, tool_id: str) -> Iterator[None]:
+        """
+        Profile the code executed inside the context on the current thread.
+
+        Args:
+            tool_id: Tool the profile is attributed to
+        """
+        if self._mode == CPROFILE_MODE:
+            profile_context = self._cprofile(tool_id)
+        else:
+            profile_context = self._stack_sampling(tool_id)
+
+        allocation_context = (self._allocation_tracing(tool_id) if self._trace_allocations
+                              else contextlib.nullcontext())
+        with allocation_context, profile_context:
+            yield
+
+    def get_profile(self, tool_id: str, top: int = 10) -> Optional[Dict[str, Any]]:
+        """
+        Summarize the aggregated profile of a tool.
+
+        Args:
+            tool_id: The unique identifier of the tool
+            top: Number of hottest stacks / functions / allocation sites to include
+
+        Returns:
+            Profile summary, or None if no call of the tool has been profiled
+        """
+        with self._lock:
+            aggregate = self._profiles.get(tool_id)
+            if aggregate is None:
+                return None
+            summary = {
+                "tool_id": tool_id,
+                "mode": self._mode,
+                "calls_profiled": aggregate["calls_profiled"],
+                "stack_samples": sum(aggregate["stacks"].values()),
+                "hottest_stacks": aggregate["stacks"].most_common(top),
+                "allocated_bytes_total": aggregate["allocated_bytes"],
+                "peak_bytes_max": aggregate["peak_bytes"],
+                "allocation_sites": aggregate["allocation_sites"].most_common(top)
+            }
+            stats = aggregate["stats"]
+
+        if stats is not None:
+            summary["hottest_functions"] = [
+                {"function": f"{name} ({os.path.basename(filename)}:{line})",
+                 "calls": entry[1], "total_time_s": entry[2], "cumulative_time_s": entry[3]}
+                for (filename, line, name), entry in sorted(
+                    stats.stats.items(), key=lambda item: item[1][3], reverse=True)[:top]
+            ]
+        return summary
+
+    def export_collapsed(self, tool_id: str, path: str) -> int:
+        """
+        Write a tool's sampled stacks in collapsed format ("frame;frame;frame count").
+
+        The output can be rendered by flamegraph.pl, speedscope or inferno.
+
+        Args:
+            tool_id: The unique identifier of the tool
+            path: Output file path
+
+        Returns:
+            Number of distinct stacks written
+
+        Raises:
+            ValueError: If the profiler is not in sampling mode
+        """
+        if self._mode != SAMPLING_MODE:
+            raise ValueError("Collapsed stacks require sampling mode; use export_pstats instead")
+        with self._lock:
+            aggregate = self._profiles.get(tool_id)
+            stacks = dict(aggregate["stacks"]) if aggregate else {}
+        with open(path, "w") as f:
+            for stack, count in sorted(stacks.items()):
+                f.write(f"{stack} {count}\n")
+        return len(stacks)
+
+    def export_pstats(self, tool_id: str, path: str) -> bool:
+        """
+        Write a tool's aggregated cProfile statistics for pstats or snakeviz.
+
+        Args:
+            tool_id: The unique identifier of the tool
+            path: Output file path
+
+        Returns:
+            True if statistics were written, False if none were collected
+        """
+        with self._lock:
+            aggregate = self._profiles.get(tool_id)
+            stats = aggregate["stats"] if aggregate else None
+            if stats is None:
+                return False
+            stats.dump_stats(path)
+        return True
+
+    def reset(self, tool_id: Optional[str] = None) -> None:
+        """
+        Discard aggregated profiles.
+
+        Args:
+            tool_id: Tool whose profile to discard, or None for all tools
+        """
+        with self._lock:
+            if tool_id is None:
+                self._profiles.clear()
+            else:
+                self._profiles.pop(tool_id, None)
+
+    def _aggregate(self, tool_id: str) -> Dict[str, Any]:
+        """Get or create the aggregate profile of a tool. Caller holds the lock."""
+        aggregate = self._profiles.get(tool_id)
+        if aggregate is None:
+            aggregate = {
+                "calls_profiled": 0,
+                "stacks": Counter(),
+                "stats": None,
+                "allocated_bytes": 0,
+                "peak_bytes": 0,
+                "allocation_sites": Counter()
+            }
+            self._profiles[tool_id] = aggregate
+        return aggregate
+
+    @contextlib.contextmanager
+    def _stack_sampling(self, tool_id: str) -> Iterator[None]:
+        """Sample the current thread's stack from a helper thread."""
+        target = threading.get_ident()
+        stop = threading.Event()
+        stacks: Counter = Counter()
+
+        # The first frame outside the profiler's context managers (the registry's
+        # invoke_tool) becomes the root of every sampled stack
+        root = sys._getframe()
+        while root is not None and _is_profiler_frame(root):
+            root = root.f_back
+        stop_frame = root.f_back if root is not None else None
+
+        def sample() -> None:
+            while not stop.wait(self._sampling_interval_s):
+                frame = sys._current_frames().get(target)
+                # Samples landing in the profiler's own bookkeeping are not the tool's time
+                if frame is None or _is_profiler_frame(frame):
+                    continue
+                stack = []
+                while frame is not None and frame is not stop_frame and len(stack) < self._max_stack_depth:
+                    code = frame.f_code
+                    stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                    frame = frame.f_back
+                stacks[";".join(reversed(stack))] += 1
+
+        sampler = threading.Thread(target=sample, name="tool-profiler-sampler", daemon=True)
+        sampler.start()
+        try:
+            yield
+        finally:
+            stop.set()
+            sampler.join()
+            with self._lock:
+                aggregate = self._aggregate(tool_id)
+                aggregate["calls_profiled"] += 1
+                aggregate["stacks"].update(stacks)
+
+    @contextlib.contextmanager
+    def _cprofile(self, tool_id: str) -> Iterator[None]:
+        """Trace the call deterministically with cProfile when no other trace is running."""
+        import cProfile
+        import pstats
+
+        if not self._cprofile_lock.acquire(blocking=False):
+            yield
+            return
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+            try:
+                yield
+            finally:
+                profiler.disable()
+        finally:
+            self._cprofile_lock.release()
+            with self._lock:
+                aggregate = self._aggregate(tool_id)
+                aggregate["calls_profiled"] += 1
+                if aggregate["stats"] is None:
+                    aggregate["stats"] = pstats.Stats(profiler)
+                else:
+                    aggregate["stats"].add(profiler)
+
+    @contextlib.contextmanager
+    def _allocation_tracing(self, tool_id: str) -> Iterator[None]:
+        """
+        Record allocations made during the call.
+
+        tracemalloc is process-wide. If the application is not already tracing,
+        the profiler traces only while at least one sampled call is active;
+        tracing the application started itself is left running. Allocation
+        sites are the lines whose traced memory grew between snapshots taken on
+        entry and exit, so memory that was already live is not attributed to
+        the call. The peak is reset for every sample, and overlapping sampled
+        calls share the trace, which makes their byte counts approximate.
+        """
+        import tracemalloc
+
+        with self._lock:
+            if self._tracemalloc_users == 0 and not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._tracemalloc_started = True
+            self._tracemalloc_users += 1
+        filters = [tracemalloc.Filter(False, filename)
+                   for filename in _PROFILER_FILES + (tracemalloc.__file__,)]
+        before = tracemalloc.take_snapshot().filter_traces(filters)
+        tracemalloc.reset_peak()
+        start_current, _ = tracemalloc.get_traced_memory()
+        try:
+            yield
+        finally:
+            current, peak = tracemalloc.get_traced_memory()
+            after = tracemalloc.take_snapshot().filter_traces(filters)
+            growth = [stat for stat in after.compare_to(before, "lineno") if stat.size_diff > 0]
+            sites = Counter({
+                f"{os.path.basename(stat.traceback[0].filename)}:{stat.traceback[0].lineno}": stat.size_diff
+                for stat in growth[:50]
+            })
+            with self._lock:
+                aggregate = self._aggregate(tool_id)
+                aggregate["allocated_bytes"] += max(current - start_current, 0)
+                aggregate["peak_bytes"] = max(aggregate["peak_bytes"], peak - start_current)
+                aggregate["allocation_sites"].update(sites)
+                self._tracemalloc_users -= 1
+                if self._tracemalloc_users == 0 and self._tracemalloc_started:
+                    tracemalloc.stop()
+                    self._tracemalloc_started = False
+
+
+_PROFILER_CODE = {
+    method.__wrapped__.__code__
+    for method in (ToolInvocationProfiler.profile, ToolInvocationProfiler._stack_sampling,
+                   ToolInvocationProfiler._cprofile, ToolInvocationProfiler._allocation_tracing)
+}
+
+
+def _is_profiler_frame(frame: Any) -> bool:
+    """Check whether a frame belongs to the profiler's own context managers."""
+    return frame.f_code in _PROFILER_CODE or frame.f_code.co_filename in _PROFILER_FILES
+
+
+def profile_summary_lines(summary: Dict[str, Any]) -> List[str]:
+    """
+    Format a profile summary for logs or terminals.
+
+    Args:
+        summary: Result of ToolInvocationProfiler.get_profile
+
+    Returns:
+        Lines of human-readable text
+    """
+    lines = [f"Tool {summary['tool_id']}: {summary['calls_profiled']} calls profiled "
+             f"({summary['mode']}), {summary['allocated_bytes_total']} bytes retained, "
+             f"peak {summary['peak_bytes_max']} bytes"]
+    for stack, count in summary["hottest_stacks"]:
+        lines.append(f"  {count:6d}  {stack.split(';')[-1]}")
+    for site, size in summary["allocation_sites"]:
+        lines.append(f"  {size:8d}B {site}")
+    return lines
+
+
+# Example usage
+if __name__ == "__main__":
+    import tempfile
+
+    configure_logging()
+
+    def slow_analysis(source: str) -> Dict[str, Any]:
+        """Example handler with a hot loop and some allocations."""
+        tokens = [source[i:i + 8] for i in range(0, len(source), 2)]
+        checksum = 0
+        for _ in range(200):
+            for token in tokens:
+                checksum = (checksum * 31 + hash(token)) & 0xFFFFFFFF
+        return {"tokens": len(tokens), "checksum": checksum}
+
+    registry = ToolRegistry()
+    tool_id = registry.register_tool(
+        name="analyze_source",
+        description="Analyze source text",
+        schema={"type": "object", "required": ["source"],
+                "properties": {"source": {"type": "string", "description": "Source text"}}},
+        handler_func=slow_analysis,
+        category=ToolCategory.CODE_ANALYSIS,
+        permission_level=ToolPermissionLevel.SAFE)
+
+    profiler = ToolInvocationProfiler(sample_rate=0.2)
+    registry.set_profiler(profiler)
+    for _ in range(20):
+        registry.invoke_tool(tool_id, {"source": "def example():\n    return 42\n" * 50})
+
+    summary = profiler.get_profile(tool_id, top=3)
+    if summary:
+        print("\n".join(profile_summary_lines(summary)))
+        with tempfile.TemporaryDirectory() as directory:
+            collapsed_path = os.path.join(directory, "analyze_source.collapsed")
+            written = profiler.export_collapsed(tool_id, collapsed_path)
+            print(f"Wrote {written} stacks to {collapsed_path}")
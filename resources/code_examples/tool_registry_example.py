@@ -7,23 +7,46 @@ as described in Chapter 4 of "Unified Agentic Systems: The Ultimate Guide to AI-
 The Tool Registry serves as the central catalog of available tools that an agentic system
 can utilize to perform tasks. It provides mechanisms for:
 1. Tool registration and discovery
-2. Schema validation
+2. Schema validation, with content-addressed sharing of identical schemas
 3. Permission management
 4. Tool metadata management
+5. Tool dispatch, including streamed results and pooled handler lifecycles
+6. Fast process startup from catalog snapshots
 """
 
 import json
-import jsonschema
-from typing import Dict, List, Optional, Any, Callable
+from typing import Dict, List, Optional, Any, Callable, Iterator, AsyncIterator, ContextManager, Type, Union
+from collections import deque
+import itertools
+import contextlib
+import base64
+import hashlib
 import logging
+import os
+import queue
+import sys
+import threading
+import time
+import types
 from enum import Enum
 from datetime import datetime
 import uuid
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+
+def configure_logging(level: int = logging.INFO) -> None:
+    """
+    Send log records to stderr with timestamps.
+    
+    Importing this module leaves logging configuration to the application;
+    scripts and demos call this to see the registry's log output.
+    
+    Args:
+        level: Root logger level
+    """
+    logging.basicConfig(level=level, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
 class ToolPermissionLevel(Enum):
     """Permission levels for tools to control access and risk."""
     SAFE = 0  # No system changes, read-only operations
@@ -53,24 +76,56 @@ class ToolRegistry:
     - Validating tool schemas
     - Managing tool permissions
     - Providing discovery and search capabilities
+    - Publishing a change feed of catalog mutations
     """
     
-    def __init__(self):
-        """Initialize the tool registry."""
+    def __init__(self, change_log_size: int = 10000):
+        """
+        Initialize the tool registry.
+        
+        Args:
+            change_log_size: Number of change events retained for changes_since()
+        """
         self._tools: Dict[str, Dict[str, Any]] = {}
+        # Registration order; tools are never removed, so positions are stable pagination keys
+        self._tool_order: List[str] = []
+        self._tool_slots: Dict[str, int] = {}
+        # Permission bitsets over tool slots (bit i of byte j is slot 8j+i), kept current by _mark_changed
+        self._level_bits: Dict[int, bytearray] = {level.value: bytearray() for level in ToolPermissionLevel}
+        self._category_bits: Dict[str, bytearray] = {category.value: bytearray() for category in ToolCategory}
+        self._enabled_bits = bytearray()
+        # Allowed-tool bitsets per (permission level, categories), valid for one catalog revision
+        self._allowed_cache: Dict[tuple, bytes] = {}
+        self._allowed_cache_revision = -1
         self._schema_validator = ToolSchemaValidator()
+        self._schema_store = ToolSchemaStore(self._schema_validator)
+        # Guards catalog mutations and usage metrics, which may come from concurrent dispatchers
+        self._lock = threading.RLock()
+        self._pools: Dict[str, HandlerPool] = {}
+        self._profiler: Optional[Any] = None
+        self._tracer: Optional[Any] = None
+        # Loads the handlers of snapshot tools, which are resolved on first dispatch
+        self._handler_resolver: Callable[[Dict[str, Any]], Callable] = (
+            lambda record: resolve_handler_reference(record["handler_ref"]))
+        # Catalog revision, bumped by every mutation that changes what list_tools returns
+        self._revision = 0
+        self._tool_revisions: Dict[str, int] = {}
+        self._change_log: deque = deque(maxlen=change_log_size)
+        self._watchers: List[Dict[str, Any]] = []
         logger.info("Tool Registry initialized")
     
     def register_tool(self, 
                      name: str,
                      description: str,
                      schema: Dict[str, Any],
-                     handler_func: Callable,
+                     handler_func: Union[Callable, Type["ToolHandler"]],
                      category: ToolCategory,
                      permission_level: ToolPermissionLevel,
                      version: str = "1.0.0",
                      author: str = "System",
-                     examples: List[Dict[str, Any]] = None) -> str:
+                     examples: List[Dict[str, Any]] = None,
+                     pool_options: Optional[Dict[str, Any]] = None,
+                     tool_id: Optional[str] = None) -> str:
         """
         Register a new tool in the registry.
         
@@ -78,21 +133,44 @@ class ToolRegistry:
             name: Unique name of the tool
             description: Human-readable description of the tool's purpose
             schema: JSON schema defining the tool's input parameters
-            handler_func: Function that implements the tool's functionality
+            handler_func: Function that implements the tool's functionality, or a
+                ToolHandler subclass whose warmed instances are pooled and reused
             category: Category the tool belongs to
             permission_level: Required permission level to use this tool
             version: Tool version
             author: Tool author or maintainer
             examples: Example usage of the tool
+            pool_options: Keyword arguments for the HandlerPool of a ToolHandler
+                subclass (min_size, max_size, idle_timeout_s, health_check_interval_s)
+            tool_id: Use this ID instead of generating one (e.g. on replicas)
             
         Returns:
             tool_id: Unique identifier for the registered tool
+            
+        Raises:
+            ValueError: If the given tool_id is already registered
         """
-        # Validate the tool schema
-        self._schema_validator.validate_tool_schema(schema)
-        
         # Generate a unique tool ID
-        tool_id = str(uuid.uuid4())
+        if tool_id is None:
+            tool_id = str(uuid.uuid4())
+        elif tool_id in self._tools:
+            raise ValueError(f"Tool already registered (ID: {tool_id})")
+        handler_ref = _handler_reference(handler_func)
+        
+        # Validate the tool schema (once per distinct schema) and share identical copies
+        schema_hash, schema = self._schema_store.intern_schema(schema)
+        try:
+            examples_hash, examples = self._schema_store.intern(examples or [])
+        except BaseException:
+            self._schema_store.release(schema_hash)
+            raise
+        try:
+            handler_func = self._prepare_handler(tool_id, handler_func, pool_options)
+        except BaseException:
+            # A pool whose instances fail to set up must not leak its interned entries
+            self._schema_store.release(schema_hash)
+            self._schema_store.release(examples_hash)
+            raise
         
         # Create the tool record
         tool_record = {
@@ -100,24 +178,44 @@ class ToolRegistry:
             "name": name,
             "description": description,
             "schema": schema,
+            "schema_hash": schema_hash,
             "handler": handler_func,
+            "handler_ref": handler_ref,
             "category": category.value,
             "permission_level": permission_level.value,
             "version": version,
             "author": author,
-            "examples": examples or [],
+            "examples": examples,
+            "examples_hash": examples_hash,
             "registration_time": datetime.utcnow().isoformat(),
             "usage_count": 0,
             "average_execution_time_ms": 0,
+            "average_time_to_first_result_ms": 0,
             "is_enabled": True
         }
         
         # Store the tool in the registry
-        self._tools[tool_id] = tool_record
+        with self._lock:
+            self._tools[tool_id] = tool_record
+            self._tool_slots[tool_id] = len(self._tool_order)
+            self._tool_order.append(tool_id)
+            self._mark_changed(tool_id, "registered", self.get_tool(tool_id))
         logger.info(f"Tool registered: {name} (ID: {tool_id})")
         
         return tool_id
     
+    def _prepare_handler(self, 
+                         tool_id: str, 
+                         handler_func: Union[Callable, Type["ToolHandler"]],
+                         pool_options: Optional[Dict[str, Any]] = None) -> Callable:
+        """Return the callable dispatched for a handler, pooling ToolHandler subclasses."""
+        # Lifecycle-aware handlers are dispatched through a pool of warmed instances
+        if isinstance(handler_func, type) and issubclass(handler_func, ToolHandler):
+            pool = HandlerPool(handler_func, **(pool_options or {}))
+            self._pools[tool_id] = pool
+            return pool
+        return handler_func
+    
     def get_tool(self, tool_id: str) -> Optional[Dict[str, Any]]:
         """
         Retrieve a tool by its ID.
@@ -147,7 +245,602 @@ class ToolRegistry:
             The handler function if the tool exists, None otherwise
         """
         tool = self._tools.get(tool_id)
-        return tool.get("handler") if tool else None
+        return self._resolve_handler(tool) if tool else None
+    
+    def invoke_tool(self, 
+                    tool_id: str, 
+                    parameters: Optional[Dict[str, Any]] = None,
+                    validate: bool = False,
+                    permission_level: Optional[ToolPermissionLevel] = None,
+                    categories: Optional[List[ToolCategory]] = None) -> Any:
+        """
+        Execute a tool's handler and record its execution time.
+        
+        Args:
+            tool_id: The unique identifier of the tool
+            parameters: Keyword arguments passed to the handler
+            validate: Validate the parameters against the tool's schema first
+            permission_level: Maximum permission level of the calling session, if
+                the call should be authorized
+            categories: Categories the calling session may use (None allows all)
+            
+        Returns:
+            Whatever the handler returns
+            
+        Raises:
+            ValueError: If the tool does not exist or is disabled
+            PermissionError: If a permission level is given and the tool is not allowed
+            jsonschema.exceptions.ValidationError: If validation is requested and fails
+        """
+        if self._tracer is not None:
+            return self._invoke_traced(tool_id, parameters, validate, permission_level, categories)
+        
+        tool = self._get_enabled_tool(tool_id)
+        if permission_level is not None and not self.is_tool_allowed(tool_id, permission_level, categories):
+            raise PermissionError(f"Tool not allowed for this session (ID: {tool_id})")
+        if validate:
+            self._schema_store.validator(tool["schema_hash"]).validate(parameters or {})
+        
+        start = time.perf_counter()
+        try:
+            return self._call_handler(tool_id, tool["handler"], parameters or {})
+        finally:
+            self.record_tool_usage(tool_id, (time.perf_counter() - start) * 1000)
+    
+    def _invoke_traced(self, 
+                       tool_id: str, 
+                       parameters: Optional[Dict[str, Any]],
+                       validate: bool,
+                       permission_level: Optional[ToolPermissionLevel],
+                       categories: Optional[List[ToolCategory]]) -> Any:
+        """invoke_tool with each dispatch stage recorded as a tracing span."""
+        tracer = self._tracer
+        with tracer.span("dispatch", tool_id=tool_id):
+            with tracer.span("lookup"):
+                tool = self._get_enabled_tool(tool_id)
+                if permission_level is not None and not self.is_tool_allowed(tool_id, permission_level, categories):
+                    raise PermissionError(f"Tool not allowed for this session (ID: {tool_id})")
+            if validate:
+                with tracer.span("validate"):
+                    with tracer.span("validator_cache"):
+                        validator = self._schema_store.validator(tool["schema_hash"])
+                    validator.validate(parameters or {})
+            
+            start = time.perf_counter()
+            try:
+                with tracer.span("handler"):
+                    return self._call_handler(tool_id, tool["handler"], parameters or {})
+            finally:
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                with tracer.span("metrics"):
+                    self.record_tool_usage(tool_id, elapsed_ms)
+    
+    def _call_handler(self, tool_id: str, handler: Callable, parameters: Dict[str, Any]) -> Any:
+        """Run a handler, profiling the call if the attached profiler samples it."""
+        profiler = self._profiler
+        if profiler is not None and profiler.should_sample(tool_id):
+            with profiler.profile(tool_id):
+                return handler(**parameters)
+        return handler(**parameters)
+    
+    def stream_tool(self, 
+                    tool_id: str, 
+                    parameters: Optional[Dict[str, Any]] = None,
+                    buffer_size: int = 8) -> Iterator[Any]:
+        """
+        Execute a tool's handler and stream its results as they are produced.
+        
+        Handlers may be generators or async generators; any other handler's
+        return value is streamed as a single chunk. With a positive buffer_size
+        the handler runs ahead of the consumer in a producer thread until the
+        buffer is full and then blocks (backpressure). With buffer_size 0 the
+        handler only advances when the consumer asks for the next chunk.
+        
+        If parameters contain max_results, the handler is closed as soon as that
+        many chunks have been delivered instead of truncating a full result.
+        Closing the returned iterator early also stops the handler.
+        
+        Async generator handlers are driven on a private event loop, so inside a
+        running event loop use astream_tool instead.
+        
+        Args:
+            tool_id: The unique identifier of the tool
+            parameters: Keyword arguments passed to the handler
+            buffer_size: Maximum number of chunks buffered ahead of the consumer
+            
+        Returns:
+            Iterator over result chunks
+            
+        Raises:
+            ValueError: If the tool does not exist or is disabled
+        """
+        tool = self._get_enabled_tool(tool_id)
+        return self._stream_results(tool_id, tool["handler"], parameters or {}, buffer_size)
+    
+    async def astream_tool(self, 
+                           tool_id: str, 
+                           parameters: Optional[Dict[str, Any]] = None,
+                           buffer_size: int = 8) -> AsyncIterator[Any]:
+        """
+        Execute a tool's handler and stream its results to async code.
+        
+        The async counterpart of stream_tool, with the same buffer_size and
+        max_results semantics. Async generator handlers run natively on the
+        caller's event loop (ahead of the consumer in a task when buffer_size is
+        positive). Other handlers may block, so they are called and advanced in
+        worker threads and never stall the loop.
+        
+        Args:
+            tool_id: The unique identifier of the tool
+            parameters: Keyword arguments passed to the handler
+            buffer_size: Maximum number of chunks buffered ahead of the consumer
+            
+        Yields:
+            Result chunks
+            
+        Raises:
+            ValueError: If the tool does not exist or is disabled
+        """
+        import asyncio
+        
+        tool = self._get_enabled_tool(tool_id)
+        parameters = parameters or {}
+        max_results = parameters.get("max_results")
+        start = time.perf_counter()
+        first_result_ms = None
+        # Plain handlers do their work when called, and pooled ones may wait for an instance
+        output = await asyncio.to_thread(tool["handler"], **parameters)
+        if isinstance(output, types.AsyncGeneratorType):
+            chunks = output if buffer_size <= 0 else _abuffered_chunks(output, buffer_size, max_results)
+        else:
+            sync_chunks = _iterate_chunks(output)
+            if buffer_size > 0:
+                sync_chunks = _buffered_chunks(sync_chunks, buffer_size, max_results)
+            chunks = _athreaded_chunks(sync_chunks)
+        
+        delivered = 0
+        try:
+            async for chunk in chunks:
+                if first_result_ms is None:
+                    first_result_ms = (time.perf_counter() - start) * 1000
+                yield chunk
+                delivered += 1
+                if max_results is not None and delivered >= max_results:
+                    break
+        finally:
+            await chunks.aclose()
+            total_ms = (time.perf_counter() - start) * 1000
+            self.record_tool_usage(tool_id, total_ms,
+                                   first_result_ms if first_result_ms is not None else total_ms)
+    
+    def validate_parameters(self, tool_id: str, parameters: Dict[str, Any]) -> bool:
+        """
+        Validate call parameters against a tool's input schema.
+        
+        Tools that share a schema share one compiled validator.
+        
+        Args:
+            tool_id: The unique identifier of the tool
+            parameters: Keyword arguments intended for the handler
+            
+        Returns:
+            True if valid
+            
+        Raises:
+            ValueError: If the tool does not exist
+            jsonschema.exceptions.ValidationError: If the parameters are invalid
+        """
+        tool = self._tools.get(tool_id)
+        if tool is None:
+            raise ValueError(f"Tool not found (ID: {tool_id})")
+        self._schema_store.validator(tool["schema_hash"]).validate(parameters)
+        return True
+    
+    def get_schema_store_stats(self) -> Dict[str, Any]:
+        """
+        Get sharing statistics of the content-addressed schema store.
+        
+        Returns:
+            Dictionary with distinct entry counts, reference counts and compiled validators
+        """
+        return self._schema_store.stats()
+    
+    def set_profiler(self, profiler: Optional[Any]) -> None:
+        """
+        Attach a profiler to the invocation path, or detach it with None.
+        
+        The profiler must provide should_sample(tool_id) -> bool and a
+        profile(tool_id) context manager (see tool_profiler_example.py). Only
+        invoke_tool calls are sampled; streamed calls are not.
+        
+        Args:
+            profiler: The profiler to attach
+        """
+        self._profiler = profiler
+    
+    def set_tracer(self, tracer: Optional[Any]) -> None:
+        """
+        Attach a span tracer to the invocation path, or detach it with None.
+        
+        The tracer must provide a span(name, **attributes) context manager (see
+        tool_tracing_example.py). invoke_tool then records the dispatch, lookup,
+        validate, validator_cache, handler and metrics stages as nested spans.
+        
+        Args:
+            tracer: The tracer to attach
+        """
+        self._tracer = tracer
+    
+    def get_pool_stats(self, tool_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get handler pool statistics for a lifecycle-aware tool.
+        
+        Args:
+            tool_id: The unique identifier of the tool
+            
+        Returns:
+            Pool statistics if the tool uses a handler pool, None otherwise
+        """
+        pool = self._pools.get(tool_id)
+        return pool.stats() if pool else None
+    
+    def maintain_pools(self) -> None:
+        """Evict idle handler instances and refill pools to their minimum size."""
+        for pool in list(self._pools.values()):
+            pool.maintain()
+    
+    def shutdown(self) -> None:
+        """Tear down every pooled handler instance."""
+        for pool in list(self._pools.values()):
+            pool.close()
+        logger.info("Tool Registry shut down")
+    
+    def export_catalog(self) -> Dict[str, Any]:
+        """
+        Export every tool record (without handlers) together with the catalog revision.
+        
+        The records and the revision are captured atomically, so a consumer can
+        load the export and then apply changes_since(export["revision"]).
+        
+        Returns:
+            Dictionary with "revision" and "tools" (list of tool records)
+        """
+        with self._lock:
+            return {
+                "revision": self._revision,
+                "tools": [self.get_tool(tool_id) for tool_id in self._tools]
+            }
+    
+    def save_snapshot(self, path: str) -> None:
+        """
+        Write the catalog to a snapshot file for fast startup with from_snapshot().
+        
+        The snapshot holds the exported tool records, whose schemas have already
+        passed the meta-schema check. It is written to a temporary file and
+        renamed into place, so readers never see a partial snapshot.
+        
+        Args:
+            path: Snapshot file
+            
+        Raises:
+            ValueError: If a tool's handler cannot be imported by another process
+                (defined in __main__, a lambda or a nested function)
+        """
+        with self._lock:
+            snapshot = self.export_catalog()
+            snapshot["tool_revisions"] = dict(self._tool_revisions)
+        for record in snapshot["tools"]:
+            _check_handler_reference(record["name"], record["handler_ref"])
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "w") as f:
+            json.dump(snapshot, f, separators=(",", ":"))
+        os.replace(temp_path, path)
+        logger.info(f"Catalog snapshot saved: {len(snapshot['tools'])} tools at revision {snapshot['revision']}")
+    
+    @classmethod
+    def from_snapshot(cls, 
+                      path: str,
+                      handler_resolver: Optional[Callable[[Dict[str, Any]], Callable]] = None,
+                      change_log_size: int = 10000) -> "ToolRegistry":
+        """
+        Create a registry from a snapshot written by save_snapshot().
+        
+        Startup skips schema meta-validation, and with it the jsonschema import,
+        and does not import any handler: each tool's handler is resolved from its
+        handler_ref the first time the tool is dispatched. Tool IDs, usage metrics,
+        enabled state and the catalog revision are restored, so a process started
+        from a snapshot can follow the source registry with changes_since().
+        ToolHandler subclasses get a HandlerPool with default options.
+        
+        Args:
+            path: Snapshot file
+            handler_resolver: Returns the handler for a tool record (defaults to
+                importing the record's handler_ref)
+            change_log_size: Number of change events retained for changes_since()
+            
+        Returns:
+            The restored registry
+        """
+        with open(path) as f:
+            snapshot = json.load(f)
+        
+        registry = cls(change_log_size=change_log_size)
+        if handler_resolver is not None:
+            registry._handler_resolver = handler_resolver
+        with registry._lock:
+            for record in snapshot["tools"]:
+                tool = dict(record, handler=None)
+                tool["schema_hash"], tool["schema"] = registry._schema_store.intern_schema(
+                    record["schema"], validated=True)
+                tool["examples_hash"], tool["examples"] = registry._schema_store.intern(record["examples"])
+                tool_id = tool["id"]
+                registry._tools[tool_id] = tool
+                registry._tool_slots[tool_id] = len(registry._tool_order)
+                registry._tool_order.append(tool_id)
+                registry._tool_revisions[tool_id] = snapshot["tool_revisions"].get(tool_id, snapshot["revision"])
+                registry._index_permissions(tool_id)
+            registry._revision = snapshot["revision"]
+        logger.info(f"Catalog snapshot loaded: {len(snapshot['tools'])} tools at revision {snapshot['revision']}")
+        return registry
+    
+    @property
+    def revision(self) -> int:
+        """Catalog revision; increases whenever a tool is registered, updated, enabled or disabled."""
+        return self._revision
+    
+    def get_tool_revisions(self) -> Dict[str, int]:
+        """
+        Get the catalog revision at which each tool last changed.
+        
+        Usage metrics do not count as changes.
+        
+        Returns:
+            Dictionary mapping tool IDs to revisions, in registration order
+        """
+        with self._lock:
+            return dict(self._tool_revisions)
+    
+    def changes_since(self, revision: int) -> List[Dict[str, Any]]:
+        """
+        Get the change events recorded after a catalog revision.
+        
+        Each event has the new revision, a type ("registered", "updated",
+        "enabled" or "disabled"), the tool_id and the changed fields; for
+        "registered" the fields are the full tool record without its handler.
+        Events are shared with other consumers and must be treated as read-only.
+        
+        Args:
+            revision: Last revision the caller has applied (0 for everything)
+            
+        Returns:
+            Events with a revision greater than the given one, oldest first
+            
+        Raises:
+            ChangeLogTruncatedError: If events after the revision were already
+                discarded; the caller must resynchronize from list_tools()
+        """
+        with self._lock:
+            if revision >= self._revision:
+                return []
+            oldest = self._change_log[0]["revision"] if self._change_log else self._revision + 1
+            if revision + 1 < oldest:
+                raise ChangeLogTruncatedError(
+                    f"Changes after revision {revision} are no longer retained (oldest: {oldest})")
+            # Revisions are contiguous, so the position in the log follows from the revision
+            return list(itertools.islice(self._change_log, revision + 1 - oldest, None))
+    
+    async def watch(self, since: Optional[int] = None, max_pending: int = 1000) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Subscribe to change events as an async iterator.
+        
+        Mutations may happen on any thread; events are handed to the
+        subscriber's event loop. A subscriber that falls more than max_pending
+        events behind catches up from the change log instead of buffering
+        without bound.
+        
+        Args:
+            since: Also replay events after this revision before live ones
+                (None starts at the current revision)
+            max_pending: Maximum events buffered for this subscriber
+            
+        Yields:
+            Change events in revision order (see changes_since)
+            
+        Raises:
+            ChangeLogTruncatedError: If a replay or catch-up is no longer possible
+        """
+        import asyncio
+        
+        watcher = {
+            "loop": asyncio.get_running_loop(),
+            "queue": asyncio.Queue(maxsize=max_pending),
+            "overflowed": False
+        }
+        with self._lock:
+            self._watchers.append(watcher)
+            last_revision = self._revision if since is None else since
+        try:
+            for event in self.changes_since(last_revision):
+                last_revision = event["revision"]
+                yield event
+            while True:
+                event = await watcher["queue"].get()
+                if watcher["overflowed"]:
+                    # Live events were dropped, so replay the gap from the log
+                    watcher["overflowed"] = False
+                    while not watcher["queue"].empty():
+                        watcher["queue"].get_nowait()
+                    for missed in self.changes_since(last_revision):
+                        last_revision = missed["revision"]
+                        yield missed
+                    continue
+                if event["revision"] <= last_revision:
+                    continue
+                last_revision = event["revision"]
+                yield event
+        finally:
+            with self._lock:
+                self._watchers.remove(watcher)
+    
+    def is_tool_allowed(self, 
+                        tool_id: str, 
+                        permission_level: ToolPermissionLevel,
+                        categories: Optional[List[ToolCategory]] = None) -> bool:
+        """
+        Check whether a session may call a tool.
+        
+        The session's allowed set is computed once per catalog revision, after
+        which each check is a single bit test.
+        
+        Args:
+            tool_id: The unique identifier of the tool
+            permission_level: Maximum permission level of the session
+            categories: Categories the session may use (None allows all)
+            
+        Returns:
+            True if the tool exists, is enabled and is within the session's permissions
+        """
+        slot = self._tool_slots.get(tool_id)
+        if slot is None:
+            return False
+        allowed = self._allowed_bits(permission_level, categories)
+        return (slot >> 3) < len(allowed) and (allowed[slot >> 3] >> (slot & 7)) & 1 == 1
+    
+    def get_allowed_tool_ids(self, 
+                             permission_level: ToolPermissionLevel,
+                             categories: Optional[List[ToolCategory]] = None) -> List[str]:
+        """
+        Get the IDs of the enabled tools a session may call.
+        
+        Args:
+            permission_level: Maximum permission level of the session
+            categories: Categories the session may use (None allows all)
+            
+        Returns:
+            Tool IDs in registration order
+        """
+        allowed = self._allowed_bits(permission_level, categories)
+        order = self._tool_order
+        return [order[index * 8 + bit]
+                for index, byte in enumerate(allowed) if byte
+                for bit in range(8) if (byte >> bit) & 1]
+    
+    def _allowed_bits(self, 
+                      permission_level: ToolPermissionLevel, 
+                      categories: Optional[List[ToolCategory]]) -> bytes:
+        """Get (building and caching if needed) the allowed-tool bitset for a session profile."""
+        key = (permission_level.value,
+               None if categories is None else frozenset(category.value for category in categories))
+        if self._allowed_cache_revision == self._revision:
+            allowed = self._allowed_cache.get(key)
+            if allowed is not None:
+                return allowed
+        
+        with self._lock:
+            if self._allowed_cache_revision != self._revision:
+                self._allowed_cache.clear()
+                self._allowed_cache_revision = self._revision
+            allowed = self._allowed_cache.get(key)
+            if allowed is None:
+                length = len(self._enabled_bits)
+                levels = 0
+                for level, bits in self._level_bits.items():
+                    if level <= key[0]:
+                        levels |= int.from_bytes(bits, "little")
+                mask = levels & int.from_bytes(self._enabled_bits, "little")
+                if key[1] is not None:
+                    kinds = 0
+                    for category in key[1]:
+                        kinds |= int.from_bytes(self._category_bits.get(category, b""), "little")
+                    mask &= kinds
+                allowed = mask.to_bytes(length, "little")
+                self._allowed_cache[key] = allowed
+            return allowed
+    
+    def _index_permissions(self, tool_id: str) -> None:
+        """Update a tool's bits in the permission bitsets from its record. Caller holds the lock."""
+        slot = self._tool_slots[tool_id]
+        tool = self._tools[tool_id]
+        level = getattr(tool["permission_level"], "value", tool["permission_level"])
+        category = getattr(tool["category"], "value", tool["category"])
+        for value, bits in self._level_bits.items():
+            _set_bit(bits, slot, value == level)
+        for value, bits in self._category_bits.items():
+            _set_bit(bits, slot, value == category)
+        _set_bit(self._enabled_bits, slot, tool.get("is_enabled", True))
+    
+    def _mark_changed(self, tool_id: str, change_type: str, changes: Dict[str, Any]) -> None:
+        """Advance the catalog revision, log the change and notify watchers."""
+        with self._lock:
+            self._index_permissions(tool_id)
+            self._revision += 1
+            self._tool_revisions[tool_id] = self._revision
+            event = {
+                "revision": self._revision,
+                "type": change_type,
+                "tool_id": tool_id,
+                "changes": changes
+            }
+            self._change_log.append(event)
+            watchers = list(self._watchers)
+        
+        for watcher in watchers:
+            try:
+                watcher["loop"].call_soon_threadsafe(_deliver_change, watcher, event)
+            except RuntimeError:
+                # The subscriber's event loop has been closed
+                pass
+    
+    def _get_enabled_tool(self, tool_id: str) -> Dict[str, Any]:
+        """Look up a tool record for dispatch, rejecting unknown or disabled tools."""
+        tool = self._tools.get(tool_id)
+        if tool is None:
+            raise ValueError(f"Tool not found (ID: {tool_id})")
+        if not tool.get("is_enabled", True):
+            raise ValueError(f"Tool is disabled (ID: {tool_id})")
+        if tool["handler"] is None:
+            self._resolve_handler(tool)
+        return tool
+    
+    def _resolve_handler(self, tool: Dict[str, Any]) -> Callable:
+        """Import the handler of a tool loaded from a snapshot on its first dispatch."""
+        handler = tool["handler"]
+        if handler is None:
+            with self._lock:
+                handler = tool["handler"]
+                if handler is None:
+                    handler = self._prepare_handler(tool["id"], self._handler_resolver(tool))
+                    tool["handler"] = handler
+        return handler
+    
+    def _stream_results(self, 
+                        tool_id: str, 
+                        handler: Callable,
+                        parameters: Dict[str, Any],
+                        buffer_size: int) -> Iterator[Any]:
+        """Drive a handler's output to the consumer and record streaming metrics."""
+        max_results = parameters.get("max_results")
+        start = time.perf_counter()
+        first_result_ms = None
+        chunks = _iterate_chunks(handler(**parameters))
+        if buffer_size > 0:
+            chunks = _buffered_chunks(chunks, buffer_size, max_results)
+        
+        delivered = 0
+        try:
+            for chunk in chunks:
+                if first_result_ms is None:
+                    first_result_ms = (time.perf_counter() - start) * 1000
+                yield chunk
+                delivered += 1
+                if max_results is not None and delivered >= max_results:
+                    break
+        finally:
+            # Closing stops the handler early when the consumer is done
+            chunks.close()
+            total_ms = (time.perf_counter() - start) * 1000
+            self.record_tool_usage(tool_id, total_ms,
+                                   first_result_ms if first_result_ms is not None else total_ms)
     
     def list_tools(self, 
                   category: Optional[ToolCategory] = None, 
@@ -164,25 +857,59 @@ class ToolRegistry:
         Returns:
             List of tool records matching the filters
         """
-        results = []
+        return list(self.iter_tools(category, permission_level, enabled_only))
+    
+    def iter_tools(self, 
+                   category: Optional[ToolCategory] = None, 
+                   permission_level: Optional[ToolPermissionLevel] = None,
+                   enabled_only: bool = True) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily iterate over tools in registration order, with the same filters as list_tools.
         
-        for tool in self._tools.values():
-            # Apply filters
-            if enabled_only and not tool.get("is_enabled", True):
-                continue
-                
-            if category and tool.get("category") != category.value:
-                continue
-                
-            if permission_level and tool.get("permission_level", 0) > permission_level.value:
-                continue
+        Tools registered while iterating are included.
+        
+        Args:
+            category: Filter tools by category
+            permission_level: Filter tools by maximum permission level
+            enabled_only: Only include enabled tools
             
-            # Create a copy without the handler function
-            tool_copy = tool.copy()
-            tool_copy.pop("handler", None)
-            results.append(tool_copy)
+        Yields:
+            Tool records matching the filters
+        """
+        matches = self._tool_filter(category, permission_level, enabled_only)
+        for _, tool in self._scan(0, matches):
+            yield tool
+    
+    def list_tools_page(self, 
+                        category: Optional[ToolCategory] = None, 
+                        permission_level: Optional[ToolPermissionLevel] = None,
+                        enabled_only: bool = True,
+                        limit: int = 50,
+                        cursor: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Get one page of list_tools results.
+        
+        Cursors are registration positions, which stay valid as the catalog
+        changes: tools registered mid-pagination appear on later pages, and
+        changes_since(revision) reports updates to pages already fetched.
+        
+        Args:
+            category: Filter tools by category
+            permission_level: Filter tools by maximum permission level
+            enabled_only: Only include enabled tools
+            limit: Maximum number of tools in the page
+            cursor: next_cursor from the previous page, or None for the first page
+            
+        Returns:
+            Dictionary with "tools", "next_cursor" (None after the last page) and
+            "revision" (the catalog revision the pagination started at)
             
-        return results
+        Raises:
+            InvalidCursorError: If the cursor is malformed or was issued for other filters
+        """
+        query = ["list", category.value if category else None,
+                 permission_level.value if permission_level else None, enabled_only]
+        return self._page(query, self._tool_filter(category, permission_level, enabled_only), limit, cursor)
     
     def search_tools(self, query: str) -> List[Dict[str, Any]]:
         """
@@ -194,20 +921,99 @@ class ToolRegistry:
         Returns:
             List of tool records matching the search query
         """
+        return list(self.iter_search(query))
+    
+    def iter_search(self, query: str) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily iterate over tools whose name or description contains the query.
+        
+        Args:
+            query: Search query string
+            
+        Yields:
+            Tool records matching the search query, in registration order
+        """
+        for _, tool in self._scan(0, self._search_filter(query)):
+            yield tool
+    
+    def search_tools_page(self, query: str, limit: int = 50, cursor: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Get one page of search_tools results.
+        
+        Args:
+            query: Search query string
+            limit: Maximum number of tools in the page
+            cursor: next_cursor from the previous page, or None for the first page
+            
+        Returns:
+            Dictionary with "tools", "next_cursor" and "revision", as for list_tools_page
+            
+        Raises:
+            InvalidCursorError: If the cursor is malformed or was issued for another query
+        """
+        return self._page(["search", query.lower()], self._search_filter(query), limit, cursor)
+    
+    @staticmethod
+    def _tool_filter(category: Optional[ToolCategory],
+                     permission_level: Optional[ToolPermissionLevel],
+                     enabled_only: bool) -> Callable[[Dict[str, Any]], bool]:
+        """Build the list_tools predicate."""
+        def matches(tool: Dict[str, Any]) -> bool:
+            if enabled_only and not tool.get("is_enabled", True):
+                return False
+            if category and tool.get("category") != category.value:
+                return False
+            if permission_level and tool.get("permission_level", 0) > permission_level.value:
+                return False
+            return True
+        return matches
+    
+    @staticmethod
+    def _search_filter(query: str) -> Callable[[Dict[str, Any]], bool]:
+        """Build the search_tools predicate (case-insensitive substring match)."""
         query = query.lower()
-        results = []
-        
-        for tool in self._tools.values():
-            # Simple search implementation
-            if (query in tool.get("name", "").lower() or 
-                query in tool.get("description", "").lower()):
-                
-                # Create a copy without the handler function
+        return lambda tool: (query in tool.get("name", "").lower() or
+                             query in tool.get("description", "").lower())
+    
+    def _scan(self, position: int, matches: Callable[[Dict[str, Any]], bool]) -> Iterator[tuple]:
+        """Yield (position, tool copy without handler) for matching tools from a registration position."""
+        order = self._tool_order
+        while position < len(order):
+            tool = self._tools[order[position]]
+            if matches(tool):
                 tool_copy = tool.copy()
                 tool_copy.pop("handler", None)
-                results.append(tool_copy)
-                
-        return results
+                yield position, tool_copy
+            position += 1
+    
+    def _page(self, 
+              query: List[Any], 
+              matches: Callable[[Dict[str, Any]], bool],
+              limit: int,
+              cursor: Optional[str]) -> Dict[str, Any]:
+        """Collect one page of a scan and issue the cursor for the next one."""
+        if limit < 1:
+            raise ValueError("Page limit must be at least 1")
+        if cursor is None:
+            position, revision = 0, self._revision
+        else:
+            position, revision = _decode_cursor(cursor, query)
+        
+        tools = []
+        for position, tool in self._scan(position, matches):
+            tools.append(tool)
+            if len(tools) == limit:
+                position += 1
+                break
+        else:
+            position = len(self._tool_order)
+        
+        # A full page may be followed by an empty one; scanning ahead to rule
+        # that out would cost up to the rest of the catalog
+        next_cursor = None
+        if len(tools) == limit and position < len(self._tool_order):
+            next_cursor = _encode_cursor(position, revision, query)
+        return {"tools": tools, "next_cursor": next_cursor, "revision": revision}
     
     def update_tool_metadata(self, tool_id: str, metadata: Dict[str, Any]) -> bool:
         """
@@ -225,11 +1031,25 @@ class ToolRegistry:
             return False
             
         # Prevent updating critical fields
-        protected_fields = {"id", "handler", "registration_time"}
+        protected_fields = {"id", "handler", "handler_ref", "registration_time", "schema_hash", "examples_hash"}
         update_fields = {k: v for k, v in metadata.items() if k not in protected_fields}
         
-        # Update the tool record
-        self._tools[tool_id].update(update_fields)
+        # Replacement schemas and examples go through the content-addressed store
+        if "schema" in update_fields:
+            update_fields["schema_hash"], update_fields["schema"] = (
+                self._schema_store.intern_schema(update_fields["schema"]))
+        if "examples" in update_fields:
+            update_fields["examples_hash"], update_fields["examples"] = (
+                self._schema_store.intern(update_fields["examples"] or []))
+        
+        # Update the tool record, releasing the schema and examples it replaces
+        with self._lock:
+            tool = self._tools[tool_id]
+            replaced = [tool[field] for field in ("schema_hash", "examples_hash") if field in update_fields]
+            tool.update(update_fields)
+            for value_hash in replaced:
+                self._schema_store.release(value_hash)
+            self._mark_changed(tool_id, "updated", update_fields)
         logger.info(f"Tool metadata updated: {tool_id}")
         
         return True
@@ -247,7 +1067,9 @@ class ToolRegistry:
         if tool_id not in self._tools:
             return False
             
-        self._tools[tool_id]["is_enabled"] = False
+        with self._lock:
+            self._tools[tool_id]["is_enabled"] = False
+            self._mark_changed(tool_id, "disabled", {"is_enabled": False})
         logger.info(f"Tool disabled: {tool_id}")
         
         return True
@@ -265,35 +1087,183 @@ class ToolRegistry:
         if tool_id not in self._tools:
             return False
             
-        self._tools[tool_id]["is_enabled"] = True
+        with self._lock:
+            self._tools[tool_id]["is_enabled"] = True
+            self._mark_changed(tool_id, "enabled", {"is_enabled": True})
         logger.info(f"Tool enabled: {tool_id}")
         
         return True
     
-    def record_tool_usage(self, tool_id: str, execution_time_ms: float) -> None:
+    def record_tool_usage(self, 
+                          tool_id: str, 
+                          execution_time_ms: float,
+                          time_to_first_result_ms: Optional[float] = None) -> None:
         """
         Record usage metrics for a tool.
         
         Args:
             tool_id: The unique identifier of the tool
             execution_time_ms: Execution time in milliseconds
+            time_to_first_result_ms: Time until the first result chunk was
+                delivered; defaults to the execution time for non-streamed calls
         """
         if tool_id not in self._tools:
             return
             
-        tool = self._tools[tool_id]
+        with self._lock:
+            tool = self._tools[tool_id]
+            
+            # Update usage count
+            usage_count = tool["usage_count"] + 1
+            
+            # Update average execution time
+            current_avg = tool["average_execution_time_ms"]
+            new_avg = ((current_avg * (usage_count - 1)) + execution_time_ms) / usage_count
+            
+            # Update average time to first result
+            if time_to_first_result_ms is None:
+                time_to_first_result_ms = execution_time_ms
+            current_ttfr = tool["average_time_to_first_result_ms"]
+            new_ttfr = ((current_ttfr * (usage_count - 1)) + time_to_first_result_ms) / usage_count
+            
+            # Store updated metrics
+            tool["usage_count"] = usage_count
+            tool["average_execution_time_ms"] = new_avg
+            tool["average_time_to_first_result_ms"] = new_ttfr
+            tool["last_used"] = datetime.utcnow().isoformat()
+    
+    def merge_usage_metrics(self, 
+                            tool_id: str, 
+                            usage_count: int,
+                            total_execution_time_ms: float,
+                            total_time_to_first_result_ms: Optional[float] = None,
+                            last_used: Optional[str] = None) -> bool:
+        """
+        Merge usage metrics aggregated elsewhere (e.g. on a replica) into a tool's metrics.
         
-        # Update usage count
-        usage_count = tool["usage_count"] + 1
+        Args:
+            tool_id: The unique identifier of the tool
+            usage_count: Number of calls being merged
+            total_execution_time_ms: Summed execution time of those calls
+            total_time_to_first_result_ms: Summed time to first result (defaults
+                to the execution time)
+            last_used: ISO timestamp of the most recent merged call
+            
+        Returns:
+            True if the metrics were merged, False if the tool does not exist
+        """
+        if tool_id not in self._tools:
+            return False
+        if usage_count <= 0:
+            return True
+        if total_time_to_first_result_ms is None:
+            total_time_to_first_result_ms = total_execution_time_ms
+            
+        with self._lock:
+            tool = self._tools[tool_id]
+            previous_count = tool["usage_count"]
+            merged_count = previous_count + usage_count
+            tool["average_execution_time_ms"] = (
+                tool["average_execution_time_ms"] * previous_count + total_execution_time_ms) / merged_count
+            tool["average_time_to_first_result_ms"] = (
+                tool["average_time_to_first_result_ms"] * previous_count
+                + total_time_to_first_result_ms) / merged_count
+            tool["usage_count"] = merged_count
+            if last_used and last_used > tool.get("last_used", ""):
+                tool["last_used"] = last_used
+        return True
+
+
+def _handler_reference(handler: Any) -> str:
+    """Describe a handler as "module:qualname" so other processes can resolve it."""
+    module = getattr(handler, "__module__", None) or type(handler).__module__
+    qualname = getattr(handler, "__qualname__", None) or type(handler).__qualname__
+    return f"{module}:{qualname}"
+
+
+def resolve_handler_reference(reference: str) -> Callable:
+    """
+    Import the handler named by a "module:qualname" reference.
+    
+    Args:
+        reference: Value of a tool record's handler_ref field
         
-        # Update average execution time
-        current_avg = tool["average_execution_time_ms"]
-        new_avg = ((current_avg * (usage_count - 1)) + execution_time_ms) / usage_count
+    Returns:
+        The handler function or ToolHandler subclass
         
-        # Store updated metrics
-        tool["usage_count"] = usage_count
-        tool["average_execution_time_ms"] = new_avg
-        tool["last_used"] = datetime.utcnow().isoformat()
+    Raises:
+        ImportError: If the module cannot be imported
+        AttributeError: If the module has no such attribute
+    """
+    import importlib
+    
+    module_name, _, qualname = reference.partition(":")
+    target: Any = importlib.import_module(module_name)
+    for part in qualname.split("."):
+        target = getattr(target, part)
+    return target
+
+
+def _check_handler_reference(tool_name: str, reference: str) -> None:
+    """Raise ValueError unless a handler reference can be resolved in a new process."""
+    module_name, _, qualname = reference.partition(":")
+    if module_name == "__main__" or "<lambda>" in qualname or "<locals>" in qualname:
+        raise ValueError(f"Handler of tool {tool_name} ({reference}) is not importable from another process; "
+                         f"define it at module level in an importable module")
+    try:
+        resolve_handler_reference(reference)
+    except (ImportError, AttributeError) as e:
+        raise ValueError(f"Handler of tool {tool_name} ({reference}) cannot be resolved: {e}") from e
+
+
+def _set_bit(bits: bytearray, slot: int, value: bool) -> None:
+    """Set or clear one slot's bit in a growable bitset."""
+    index = slot >> 3
+    if index >= len(bits):
+        bits.extend(bytes(index + 1 - len(bits)))
+    if value:
+        bits[index] |= 1 << (slot & 7)
+    else:
+        bits[index] &= ~(1 << (slot & 7)) & 0xFF
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor is malformed or used with a different query."""
+
+
+def _encode_cursor(position: int, revision: int, query: List[Any]) -> str:
+    """Build an opaque pagination cursor."""
+    payload = {"p": position, "r": revision, "q": query}
+    return base64.urlsafe_b64encode(json.dumps(payload, separators=(",", ":")).encode("utf-8")).decode("ascii")
+
+
+def _decode_cursor(cursor: str, query: List[Any]) -> tuple:
+    """Decode a pagination cursor into (position, revision), checking it belongs to the query."""
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        position, revision, cursor_query = payload["p"], payload["r"], payload["q"]
+    except (ValueError, TypeError, KeyError) as e:
+        raise InvalidCursorError(f"Malformed cursor: {cursor!r}") from e
+    if cursor_query != query or not isinstance(position, int) or position < 0:
+        raise InvalidCursorError("Cursor was issued for a different query")
+    return position, revision
+
+
+class ChangeLogTruncatedError(Exception):
+    """Raised when requested change events have already been dropped from the change log."""
+
+
+def _deliver_change(watcher: Dict[str, Any], event: Dict[str, Any]) -> None:
+    """Queue a change event for a watcher; runs on the watcher's event loop."""
+    import asyncio
+    
+    try:
+        watcher["queue"].put_nowait(event)
+    except asyncio.QueueFull:
+        # Queue full: the watcher replays the gap from the change log instead
+        watcher["overflowed"] = True
+        watcher["queue"].get_nowait()
+        watcher["queue"].put_nowait(event)
 
 
 class ToolSchemaValidator:
@@ -304,6 +1274,7 @@ class ToolSchemaValidator:
     
     def __init__(self):
         """Initialize the schema validator with the meta-schema for tool definitions."""
+        self._meta_validator = None
         # Meta-schema defining what a valid tool schema looks like
         self.tool_meta_schema = {
             "type": "object",
@@ -351,27 +1322,659 @@ class ToolSchemaValidator:
         Raises:
             jsonschema.exceptions.ValidationError: If the schema is invalid
         """
-        jsonschema.validate(schema, self.tool_meta_schema)
+        if self._meta_validator is None:
+            # jsonschema is imported on first use, so processes that only dispatch never load it
+            import jsonschema
+            
+            validator_class = jsonschema.validators.validator_for(self.tool_meta_schema)
+            self._meta_validator = validator_class(self.tool_meta_schema)
+        self._meta_validator.validate(schema)
         logger.debug("Tool schema validated successfully")
         return True
 
 
+class _FrozenDict(dict):
+    """Read-only dict shared between tool records; still serializable with json, copy and pickle."""
+    
+    def _readonly(self, *args: Any, **kwargs: Any) -> None:
+        raise TypeError("Interned schemas and examples are immutable")
+    
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+    
+    def __reduce__(self) -> tuple:
+        # The default dict-subclass protocol rebuilds the copy through __setitem__
+        return _FrozenDict, (dict(self),)
+    
+    def __copy__(self) -> "_FrozenDict":
+        return self
+    
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "_FrozenDict":
+        # Frozen values are immutable all the way down, like tuples of tuples
+        return self
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively convert dicts and lists into their immutable counterparts."""
+    if isinstance(value, dict):
+        return _FrozenDict((key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """Recursively convert frozen values back into plain dicts and lists."""
+    if isinstance(value, dict):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_thaw(item) for item in value]
+    return value
+
+
+class ToolSchemaStore:
+    """
+    Content-addressed store for tool schemas and example blocks.
+    
+    Values are identified by the SHA-256 of their canonical JSON form (sorted
+    keys, no insignificant whitespace), so schemas that differ only in key order
+    or formatting share one immutable copy. Schemas are checked against the
+    meta-schema once per hash, and the compiled parameter validator for a hash
+    is built once and reused by every tool that references it. Entries are
+    reference counted and dropped, with their validators, once no tool uses them.
+    """
+    
+    def __init__(self, schema_validator: ToolSchemaValidator):
+        """
+        Initialize an empty store.
+        
+        Args:
+            schema_validator: Meta-schema validator applied to new schemas
+        """
+        self._schema_validator = schema_validator
+        self._values: Dict[str, Any] = {}
+        self._references: Dict[str, int] = {}
+        self._validated: set = set()
+        self._validators: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def content_hash(value: Any) -> str:
+        """
+        Compute the content address of a JSON-compatible value.
+        
+        Args:
+            value: Schema, example block or other JSON-compatible value
+            
+        Returns:
+            Hex SHA-256 digest of the canonical JSON form
+        """
+        canonical = json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+    
+    def intern(self, value: Any) -> tuple:
+        """
+        Store a value, returning the shared immutable copy for its content.
+        
+        Args:
+            value: JSON-compatible value
+            
+        Returns:
+            Tuple of (content hash, shared immutable value)
+        """
+        value_hash = self.content_hash(value)
+        with self._lock:
+            shared = self._values.get(value_hash)
+            if shared is None:
+                shared = _freeze(value)
+                self._values[value_hash] = shared
+            self._references[value_hash] = self._references.get(value_hash, 0) + 1
+        return value_hash, shared
+    
+    def intern_schema(self, schema: Dict[str, Any], validated: bool = False) -> tuple:
+        """
+        Validate (once per distinct content) and store a tool schema.
+        
+        Args:
+            schema: Tool input schema
+            validated: Skip the meta-schema check for a schema that already
+                passed it (e.g. one loaded from a registry snapshot)
+            
+        Returns:
+            Tuple of (content hash, shared immutable schema)
+            
+        Raises:
+            jsonschema.exceptions.ValidationError: If the schema is invalid
+        """
+        schema_hash = self.content_hash(schema)
+        if validated:
+            self._validated.add(schema_hash)
+        elif schema_hash not in self._validated:
+            self._schema_validator.validate_tool_schema(_thaw(schema))
+            self._validated.add(schema_hash)
+        return self.intern(schema)
+    
+    def release(self, value_hash: str) -> None:
+        """
+        Drop one reference to a stored value, forgetting it when none remain.
+        
+        Args:
+            value_hash: Content hash returned by intern()
+        """
+        with self._lock:
+            remaining = self._references.get(value_hash, 0) - 1
+            if remaining > 0:
+                self._references[value_hash] = remaining
+                return
+            self._references.pop(value_hash, None)
+            self._values.pop(value_hash, None)
+            self._validators.pop(value_hash, None)
+            self._validated.discard(value_hash)
+    
+    def get(self, value_hash: str) -> Optional[Any]:
+        """
+        Look up a stored value by its content hash.
+        
+        Args:
+            value_hash: Content hash returned by intern()
+            
+        Returns:
+            The shared immutable value, or None if unknown
+        """
+        return self._values.get(value_hash)
+    
+    def validator(self, schema_hash: str) -> Any:
+        """
+        Get the compiled parameter validator for a stored schema.
+        
+        Args:
+            schema_hash: Content hash of the schema
+            
+        Returns:
+            A jsonschema validator instance shared by all tools with this schema
+        """
+        validator = self._validators.get(schema_hash)
+        if validator is None:
+            # jsonschema treats only lists as arrays, so compile from a mutable copy
+            import jsonschema
+            
+            schema = _thaw(self._values[schema_hash])
+            validator = jsonschema.validators.validator_for(schema)(schema)
+            self._validators[schema_hash] = validator
+        return validator
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get sharing statistics.
+        
+        Returns:
+            Dictionary with distinct entries, total references and compiled validators
+        """
+        with self._lock:
+            references = sum(self._references.values())
+            return {
+                "distinct_entries": len(self._values),
+                "references": references,
+                "shared_references": references - len(self._values),
+                "compiled_validators": len(self._validators)
+            }
+
+
+class ToolHandler:
+    """
+    Base class for tool handlers that own expensive resources.
+    
+    Subclasses registered with ToolRegistry.register_tool are instantiated and
+    set up once per pool slot, then reused across invocations:
+    - setup() builds resources such as parsers, indexes or connections
+    - call_context() wraps each invocation (e.g. a transaction or cursor)
+    - __call__() implements the tool itself
+    - health_check() reports whether the instance can still be used
+    - teardown() releases resources when the instance is evicted
+    """
+    
+    def setup(self) -> None:
+        """Build the resources this handler reuses across calls."""
+    
+    def call_context(self) -> ContextManager:
+        """Return a context manager wrapped around each invocation."""
+        return contextlib.nullcontext()
+    
+    def __call__(self, **parameters: Any) -> Any:
+        """Execute the tool."""
+        raise NotImplementedError
+    
+    def health_check(self) -> bool:
+        """Return False if the instance should be discarded."""
+        return True
+    
+    def teardown(self) -> None:
+        """Release the resources built by setup()."""
+
+
+class HandlerPool:
+    """
+    Pool of warmed ToolHandler instances for a single tool.
+    
+    Idle instances are reused most-recently-used first, so a burst warms the
+    pool and a quiet period lets the surplus age out. Instances idle for longer
+    than idle_timeout_s are torn down while the pool stays above min_size, and
+    idle instances are health-checked before reuse at most once per
+    health_check_interval_s (or always after a failed call).
+    """
+    
+    def __init__(self,
+                 handler_class: Type[ToolHandler],
+                 min_size: int = 1,
+                 max_size: int = 4,
+                 idle_timeout_s: float = 300.0,
+                 health_check_interval_s: float = 30.0,
+                 acquire_timeout_s: Optional[float] = None):
+        """
+        Initialize the pool and warm min_size instances.
+        
+        Args:
+            handler_class: ToolHandler subclass to instantiate
+            min_size: Number of instances kept warm
+            max_size: Maximum number of concurrent instances
+            idle_timeout_s: Idle time after which surplus instances are evicted
+            health_check_interval_s: Minimum time between health checks of an instance
+            acquire_timeout_s: Maximum wait for a free instance (None waits forever)
+        """
+        if not 0 <= min_size <= max_size or max_size < 1:
+            raise ValueError("Pool sizes must satisfy 0 <= min_size <= max_size and max_size >= 1")
+        self._handler_class = handler_class
+        self._min_size = min_size
+        self._max_size = max_size
+        self._idle_timeout_s = idle_timeout_s
+        self._health_check_interval_s = health_check_interval_s
+        self._acquire_timeout_s = acquire_timeout_s
+        
+        # Idle entries are [instance, last_used, last_checked]
+        self._idle: List[List[Any]] = []
+        self._size = 0
+        self._closed = False
+        self._stats = {"created": 0, "reused": 0, "evicted": 0, "unhealthy": 0}
+        self._condition = threading.Condition()
+        self.maintain()
+    
+    def __call__(self, **parameters: Any) -> Any:
+        """Invoke the tool on a pooled instance."""
+        instance = self.acquire()
+        try:
+            context = instance.call_context()
+            context.__enter__()
+        except BaseException:
+            self.release(instance, failed=True)
+            raise
+        
+        try:
+            result = instance(**parameters)
+        except BaseException:
+            self.release(instance, failed=True)
+            if not context.__exit__(*sys.exc_info()):
+                raise
+            return None
+        
+        # Streaming results keep the instance leased until the stream is closed
+        if isinstance(result, types.AsyncGeneratorType):
+            return self._aleased_stream(instance, context, result)
+        if isinstance(result, types.GeneratorType):
+            return self._leased_stream(instance, context, result)
+        context.__exit__(None, None, None)
+        self.release(instance)
+        return result
+    
+    def acquire(self) -> ToolHandler:
+        """
+        Lease an instance, creating one if the pool is below max_size.
+        
+        Returns:
+            A set-up, healthy handler instance
+            
+        Raises:
+            TimeoutError: If no instance became available within acquire_timeout_s
+        """
+        deadline = None if self._acquire_timeout_s is None else time.monotonic() + self._acquire_timeout_s
+        while True:
+            with self._condition:
+                candidate = None
+                while candidate is None:
+                    if self._closed:
+                        raise RuntimeError("Handler pool is closed")
+                    if self._idle:
+                        candidate = self._idle.pop()
+                    elif self._size < self._max_size:
+                        self._size += 1
+                        break
+                    else:
+                        remaining = None if deadline is None else deadline - time.monotonic()
+                        if remaining is not None and remaining <= 0:
+                            raise TimeoutError(f"No {self._handler_class.__name__} instance available")
+                        self._condition.wait(remaining)
+            
+            if candidate is None:
+                try:
+                    return self._create()
+                except BaseException:
+                    self._discard(None)
+                    raise
+            
+            # Health checks may do I/O, so they run outside the lock
+            instance, _, last_checked = candidate
+            if (time.monotonic() - last_checked < self._health_check_interval_s
+                    or self._is_healthy(instance)):
+                with self._condition:
+                    self._stats["reused"] += 1
+                return instance
+            with self._condition:
+                self._stats["unhealthy"] += 1
+            self._discard(instance)
+    
+    def release(self, instance: ToolHandler, failed: bool = False) -> None:
+        """
+        Return a leased instance to the pool.
+        
+        Args:
+            instance: The instance returned by acquire()
+            failed: Whether the call failed; forces a health check before reuse
+        """
+        now = time.monotonic()
+        with self._condition:
+            if not self._closed:
+                # A failed call forces a health check on the next lease
+                self._idle.append([instance, now, float("-inf") if failed else now])
+                self._condition.notify()
+                instance = None
+        if instance is not None:
+            self._discard(instance)
+        self._evict_idle()
+    
+    def maintain(self) -> None:
+        """Evict idle surplus instances and warm the pool up to min_size."""
+        self._evict_idle()
+        while True:
+            with self._condition:
+                if self._closed or self._size >= self._min_size:
+                    return
+                self._size += 1
+            try:
+                instance = self._create()
+            except BaseException:
+                self._discard(None)
+                raise
+            self.release(instance)
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get pool statistics.
+        
+        Returns:
+            Dictionary with current size, idle count and lifecycle counters
+        """
+        with self._condition:
+            return dict(self._stats, size=self._size, idle=len(self._idle),
+                        min_size=self._min_size, max_size=self._max_size)
+    
+    def close(self) -> None:
+        """Tear down idle instances; leased instances are torn down on release."""
+        with self._condition:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._condition.notify_all()
+        for instance, _, _ in idle:
+            self._discard(instance)
+    
+    def _leased_stream(self, instance: ToolHandler, context: ContextManager,
+                       chunks: Iterator[Any]) -> Iterator[Any]:
+        """Yield a streaming result, releasing the instance when the stream ends."""
+        failed = False
+        try:
+            yield from chunks
+        except GeneratorExit:
+            # The consumer stopped early (e.g. after max_results), which ends the call normally
+            raise
+        except BaseException:
+            failed = True
+            if not context.__exit__(*sys.exc_info()):
+                raise
+        finally:
+            chunks.close()
+            if not failed:
+                context.__exit__(None, None, None)
+            self.release(instance, failed=failed)
+    
+    async def _aleased_stream(self, instance: ToolHandler, context: ContextManager,
+                              chunks: AsyncIterator[Any]) -> AsyncIterator[Any]:
+        """Async counterpart of _leased_stream for async generator results."""
+        failed = False
+        try:
+            async for chunk in chunks:
+                yield chunk
+        except GeneratorExit:
+            # The consumer stopped early (e.g. after max_results), which ends the call normally
+            raise
+        except BaseException:
+            failed = True
+            if not context.__exit__(*sys.exc_info()):
+                raise
+        finally:
+            await chunks.aclose()
+            if not failed:
+                context.__exit__(None, None, None)
+            self.release(instance, failed=failed)
+    
+    def _evict_idle(self) -> None:
+        """Tear down instances idle for longer than idle_timeout_s, down to min_size."""
+        cutoff = time.monotonic() - self._idle_timeout_s
+        evicted = []
+        with self._condition:
+            # The oldest entries sit at the front of the idle list
+            surplus = self._size - self._min_size
+            while self._idle and len(evicted) < surplus and self._idle[0][1] < cutoff:
+                evicted.append(self._idle.pop(0)[0])
+            self._stats["evicted"] += len(evicted)
+        for instance in evicted:
+            self._discard(instance)
+    
+    def _create(self) -> ToolHandler:
+        """Instantiate and set up a new handler instance."""
+        instance = self._handler_class()
+        instance.setup()
+        with self._condition:
+            self._stats["created"] += 1
+        logger.debug(f"Handler instance created: {self._handler_class.__name__}")
+        return instance
+    
+    def _discard(self, instance: Optional[ToolHandler]) -> None:
+        """Free an instance's slot and tear it down (None frees a slot that was never filled)."""
+        with self._condition:
+            self._size -= 1
+            self._condition.notify()
+        if instance is None:
+            return
+        try:
+            instance.teardown()
+        except Exception as e:
+            logger.warning(f"Handler teardown failed for {self._handler_class.__name__}: {e}")
+    
+    @staticmethod
+    def _is_healthy(instance: ToolHandler) -> bool:
+        """Run an instance's health check, treating errors as unhealthy."""
+        try:
+            return bool(instance.health_check())
+        except Exception:
+            return False
+
+
+def _iterate_chunks(output: Any) -> Iterator[Any]:
+    """Normalize a handler's return value into a closeable chunk generator."""
+    if isinstance(output, types.AsyncGeneratorType):
+        return _iterate_async_chunks(output)
+    if isinstance(output, types.GeneratorType):
+        return output
+    return (chunk for chunk in (output,))
+
+
+def _iterate_async_chunks(output: Any) -> Iterator[Any]:
+    """Drive an async generator handler from synchronous code on a private event loop."""
+    import asyncio
+    
+    loop = asyncio.new_event_loop()
+    try:
+        while True:
+            try:
+                yield loop.run_until_complete(output.__anext__())
+            except StopAsyncIteration:
+                return
+    finally:
+        loop.run_until_complete(output.aclose())
+        loop.close()
+
+
+_CHUNK, _ERROR, _DONE = range(3)
+
+
+def _buffered_chunks(chunks: Iterator[Any], buffer_size: int, limit: Optional[int] = None) -> Iterator[Any]:
+    """
+    Run a chunk generator in a producer thread with a bounded buffer.
+    
+    The producer blocks once buffer_size chunks are waiting, so a slow consumer
+    throttles the handler. It pulls at most limit chunks, so the handler never
+    runs ahead past a max_results cap. Closing this generator tells the producer
+    to stop and close the handler's generator on its own thread.
+    """
+    buffer: "queue.Queue[tuple]" = queue.Queue(maxsize=buffer_size)
+    stop = threading.Event()
+    
+    def put(item: tuple) -> bool:
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.05)
+                return True
+            except queue.Full:
+                continue
+        return False
+    
+    def produce() -> None:
+        try:
+            for chunk in itertools.islice(chunks, limit):
+                if not put((_CHUNK, chunk)):
+                    break
+        except Exception as e:
+            put((_ERROR, e))
+        finally:
+            chunks.close()
+            put((_DONE, None))
+    
+    producer = threading.Thread(target=produce, name="tool-stream-producer", daemon=True)
+    producer.start()
+    try:
+        while True:
+            kind, value = buffer.get()
+            if kind == _DONE:
+                return
+            if kind == _ERROR:
+                raise value
+            yield value
+    finally:
+        stop.set()
+        producer.join()
+
+
+async def _abuffered_chunks(chunks: AsyncIterator[Any], buffer_size: int,
+                            limit: Optional[int] = None) -> AsyncIterator[Any]:
+    """
+    Run an async generator ahead of its consumer in a task with a bounded buffer.
+    
+    The async counterpart of _buffered_chunks: the producer task suspends once
+    buffer_size chunks are waiting and pulls at most limit chunks. Closing this
+    generator cancels the task, which closes the handler's generator.
+    """
+    import asyncio
+    
+    buffer: "asyncio.Queue[tuple]" = asyncio.Queue(maxsize=buffer_size)
+    
+    async def produce() -> None:
+        produced = 0
+        try:
+            async for chunk in chunks:
+                await buffer.put((_CHUNK, chunk))
+                produced += 1
+                if limit is not None and produced >= limit:
+                    break
+        except Exception as e:
+            await buffer.put((_ERROR, e))
+            return
+        finally:
+            await chunks.aclose()
+        await buffer.put((_DONE, None))
+    
+    producer = asyncio.ensure_future(produce())
+    try:
+        while True:
+            kind, value = await buffer.get()
+            if kind == _DONE:
+                return
+            if kind == _ERROR:
+                raise value
+            yield value
+    finally:
+        producer.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await producer
+
+
+def _next_chunk(chunks: Iterator[Any]) -> tuple:
+    """Advance a chunk generator, reporting exhaustion as a value (StopIteration cannot cross a future)."""
+    try:
+        return _CHUNK, next(chunks)
+    except StopIteration:
+        return _DONE, None
+
+
+async def _athreaded_chunks(chunks: Iterator[Any]) -> AsyncIterator[Any]:
+    """Advance a blocking chunk generator in worker threads so the event loop stays responsive."""
+    import asyncio
+    
+    try:
+        while True:
+            kind, value = await asyncio.to_thread(_next_chunk, chunks)
+            if kind == _DONE:
+                return
+            yield value
+    finally:
+        await asyncio.to_thread(chunks.close)
+
+
 # Example tool handler functions
+def search_code_stream(query: str, file_types: List[str] = None, max_results: int = 10) -> Iterator[Dict[str, Any]]:
+    """Example streaming tool handler that yields code search matches as they are found."""
+    # Implementation would walk an actual code search backend lazily
+    matches = [
+        {"file": "example.py", "line": 10, "snippet": "def example_function():"},
+        {"file": "main.py", "line": 25, "snippet": "result = search_code(query)"},
+        {"file": "utils.py", "line": 42, "snippet": "# This is an example comment"}
+    ]
+    for found, match in enumerate(matches):
+        if found >= max_results:
+            return
+        yield match
+
+
 def search_code(query: str, file_types: List[str] = None, max_results: int = 10) -> Dict[str, Any]:
     """Example tool handler for code search functionality."""
-    # Implementation would connect to actual code search backend
+    results = list(search_code_stream(query, file_types, max_results))
     return {
         "status": "success",
-        "results_count": 3,
-        "results": [
-            {"file": "example.py", "line": 10, "snippet": "def example_function():"},
-            {"file": "main.py", "line": 25, "snippet": "result = search_code(query)"},
-            {"file": "utils.py", "line": 42, "snippet": "# This is an example comment"}
-        ]
+        "results_count": len(results),
+        "results": results
     }
 
 # Example usage
 if __name__ == "__main__":
+    configure_logging()
+    
     # Create a tool registry
     registry = ToolRegistry()
     
@@ -437,3 +2040,39 @@ if __name__ == "__main__":
         updated_tool = registry.get_tool(search_tool_id)
         print(f"Usage count: {updated_tool['usage_count']}")
         print(f"Average execution time: {updated_tool['average_execution_time_ms']:.2f}ms")
+    
+    # Stream matches from a generator handler, stopping after max_results
+    stream_tool_id = registry.register_tool(
+        name="code_search_stream",
+        description="Stream code search matches as they are found",
+        schema=registry.get_tool(search_tool_id)["schema"],
+        handler_func=search_code_stream,
+        category=ToolCategory.CODE_ANALYSIS,
+        permission_level=ToolPermissionLevel.SAFE
+    )
+    for match in registry.stream_tool(stream_tool_id, {"query": "def", "max_results": 2}):
+        print(f"Streamed match: {match['file']}:{match['line']}")
+    streamed_tool = registry.get_tool(stream_tool_id)
+    print(f"Average time to first result: {streamed_tool['average_time_to_first_result_ms']:.3f}ms")
+    
+    # A max_results cap also bounds how far a buffered handler runs ahead
+    produced = []
+    
+    def count_stream(query: str, max_results: int = 10) -> Iterator[int]:
+        """Example streaming handler that records every item it produces."""
+        for i in range(100):
+            produced.append(i)
+            yield i
+    
+    count_tool_id = registry.register_tool(
+        name="count_stream",
+        description="Stream consecutive integers",
+        schema=registry.get_tool(search_tool_id)["schema"],
+        handler_func=count_stream,
+        category=ToolCategory.UTILITY,
+        permission_level=ToolPermissionLevel.SAFE
+    )
+    for buffer_size in (0, 8):
+        produced.clear()
+        results = list(registry.stream_tool(count_tool_id, {"query": "n", "max_results": 3}, buffer_size=buffer_size))
+        print(f"buffer_size={buffer_size}: handler produced {len(produced)} items for max_results=3")
@@ -0,0 +1,659 @@
+"""
+Tool Registry Replication Example
+
+This file demonstrates leader/follower replication of a Tool Registry across
+agent worker nodes, as described in Chapter 10 of "Unified Agentic Systems: The Ultimate Guide to AI-Driven Tool Integration."
+
+Instead of every node loading and maintaining its own catalog, one node's
+registry is the source of truth and followers stay in sync through
+revision-based deltas from its change feed:
+1. Followers fetch the change events after the last revision they applied,
+   falling back to a full snapshot only when the leader's change log no
+   longer covers the gap
+2. Transports are pluggable; a local socket transport and a file-based
+   transport allow the protocol to run and be tested offline
+3. Usage metrics recorded on followers are merged back into the leader in batches
+
+Handlers are not replicated. Followers resolve each tool's handler_ref
+("module:qualname") locally, or through a custom resolver.
+
+Requires tool_registry_example.py from the same directory.
+"""
+
+import abc
+import json
+import logging
+import os
+import socket
+import socketserver
+import threading
+import time
+from typing import Dict, List, Optional, Any, Callable, Tuple, Union
+
+from tool_registry_example import (
+    ToolRegistry, ToolPermissionLevel, ToolCategory, ChangeLogTruncatedError,
+    resolve_handler_reference, configure_logging, _thaw
+)
+
+logger = logging.getLogger(__name__)
+
+
+class ReplicationLeader:
+    """
+    Serves catalog deltas from the source registry and merges follower metrics.
+    """
+
+    def __init__(self, registry: ToolRegistry):
+        """
+        Initialize the leader.
+
+        Args:
+            registry: The source-of-truth registry
+        """
+        self._registry = registry
+
+    def fetch(self, since_revision: int) -> Dict[str, Any]:
+        """
+        Get what a follower at a given revision needs to catch up.
+
+        Args:
+            since_revision: Last leader revision the follower applied (0 if none)
+
+        Returns:
+            {"revision", "events"} with the missing change events, or
+            {"revision", "snapshot"} if the change log no longer covers the gap or
+            the follower is ahead of the leader (e.g. after a leader restart)
+        """
+        if since_revision > self._registry.revision:
+            logger.info(f"Follower at revision {since_revision} is ahead of the leader; sending a snapshot")
+            return self.snapshot()
+        try:
+            events = self._registry.changes_since(since_revision)
+            revision = events[-1]["revision"] if events else max(since_revision, self._registry.revision)
+            return {"revision": revision, "events": events}
+        except ChangeLogTruncatedError:
+            return self.snapshot()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get a full copy of the catalog.
+
+        Returns:
+            {"revision", "snapshot"} with every tool record at that revision
+        """
+        catalog = self._registry.export_catalog()
+        return {"revision": catalog["revision"], "snapshot": catalog["tools"]}
+
+    def merge_metrics(self, follower_id: str, batch: List[Dict[str, Any]]) -> int:
+        """
+        Merge a batch of usage metric deltas reported by a follower.
+
+        Args:
+            follower_id: Identifier of the reporting follower
+            batch: Entries with tool_id, usage_count, total_execution_time_ms,
+                total_time_to_first_result_ms and last_used
+
+        Returns:
+            Number of entries merged
+        """
+        merged = 0
+        for entry in batch:
+            if self._registry.merge_usage_metrics(
+                    entry["tool_id"], entry["usage_count"], entry["total_execution_time_ms"],
+                    entry.get("total_time_to_first_result_ms"), entry.get("last_used")):
+                merged += 1
+        logger.debug(f"Merged {merged} metric entries from follower {follower_id}")
+        return merged
+
+
+class ReplicationTransport(abc.ABC):
+    """
+    Interface between a follower and its leader.
+
+    Both methods may raise ConnectionError (or OSError) when the leader is
+    unreachable. fetch() is safe to retry; push_metrics() is not, because the
+    leader may have merged a batch whose acknowledgement was lost.
+    """
+
+    @abc.abstractmethod
+    def fetch(self, since_revision: int) -> Dict[str, Any]:
+        """Return the leader's answer to ReplicationLeader.fetch(since_revision)."""
+
+    @abc.abstractmethod
+    def push_metrics(self, follower_id: str, batch: List[Dict[str, Any]]) -> None:
+        """Deliver a batch of usage metric deltas to the leader."""
+
+
+class InProcessTransport(ReplicationTransport):
+    """Transport that calls a leader in the same process (useful for tests)."""
+
+    def __init__(self, leader: ReplicationLeader):
+        self._leader = leader
+
+    def fetch(self, since_revision: int) -> Dict[str, Any]:
+        return json.loads(json.dumps(self._leader.fetch(since_revision)))
+
+    def push_metrics(self, follower_id: str, batch: List[Dict[str, Any]]) -> None:
+        self._leader.merge_metrics(follower_id, batch)
+
+
+# ==========================================
+# Local socket transport
+# ==========================================
+
+class _ReplicationRequestHandler(socketserver.StreamRequestHandler):
+    """Answers newline-delimited JSON requests from followers."""
+
+    def handle(self) -> None:
+        leader: ReplicationLeader = self.server.leader  # type: ignore[attr-defined]
+        for line in self.rfile:
+            try:
+                request = json.loads(line)
+                if request["op"] == "fetch":
+                    response = leader.fetch(request["since"])
+                elif request["op"] == "push_metrics":
+                    response = {"merged": leader.merge_metrics(request["follower_id"], request["batch"])}
+                else:
+                    response = {"error": f"Unknown operation: {request['op']}"}
+            except Exception as e:
+                response = {"error": str(e)}
+            self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+            self.wfile.flush()
+
+
+class ReplicationServer:
+    """
+    Serves a ReplicationLeader over a Unix domain socket or a TCP address.
+    """
+
+    def __init__(self, leader: ReplicationLeader, address: Union[str, Tuple[str, int]]):
+        """
+        Start serving in a background thread.
+
+        Args:
+            leader: Leader answering the requests
+            address: Unix socket path, or (host, port) for TCP; port 0 picks a free port
+        """
+        if isinstance(address, str):
+            if os.path.exists(address):
+                os.unlink(address)
+            self._server = socketserver.ThreadingUnixStreamServer(address, _ReplicationRequestHandler)
+        else:
+            self._server = socketserver.ThreadingTCPServer(address, _ReplicationRequestHandler)
+        self._server.daemon_threads = True
+        self._server.leader = leader  # type: ignore[attr-defined]
+        self._thread = threading.Thread(target=self._server.serve_forever,
+                                        name="registry-replication-server", daemon=True)
+        self._thread.start()
+
+    @property
+    def address(self) -> Union[str, Tuple[str, int]]:
+        """The bound address (with the actual port for TCP)."""
+        return self._server.server_address
+
+    def close(self) -> None:
+        """Stop serving and release the socket."""
+        self._server.shutdown()
+        self._server.server_close()
+        if isinstance(self._server.server_address, str) and os.path.exists(self._server.server_address):
+            os.unlink(self._server.server_address)
+
+
+class LocalSocketTransport(ReplicationTransport):
+    """
+    Follower-side transport talking to a ReplicationServer.
+    """
+
+    def __init__(self, address: Union[str, Tuple[str, int]], timeout_s: float = 5.0):
+        """
+        Initialize the transport; the connection is opened lazily and reused.
+
+        Args:
+            address: Unix socket path or (host, port) of the ReplicationServer
+            timeout_s: Socket timeout for each request
+        """
+        self._address = address
+        self._timeout_s = timeout_s
+        self._socket: Optional[socket.socket] = None
+        self._reader: Any = None
+        self._lock = threading.Lock()
+
+    def fetch(self, since_revision: int) -> Dict[str, Any]:
+        return self._request({"op": "fetch", "since": since_revision}, retry=True)
+
+    def push_metrics(self, follower_id: str, batch: List[Dict[str, Any]]) -> None:
+        # Merging is not idempotent, so a batch is never resent on a new connection
+        self._request({"op": "push_metrics", "follower_id": follower_id, "batch": batch}, retry=False)
+
+    def close(self) -> None:
+        """Close the connection to the leader."""
+        with self._lock:
+            self._disconnect()
+
+    def _request(self, request: Dict[str, Any], retry: bool) -> Dict[str, Any]:
+        """Send one request and wait for its response, optionally reconnecting once on failure."""
+        with self._lock:
+            attempts = 2 if retry else 1
+            for attempt in range(attempts):
+                try:
+                    if self._socket is None:
+                        family = socket.AF_UNIX if isinstance(self._address, str) else socket.AF_INET
+                        self._socket = socket.socket(family, socket.SOCK_STREAM)
+                        self._socket.settimeout(self._timeout_s)
+                        self._socket.connect(self._address)
+                        self._reader = self._socket.makefile("rb")
+                    self._socket.sendall(json.dumps(request).encode("utf-8") + b"\n")
+                    line = self._reader.readline()
+                    if not line:
+                        raise ConnectionError("Replication server closed the connection")
+                    break
+                except OSError:
+                    self._disconnect()
+                    if attempt == attempts - 1:
+                        raise
+        response = json.loads(line)
+        if "error" in response:
+            raise RuntimeError(f"Replication request failed: {response['error']}")
+        return response
+
+    def _disconnect(self) -> None:
+        """Drop the current connection. Caller holds the lock."""
+        if self._reader is not None:
+            self._reader.close()
+        if self._socket is not None:
+            self._socket.close()
+        self._socket = None
+        self._reader = None
+
+
+# ==========================================
+# File-based transport
+# ==========================================
+
+class FileReplicationPublisher:
+    """
+    Leader-side half of the file transport.
+
+    The published directory contains a snapshot, an append-only change log that
+    starts at the snapshot's revision, a state.json naming both, and a metrics/
+    inbox where followers drop metric batches. When the log grows beyond
+    compact_after events a new snapshot is written and a fresh log started;
+    followers that were behind the new snapshot reload it.
+    """
+
+    def __init__(self, leader: ReplicationLeader, directory: str, compact_after: int = 10000):
+        """
+        Initialize the publisher and write the initial snapshot.
+
+        Args:
+            leader: Leader whose deltas are published
+            directory: Shared directory
+            compact_after: Number of logged events after which a new snapshot is taken
+        """
+        self._leader = leader
+        self._directory = directory
+        self._compact_after = compact_after
+        self._published_revision = 0
+        self._logged_events = 0
+        self._log_name = ""
+        os.makedirs(os.path.join(directory, "metrics"), exist_ok=True)
+        self._write_snapshot()
+
+    def publish(self) -> int:
+        """
+        Append the change events recorded since the last publish.
+
+        Returns:
+            Number of events published
+        """
+        response = self._leader.fetch(self._published_revision)
+        if "snapshot" in response or self._logged_events >= self._compact_after:
+            self._write_snapshot()
+            return 0
+        events = response["events"]
+        if events:
+            with open(os.path.join(self._directory, self._log_name), "a") as f:
+                for event in events:
+                    f.write(json.dumps(event) + "\n")
+            self._published_revision = response["revision"]
+            self._logged_events += len(events)
+        return len(events)
+
+    def collect_metrics(self) -> int:
+        """
+        Merge and remove the metric batches followers dropped in the inbox.
+
+        Returns:
+            Number of batches merged
+        """
+        inbox = os.path.join(self._directory, "metrics")
+        collected = 0
+        for name in sorted(os.listdir(inbox)):
+            if not name.endswith(".json"):
+                continue
+            path = os.path.join(inbox, name)
+            with open(path) as f:
+                message = json.load(f)
+            self._leader.merge_metrics(message["follower_id"], message["batch"])
+            os.unlink(path)
+            collected += 1
+        return collected
+
+    def _write_snapshot(self) -> None:
+        """Write a snapshot and start a new change log at its revision."""
+        snapshot = self._leader.snapshot()
+        revision = snapshot["revision"]
+        snapshot_name = f"snapshot-{revision}.json"
+        log_name = f"changes-{revision}.jsonl"
+        _write_json_atomic(os.path.join(self._directory, snapshot_name),
+                           {"revision": revision, "tools": snapshot["snapshot"]})
+        open(os.path.join(self._directory, log_name), "a").close()
+        previous = (self._log_name, f"snapshot-{self._log_name[8:-6]}.json") if self._log_name else ()
+        _write_json_atomic(os.path.join(self._directory, "state.json"),
+                           {"snapshot": snapshot_name, "log": log_name, "base_revision": revision})
+        # Followers read state.json first, so older files can go once it is replaced
+        for name in previous:
+            if name not in (snapshot_name, log_name):
+                try:
+                    os.unlink(os.path.join(self._directory, name))
+                except FileNotFoundError:
+                    pass
+        self._published_revision = revision
+        self._logged_events = 0
+        self._log_name = log_name
+
+
+class FileReplicationTransport(ReplicationTransport):
+    """
+    Follower-side half of the file transport.
+
+    Reads only the bytes appended to the change log since its last fetch.
+    """
+
+    def __init__(self, directory: str):
+        """
+        Initialize the transport.
+
+        Args:
+            directory: Directory maintained by a FileReplicationPublisher
+        """
+        self._directory = directory
+        self._log_name = ""
+        self._offset = 0
+        self._sequence = 0
+
+    def fetch(self, since_revision: int) -> Dict[str, Any]:
+        with open(os.path.join(self._directory, "state.json")) as f:
+            state = json.load(f)
+
+        if state["log"] != self._log_name:
+            self._log_name = state["log"]
+            self._offset = 0
+            # Behind the new snapshot, or ahead of a restarted leader
+            if since_revision != state["base_revision"]:
+                with open(os.path.join(self._directory, state["snapshot"])) as f:
+                    snapshot = json.load(f)
+                return {"revision": snapshot["revision"], "snapshot": snapshot["tools"]}
+
+        events = []
+        with open(os.path.join(self._directory, self._log_name)) as f:
+            f.seek(self._offset)
+            for line in iter(f.readline, ""):
+                if not line.endswith("\n"):
+                    break  # partially written line; read it next time
+                self._offset = f.tell()
+                event = json.loads(line)
+                if event["revision"] > since_revision:
+                    events.append(event)
+        revision = events[-1]["revision"] if events else since_revision
+        return {"revision": revision, "events": events}
+
+    def push_metrics(self, follower_id: str, batch: List[Dict[str, Any]]) -> None:
+        self._sequence += 1
+        name = f"{follower_id}-{int(time.time() * 1000)}-{self._sequence}.json"
+        _write_json_atomic(os.path.join(self._directory, "metrics", name),
+                           {"follower_id": follower_id, "batch": batch})
+
+
+def _write_json_atomic(path: str, value: Any) -> None:
+    """Write JSON to a temporary file and rename it into place."""
+    temporary = f"{path}.tmp"
+    with open(temporary, "w") as f:
+        json.dump(value, f)
+    os.replace(temporary, path)
+
+
+# ==========================================
+# Follower
+# ==========================================
+
+class ReplicationFollower:
+    """
+    Keeps a local registry in sync with a leader and reports usage back to it.
+    """
+
+    def __init__(self,
+                 registry: ToolRegistry,
+                 transport: ReplicationTransport,
+                 follower_id: str,
+                 handler_resolver: Callable[[Dict[str, Any]], Callable] = None):
+        """
+        Initialize the follower.
+
+        Args:
+            registry: Local registry; replicated tools keep the leader's tool IDs
+            transport: Connection to the leader
+            follower_id: Identifier reported with metric batches
+            handler_resolver: Returns the local handler for a replicated tool record
+                (defaults to importing the record's handler_ref)
+        """
+        self._registry = registry
+        self._transport = transport
+        self._follower_id = follower_id
+        self._handler_resolver = handler_resolver or (
+            lambda record: resolve_handler_reference(record["handler_ref"]))
+        self.leader_revision = 0
+        self._reported: Dict[str, Tuple[int, float, float]] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def sync(self) -> int:
+        """
+        Apply the leader's changes since the last sync.
+
+        Returns:
+            Number of tools changed locally
+        """
+        response = self._transport.fetch(self.leader_revision)
+        if "snapshot" in response:
+            applied = self._apply_snapshot(response["snapshot"])
+        else:
+            applied = 0
+            for event in response["events"]:
+                if event["revision"] > self.leader_revision:
+                    self._apply_event(event)
+                    applied += 1
+        self.leader_revision = response["revision"]
+        return applied
+
+    def flush_metrics(self) -> int:
+        """
+        Send the usage recorded locally since the last flush to the leader.
+
+        Returns:
+            Number of tools included in the batch
+        """
+        batch = []
+        pending = {}
+        for tool in self._registry.list_tools(enabled_only=False):
+            count = tool["usage_count"]
+            total = tool["average_execution_time_ms"] * count
+            total_first = tool["average_time_to_first_result_ms"] * count
+            reported_count, reported_total, reported_first = self._reported.get(tool["id"], (0, 0.0, 0.0))
+            if count <= reported_count:
+                continue
+            batch.append({
+                "tool_id": tool["id"],
+                "usage_count": count - reported_count,
+                "total_execution_time_ms": total - reported_total,
+                "total_time_to_first_result_ms": total_first - reported_first,
+                "last_used": tool.get("last_used")
+            })
+            pending[tool["id"]] = (count, total, total_first)
+
+        if batch:
+            self._transport.push_metrics(self._follower_id, batch)
+            self._reported.update(pending)
+        return len(batch)
+
+    def start(self, sync_interval_s: float = 1.0, metrics_interval_s: float = 10.0) -> None:
+        """
+        Sync and flush metrics periodically in a background thread.
+
+        Args:
+            sync_interval_s: Seconds between catalog syncs
+            metrics_interval_s: Seconds between metric flushes
+        """
+        def run() -> None:
+            next_flush = time.monotonic() + metrics_interval_s
+            while not self._stop.wait(sync_interval_s):
+                try:
+                    self.sync()
+                    if time.monotonic() >= next_flush:
+                        self.flush_metrics()
+                        next_flush = time.monotonic() + metrics_interval_s
+                except Exception as e:
+                    logger.warning(f"Replication with leader failed: {e}")
+
+        self._stop.clear()
+        self._thread = threading.Thread(target=run, name=f"replication-{self._follower_id}", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop background replication and flush outstanding metrics."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.flush_metrics()
+
+    def _apply_event(self, event: Dict[str, Any]) -> None:
+        """Apply one leader change event to the local registry."""
+        tool_id = event["tool_id"]
+        if event["type"] == "registered":
+            self._register(event["changes"])
+        elif event["type"] == "updated":
+            self._registry.update_tool_metadata(tool_id, event["changes"])
+        elif event["type"] == "enabled":
+            self._registry.enable_tool(tool_id)
+        elif event["type"] == "disabled":
+            self._registry.disable_tool(tool_id)
+
+    def _apply_snapshot(self, tools: List[Dict[str, Any]]) -> int:
+        """Reconcile the local registry with a full leader snapshot."""
+        changed = 0
+        for record in tools:
+            local = self._registry.get_tool(record["id"])
+            if local is None:
+                self._register(record)
+                changed += 1
+                continue
+            # Local schemas and examples are frozen (tuples), snapshot ones are plain JSON
+            metadata = {key: value for key, value in record.items()
+                        if key not in _LOCAL_FIELDS and _thaw(local.get(key)) != _thaw(value)}
+            if metadata:
+                self._registry.update_tool_metadata(record["id"], metadata)
+            if local["is_enabled"] != record["is_enabled"]:
+                (self._registry.enable_tool if record["is_enabled"] else self._registry.disable_tool)(record["id"])
+            if metadata or local["is_enabled"] != record["is_enabled"]:
+                changed += 1
+        # Tools the leader does not have (e.g. it restarted with another catalog) are stale
+        replicated = {record["id"] for record in tools}
+        for local in self._registry.list_tools():
+            if local["id"] not in replicated:
+                self._registry.disable_tool(local["id"])
+                changed += 1
+        return changed
+
+    def _register(self, record: Dict[str, Any]) -> None:
+        """Register a replicated tool under the leader's tool ID."""
+        if self._registry.get_tool(record["id"]) is not None:
+            return
+        self._registry.register_tool(
+            name=record["name"],
+            description=record["description"],
+            schema=record["schema"],
+            handler_func=self._handler_resolver(record),
+            category=ToolCategory(record["category"]),
+            permission_level=ToolPermissionLevel(record["permission_level"]),
+            version=record["version"],
+            author=record["author"],
+            examples=record["examples"],
+            tool_id=record["id"])
+        if not record.get("is_enabled", True):
+            self._registry.disable_tool(record["id"])
+
+
+# Record fields that are owned by each node rather than replicated
+_LOCAL_FIELDS = {
+    "id", "handler_ref", "registration_time", "schema_hash", "examples_hash", "is_enabled",
+    "usage_count", "average_execution_time_ms", "average_time_to_first_result_ms", "last_used"
+}
+
+
+# Example usage
+if __name__ == "__main__":
+    import tempfile
+
+    configure_logging()
+
+    def lookup(term: str) -> Dict[str, Any]:
+        """Example handler available on every node."""
+        return {"term": term, "found": True}
+
+    schema = {"type": "object", "required": ["term"],
+              "properties": {"term": {"type": "string", "description": "Term to look up"}}}
+
+    leader_registry = ToolRegistry()
+    tool_id = leader_registry.register_tool(
+        "lookup", "Look up a term", schema, lookup, ToolCategory.RESEARCH, ToolPermissionLevel.SAFE)
+    leader = ReplicationLeader(leader_registry)
+
+    # Both followers resolve handlers by tool name from their local code
+    local_handlers = {"lookup": lookup}
+    resolver = lambda record: local_handlers[record["name"]]  # noqa: E731
+
+    with tempfile.TemporaryDirectory() as directory:
+        # Socket transport
+        server = ReplicationServer(leader, os.path.join(directory, "leader.sock"))
+        socket_transport = LocalSocketTransport(server.address)
+        socket_follower = ReplicationFollower(ToolRegistry(), socket_transport, "worker-1", resolver)
+        print(f"Socket follower applied {socket_follower.sync()} changes")
+
+        # File transport
+        publisher = FileReplicationPublisher(leader, os.path.join(directory, "shared"))
+        file_follower = ReplicationFollower(
+            ToolRegistry(), FileReplicationTransport(os.path.join(directory, "shared")), "worker-2", resolver)
+        print(f"File follower applied {file_follower.sync()} changes")
+
+        # Deltas flow to followers...
+        leader_registry.update_tool_metadata(tool_id, {"description": "Look up a term in the glossary"})
+        leader_registry.disable_tool(tool_id)
+        publisher.publish()
+        print(f"Socket follower applied {socket_follower.sync()} changes, "
+              f"file follower applied {file_follower.sync()} changes")
+        print(f"Follower sees: {file_follower._registry.get_tool(tool_id)['description']}")
+
+        # ...and usage flows back to the leader
+        leader_registry.enable_tool(tool_id)
+        publisher.publish()
+        for follower in (socket_follower, file_follower):
+            follower.sync()
+            for _ in range(5):
+                follower._registry.invoke_tool(tool_id, {"term": "agent"})
+            follower.flush_metrics()
+        publisher.collect_metrics()
+        print(f"Leader usage count: {leader_registry.get_tool(tool_id)['usage_count']}")
+
+        socket_transport.close()
+        server.close()
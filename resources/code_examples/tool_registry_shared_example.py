@@ -0,0 +1,491 @@
+"""
+Shared Tool Registry Example
+
+This file demonstrates sharing one Tool Registry across the worker processes
+of a pre-fork server, as described in Chapter 4 of "Unified Agentic Systems: The Ultimate Guide to AI-Driven Tool Integration."
+
+Normally each worker holds a full copy of the registry and keeps its own usage
+statistics. In the shared mode:
+1. The parent publishes the catalog metadata to a read-mostly file that every
+   worker memory-maps, so records are decoded on demand instead of being held
+   per worker
+2. Per-tool counters and latency buckets live in a shared memory-mapped array;
+   each worker owns one row per tool, so updates never contend across processes
+   and readers sum the rows to get fleet-wide values
+3. Catalog changes are republished by atomically replacing the file; workers
+   remap it when they notice the replacement
+
+Requires tool_registry_example.py from the same directory.
+"""
+
+import bisect
+import inspect
+import json
+import logging
+import mmap
+import os
+import struct
+import threading
+import time
+from datetime import datetime
+from typing import Dict, List, Optional, Any, Callable, Iterator, Tuple
+
+from tool_registry_example import (
+    ToolRegistry, ToolPermissionLevel, ToolCategory, ToolHandler, HandlerPool,
+    resolve_handler_reference, configure_logging
+)
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds (in ms) of the latency histogram buckets; one more bucket holds slower calls
+LATENCY_BUCKETS_MS = (1, 5, 10, 50, 100, 500, 1000, 5000)
+
+# Catalog file: header, fixed-width index sorted by tool ID, then JSON records
+_CATALOG_MAGIC = b"TOOLCAT1"
+_CATALOG_HEADER = struct.Struct("<8sQQ")  # magic, revision, tool count
+_INDEX_ENTRY = struct.Struct("<64sIQI")  # tool ID, counter slot, record offset, record length
+
+# Counter file: header, then one row per (worker, tool slot) of unsigned 64-bit fields
+_COUNTER_MAGIC = b"TOOLCNT1"
+_COUNTER_HEADER = struct.Struct("<8sII")  # magic, max workers, max tools
+_COUNT, _TOTAL_EXECUTION_NS, _TOTAL_FIRST_RESULT_NS, _LAST_USED_MS, _BUCKETS = range(5)
+_ROW_FIELDS = _BUCKETS + len(LATENCY_BUCKETS_MS) + 1
+
+
+class SharedUsageCounters:
+    """
+    Usage counters and latency histograms in a shared memory-mapped file.
+
+    Each worker process writes only its own rows, so processes never lock
+    each other out. Within a process, increments are read-modify-writes on
+    the mapped words, so threads recording into the same row take a
+    per-process lock. Fields are aligned 64-bit words, so readers never see a
+    torn value, but nothing orders a row's words for readers in other
+    processes: a snapshot read while a call is being recorded may see its
+    count without its latency totals, or the other way round.
+    """
+
+    def __init__(self, path: str, max_workers: int = 0, max_tools: int = 0):
+        """
+        Create or open a counter file.
+
+        Args:
+            path: File backing the counters (use /dev/shm to keep it off disk)
+            max_workers: Number of worker rows to create; 0 opens an existing file
+            max_tools: Number of tool slots to create; 0 opens an existing file
+        """
+        if max_workers and max_tools:
+            size = _COUNTER_HEADER.size + max_workers * max_tools * _ROW_FIELDS * 8
+            with open(path, "wb") as f:
+                f.write(_COUNTER_HEADER.pack(_COUNTER_MAGIC, max_workers, max_tools))
+                f.truncate(size)
+
+        with open(path, "r+b") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0)
+        magic, self.max_workers, self.max_tools = _COUNTER_HEADER.unpack_from(self._mmap)
+        if magic != _COUNTER_MAGIC:
+            raise ValueError(f"Not a usage counter file: {path}")
+        self._words = memoryview(self._mmap)[_COUNTER_HEADER.size:].cast("Q")
+        self._lock = threading.Lock()
+
+    def record(self,
+               worker_slot: int,
+               tool_slot: int,
+               execution_time_ms: float,
+               time_to_first_result_ms: Optional[float] = None) -> None:
+        """
+        Record one call in a worker's row for a tool.
+
+        Args:
+            worker_slot: Row owned by the calling worker (0 <= worker_slot < max_workers)
+            tool_slot: Counter slot of the tool from the shared catalog
+            execution_time_ms: Execution time in milliseconds
+            time_to_first_result_ms: Time until the first result (defaults to the execution time)
+        """
+        if time_to_first_result_ms is None:
+            time_to_first_result_ms = execution_time_ms
+        words = self._words
+        base = self._row(worker_slot, tool_slot)
+        bucket = base + _BUCKETS + bisect.bisect_left(LATENCY_BUCKETS_MS, execution_time_ms)
+        last_used_ms = int(time.time() * 1000)
+        with self._lock:
+            words[base + _TOTAL_EXECUTION_NS] += int(execution_time_ms * 1e6)
+            words[base + _TOTAL_FIRST_RESULT_NS] += int(time_to_first_result_ms * 1e6)
+            words[bucket] += 1
+            words[base + _LAST_USED_MS] = last_used_ms
+            words[base + _COUNT] += 1
+
+    def totals(self, tool_slot: int) -> Dict[str, Any]:
+        """
+        Sum a tool's counters across all workers.
+
+        Args:
+            tool_slot: Counter slot of the tool
+
+        Returns:
+            Dictionary with usage_count, total_execution_time_ms,
+            total_time_to_first_result_ms, last_used_ms and latency_buckets
+        """
+        words = self._words
+        sums = [0] * _ROW_FIELDS
+        last_used_ms = 0
+        for worker_slot in range(self.max_workers):
+            base = self._row(worker_slot, tool_slot)
+            for field in range(_ROW_FIELDS):
+                sums[field] += words[base + field]
+            last_used_ms = max(last_used_ms, words[base + _LAST_USED_MS])
+        return {
+            "usage_count": sums[_COUNT],
+            "total_execution_time_ms": sums[_TOTAL_EXECUTION_NS] / 1e6,
+            "total_time_to_first_result_ms": sums[_TOTAL_FIRST_RESULT_NS] / 1e6,
+            "last_used_ms": last_used_ms,
+            "latency_buckets": sums[_BUCKETS:]
+        }
+
+    def close(self) -> None:
+        """Unmap the counter file."""
+        self._words.release()
+        self._mmap.close()
+
+    def _row(self, worker_slot: int, tool_slot: int) -> int:
+        """Index of the first word of a worker's row for a tool."""
+        if not 0 <= worker_slot < self.max_workers:
+            raise ValueError(f"Worker slot {worker_slot} outside 0..{self.max_workers - 1}")
+        if not 0 <= tool_slot < self.max_tools:
+            raise ValueError(f"Tool slot {tool_slot} outside 0..{self.max_tools - 1}")
+        return (worker_slot * self.max_tools + tool_slot) * _ROW_FIELDS
+
+
+class SharedCatalogPublisher:
+    """
+    Writes a registry's catalog to the shared catalog file.
+
+    Runs in the process that owns the registry (typically the pre-fork parent).
+    Each tool keeps its counter slot across publishes, so counters survive
+    catalog updates.
+    """
+
+    def __init__(self, registry: ToolRegistry, path: str, max_tools: int):
+        """
+        Initialize the publisher.
+
+        Args:
+            registry: Registry whose catalog is shared
+            path: Catalog file workers map
+            max_tools: Number of counter slots available (matches SharedUsageCounters)
+        """
+        self._registry = registry
+        self._path = path
+        self._max_tools = max_tools
+        self._slots: Dict[str, int] = {}
+        self.published_revision = -1
+
+    def publish(self) -> bool:
+        """
+        Write the catalog if it changed since the last publish.
+
+        Returns:
+            True if a new catalog file was written
+
+        Raises:
+            ValueError: If the catalog outgrows max_tools or a tool ID is too long
+        """
+        if self._registry.revision == self.published_revision:
+            return False
+
+        catalog = self._registry.export_catalog()
+        records = []
+        for tool in catalog["tools"]:
+            if tool["id"] not in self._slots:
+                if len(self._slots) >= self._max_tools:
+                    raise ValueError(f"Shared catalog is limited to {self._max_tools} tools")
+                self._slots[tool["id"]] = len(self._slots)
+            tool_id = tool["id"].encode("utf-8")
+            if len(tool_id) > 64:
+                raise ValueError(f"Tool ID too long for the shared catalog: {tool['id']}")
+            records.append((tool_id, self._slots[tool["id"]], json.dumps(tool).encode("utf-8")))
+        records.sort()
+
+        # Workers may still map the old file, so write a new one and rename it into place
+        offset = _CATALOG_HEADER.size + _INDEX_ENTRY.size * len(records)
+        temporary = f"{self._path}.tmp"
+        with open(temporary, "wb") as f:
+            f.write(_CATALOG_HEADER.pack(_CATALOG_MAGIC, catalog["revision"], len(records)))
+            for tool_id, slot, data in records:
+                f.write(_INDEX_ENTRY.pack(tool_id, slot, offset, len(data)))
+                offset += len(data)
+            for _, _, data in records:
+                f.write(data)
+        os.replace(temporary, self._path)
+
+        self.published_revision = catalog["revision"]
+        logger.info(f"Shared catalog published at revision {catalog['revision']} ({len(records)} tools)")
+        return True
+
+
+class SharedRegistryView:
+    """
+    A worker's read-mostly view of the shared catalog and counters.
+
+    Provides the read and dispatch side of the ToolRegistry interface. Records
+    come from the mapped catalog with fleet-wide usage metrics filled in from
+    the shared counters; handlers are resolved locally from each tool's
+    handler_ref the first time the tool is invoked.
+    """
+
+    def __init__(self,
+                 catalog_path: str,
+                 counters: SharedUsageCounters,
+                 worker_slot: int,
+                 handler_resolver: Callable[[Dict[str, Any]], Callable] = None):
+        """
+        Initialize the view.
+
+        Args:
+            catalog_path: Catalog file written by SharedCatalogPublisher
+            counters: Shared counters (opened in this worker)
+            worker_slot: Counter row owned by this worker
+            handler_resolver: Returns the local handler for a tool record
+                (defaults to importing the record's handler_ref)
+        """
+        self._catalog_path = catalog_path
+        self._counters = counters
+        self._worker_slot = worker_slot
+        self._handler_resolver = handler_resolver or (
+            lambda record: resolve_handler_reference(record["handler_ref"]))
+        self._handlers: Dict[str, Callable] = {}
+        self._mmap: Optional[mmap.mmap] = None
+        self._inode = None
+        self.revision = -1
+        self._count = 0
+        self.refresh()
+
+    def refresh(self) -> bool:
+        """
+        Remap the catalog if the publisher replaced it.
+
+        Workers call this periodically (e.g. between requests) to pick up
+        catalog changes; it costs one stat() when nothing changed.
+
+        Returns:
+            True if a new catalog revision was mapped
+        """
+        stat = os.stat(self._catalog_path)
+        if (stat.st_ino, stat.st_mtime_ns) == self._inode:
+            return False
+        with open(self._catalog_path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, revision, count = _CATALOG_HEADER.unpack_from(mapped)
+        if magic != _CATALOG_MAGIC:
+            mapped.close()
+            raise ValueError(f"Not a shared catalog file: {self._catalog_path}")
+
+        if self._mmap is not None:
+            self._mmap.close()
+        self._mmap, self._inode, self._count = mapped, (stat.st_ino, stat.st_mtime_ns), count
+        changed = revision != self.revision
+        self.revision = revision
+        # Handlers may have been replaced along with their metadata
+        if changed:
+            self._handlers.clear()
+        return changed
+
+    def get_tool(self, tool_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Retrieve a tool by its ID, with fleet-wide usage metrics.
+
+        Args:
+            tool_id: The unique identifier of the tool
+
+        Returns:
+            The tool record if found, None otherwise
+        """
+        entry = self._find(tool_id)
+        return self._read_record(entry) if entry else None
+
+    def list_tools(self,
+                   category: Optional[ToolCategory] = None,
+                   permission_level: Optional[ToolPermissionLevel] = None,
+                   enabled_only: bool = True) -> List[Dict[str, Any]]:
+        """
+        List tools, optionally filtered by category and permission level.
+
+        Args:
+            category: Filter tools by category
+            permission_level: Filter tools by maximum permission level
+            enabled_only: Only include enabled tools
+
+        Returns:
+            List of tool records matching the filters, ordered by counter slot
+        """
+        results = []
+        for entry in sorted(self._entries(), key=lambda entry: entry[1]):
+            tool = self._read_record(entry)
+            if enabled_only and not tool.get("is_enabled", True):
+                continue
+            if category and tool.get("category") != category.value:
+                continue
+            if permission_level and tool.get("permission_level", 0) > permission_level.value:
+                continue
+            results.append(tool)
+        return results
+
+    def invoke_tool(self, tool_id: str, parameters: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        Execute a tool's handler and record the call in the shared counters.
+
+        Args:
+            tool_id: The unique identifier of the tool
+            parameters: Keyword arguments passed to the handler
+
+        Returns:
+            Whatever the handler returns
+
+        Raises:
+            ValueError: If the tool does not exist or is disabled
+        """
+        entry = self._find(tool_id)
+        handler = self._handlers.get(tool_id)
+        if entry is None or handler is None:
+            tool = self._read_record(entry) if entry else None
+            if tool is None or not tool.get("is_enabled", True):
+                raise ValueError(f"Tool not found or disabled (ID: {tool_id})")
+            handler = self._resolve_handler(tool)
+
+        start = time.perf_counter()
+        try:
+            return handler(**(parameters or {}))
+        finally:
+            self._counters.record(self._worker_slot, entry[1], (time.perf_counter() - start) * 1000)
+
+    def record_tool_usage(self,
+                          tool_id: str,
+                          execution_time_ms: float,
+                          time_to_first_result_ms: Optional[float] = None) -> None:
+        """
+        Record usage metrics for a tool in this worker's counter row.
+
+        Args:
+            tool_id: The unique identifier of the tool
+            execution_time_ms: Execution time in milliseconds
+            time_to_first_result_ms: Time until the first result chunk was delivered
+        """
+        entry = self._find(tool_id)
+        if entry is not None:
+            self._counters.record(self._worker_slot, entry[1], execution_time_ms, time_to_first_result_ms)
+
+    def get_latency_histogram(self, tool_id: str) -> Optional[Dict[str, int]]:
+        """
+        Get a tool's fleet-wide latency histogram.
+
+        Args:
+            tool_id: The unique identifier of the tool
+
+        Returns:
+            Mapping of bucket labels ("<=1ms", ..., ">5000ms") to call counts,
+            or None if the tool does not exist
+        """
+        entry = self._find(tool_id)
+        if entry is None:
+            return None
+        buckets = self._counters.totals(entry[1])["latency_buckets"]
+        labels = [f"<={bound}ms" for bound in LATENCY_BUCKETS_MS] + [f">{LATENCY_BUCKETS_MS[-1]}ms"]
+        return dict(zip(labels, buckets))
+
+    def close(self) -> None:
+        """Unmap the catalog."""
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def _entries(self) -> Iterator[Tuple[str, int, int, int]]:
+        """Iterate over (tool ID, slot, offset, length) index entries."""
+        for position in range(self._count):
+            yield self._index_entry(position)
+
+    def _index_entry(self, position: int) -> Tuple[str, int, int, int]:
+        """Decode the index entry at a position."""
+        raw_id, slot, offset, length = _INDEX_ENTRY.unpack_from(
+            self._mmap, _CATALOG_HEADER.size + position * _INDEX_ENTRY.size)
+        return raw_id.rstrip(b"\0").decode("utf-8"), slot, offset, length
+
+    def _find(self, tool_id: str) -> Optional[Tuple[str, int, int, int]]:
+        """Binary-search the sorted index for a tool ID."""
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            entry = self._index_entry(middle)
+            if entry[0] == tool_id:
+                return entry
+            if entry[0] < tool_id:
+                low = middle + 1
+            else:
+                high = middle
+        return None
+
+    def _read_record(self, entry: Tuple[str, int, int, int]) -> Dict[str, Any]:
+        """Decode a tool record and fill in its fleet-wide usage metrics."""
+        _, slot, offset, length = entry
+        tool = json.loads(self._mmap[offset:offset + length])
+        totals = self._counters.totals(slot)
+        count = totals["usage_count"]
+        tool["usage_count"] = count
+        if count:
+            tool["average_execution_time_ms"] = totals["total_execution_time_ms"] / count
+            tool["average_time_to_first_result_ms"] = totals["total_time_to_first_result_ms"] / count
+            tool["last_used"] = datetime.utcfromtimestamp(totals["last_used_ms"] / 1000).isoformat()
+        return tool
+
+    def _resolve_handler(self, tool: Dict[str, Any]) -> Callable:
+        """Resolve and cache a tool's handler in this worker."""
+        handler = self._handler_resolver(tool)
+        if inspect.isclass(handler) and issubclass(handler, ToolHandler):
+            handler = HandlerPool(handler)
+        self._handlers[tool["id"]] = handler
+        return handler
+
+
+# Example usage
+if __name__ == "__main__":
+    import multiprocessing
+    import tempfile
+
+    configure_logging()
+
+    def lookup(term: str) -> Dict[str, Any]:
+        """Example handler importable in every worker."""
+        return {"term": term, "found": True}
+
+    def worker(catalog_path: str, counters_path: str, worker_slot: int, tool_id: str, calls: int) -> None:
+        view = SharedRegistryView(catalog_path, SharedUsageCounters(counters_path), worker_slot)
+        for _ in range(calls):
+            view.invoke_tool(tool_id, {"term": "agent"})
+
+    registry = ToolRegistry()
+    tool_id = registry.register_tool(
+        "lookup", "Look up a term",
+        {"type": "object", "required": ["term"], "properties": {"term": {"type": "string", "description": "Term"}}},
+        lookup, ToolCategory.RESEARCH, ToolPermissionLevel.SAFE)
+
+    workers = 4
+    with tempfile.TemporaryDirectory(dir="/dev/shm" if os.path.isdir("/dev/shm") else None) as directory:
+        catalog_path = os.path.join(directory, "catalog.bin")
+        counters_path = os.path.join(directory, "counters.bin")
+        counters = SharedUsageCounters(counters_path, max_workers=workers, max_tools=1024)
+        SharedCatalogPublisher(registry, catalog_path, max_tools=1024).publish()
+
+        context = multiprocessing.get_context("fork")
+        processes = [context.Process(target=worker, args=(catalog_path, counters_path, slot, tool_id, 250))
+                     for slot in range(workers)]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+
+        view = SharedRegistryView(catalog_path, counters, worker_slot=0)
+        tool = view.get_tool(tool_id)
+        print(f"Fleet-wide usage of {tool['name']}: {tool['usage_count']} calls, "
+              f"{tool['average_execution_time_ms']:.4f}ms average")
+        print(f"Latency histogram: {view.get_latency_histogram(tool_id)}")
+        view.close()
+        counters.close()
@@ -0,0 +1,413 @@
+"""
+Tool Invocation Scheduler Example
+
+This file demonstrates a fair scheduler that sits in front of Tool Registry
+dispatch, as described in Chapter 4 of "Unified Agentic Systems: The Ultimate Guide to AI-Driven Tool Integration."
+
+A single chatty agent session can otherwise occupy every execution slot and
+starve its neighbours. The scheduler provides:
+1. Per-tenant and per-session queues with weighted fair queueing between them
+2. Priority classes, derived from each tool's permission level, that order
+   the calls queued by one session
+3. Bounded queue depths that push back on callers
+4. Queue wait metrics tracked separately from execution time
+
+Requires tool_registry_example.py from the same directory.
+"""
+
+import heapq
+import itertools
+import logging
+import threading
+import time
+from concurrent.futures import Future
+from typing import Dict, List, Optional, Any
+
+from tool_registry_example import ToolRegistry, ToolPermissionLevel, ToolCategory, configure_logging
+
+logger = logging.getLogger(__name__)
+
+# Lower class numbers are dispatched first within a session, so read-only
+# tools jump ahead of writes queued by the same session.
+DEFAULT_PRIORITY_CLASSES = {
+    ToolPermissionLevel.SAFE: 0,
+    ToolPermissionLevel.USER_CONFIRMED: 1,
+    ToolPermissionLevel.SYSTEM_CHANGE: 2,
+    ToolPermissionLevel.ELEVATED: 3,
+}
+
+
+class SchedulerQueueFullError(Exception):
+    """Raised when a session or tenant queue has reached its maximum depth."""
+
+
+class _SessionQueue:
+    """Pending invocations for one session, ordered by priority class."""
+
+    def __init__(self, session_id: str, weight: float):
+        self.session_id = session_id
+        self.weight = weight
+        self.start_tag = 0.0
+        self.pending: List[tuple] = []
+
+
+class _TenantQueue:
+    """Backlogged sessions of one tenant plus the tenant's fair-share state."""
+
+    def __init__(self, tenant_id: str, weight: float):
+        self.tenant_id = tenant_id
+        self.weight = weight
+        self.start_tag = 0.0
+        self.virtual_time = 0.0
+        self.queued = 0
+        self.sessions: Dict[str, _SessionQueue] = {}
+
+
+class ToolInvocationScheduler:
+    """
+    Weighted fair scheduler for tool invocations.
+
+    Scheduling is two-level start-time fair queueing: tenants share the worker
+    pool in proportion to their weights, and within a tenant its sessions share
+    the tenant's slice in proportion to theirs. Each dispatch is charged the
+    tool's average execution time, so fairness is measured in service time
+    rather than in call counts. Within a session, lower priority classes run
+    first and calls of the same class run in submission order.
+
+    Priority is per session only: it never lets a call overtake other
+    sessions' calls. A high-priority call waits for its session's fair-queue
+    turn like any other, so a session cannot buy a larger share of the worker
+    pool by choosing read-only tools.
+    """
+
+    def __init__(self,
+                 registry: ToolRegistry,
+                 max_workers: int = 8,
+                 max_session_queue_depth: int = 64,
+                 max_tenant_queue_depth: int = 256,
+                 priority_classes: Optional[Dict[ToolPermissionLevel, int]] = None):
+        """
+        Initialize the scheduler and start its worker threads.
+
+        Args:
+            registry: Registry used to dispatch tool invocations
+            max_workers: Number of concurrent execution slots
+            max_session_queue_depth: Maximum pending invocations per session
+            max_tenant_queue_depth: Maximum pending invocations per tenant
+            priority_classes: Mapping of permission level to priority class
+        """
+        self._registry = registry
+        self._max_session_queue_depth = max_session_queue_depth
+        self._max_tenant_queue_depth = max_tenant_queue_depth
+        classes = priority_classes or DEFAULT_PRIORITY_CLASSES
+        self._priority_classes = {level.value: cls for level, cls in classes.items()}
+
+        self._tenants: Dict[str, _TenantQueue] = {}
+        self._idle_tenants: List[tuple] = []
+        self._tenant_weights: Dict[str, float] = {}
+        self._session_weights: Dict[str, float] = {}
+        self._virtual_time = 0.0
+        self._sequence = itertools.count()
+        self._queued = 0
+        self._shutdown = False
+
+        self._lock = threading.Lock()
+        self._condition = threading.Condition(self._lock)
+        self._space_available = threading.Condition(self._lock)
+        self._metrics: Dict[str, Dict[str, Dict[str, float]]] = {"tools": {}, "tenants": {}}
+
+        self._workers = [
+            threading.Thread(target=self._worker_loop, name=f"tool-scheduler-{i}", daemon=True)
+            for i in range(max_workers)
+        ]
+        for worker in self._workers:
+            worker.start()
+        logger.info(f"Tool scheduler started with {max_workers} workers")
+
+    def set_tenant_weight(self, tenant_id: str, weight: float) -> None:
+        """
+        Set the relative share of execution slots for a tenant.
+
+        Args:
+            tenant_id: Tenant identifier
+            weight: Positive relative weight (default 1.0)
+        """
+        if weight <= 0:
+            raise ValueError("Tenant weight must be positive")
+        with self._condition:
+            self._tenant_weights[tenant_id] = weight
+            if tenant_id in self._tenants:
+                self._tenants[tenant_id].weight = weight
+
+    def set_session_weight(self, session_id: str, weight: float) -> None:
+        """
+        Set the relative share of its tenant's slots for a session.
+
+        Args:
+            session_id: Session identifier
+            weight: Positive relative weight (default 1.0)
+        """
+        if weight <= 0:
+            raise ValueError("Session weight must be positive")
+        with self._condition:
+            self._session_weights[session_id] = weight
+            for tenant in self._tenants.values():
+                if session_id in tenant.sessions:
+                    tenant.sessions[session_id].weight = weight
+
+    def submit(self,
+               tool_id: str,
+               parameters: Optional[Dict[str, Any]] = None,
+               session_id: str = "default",
+               tenant_id: str = "default",
+               block: bool = False,
+               timeout: Optional[float] = None) -> Future:
+        """
+        Queue a tool invocation for fair dispatch.
+
+        Args:
+            tool_id: The unique identifier of the tool
+            parameters: Keyword arguments passed to the handler
+            session_id: Session issuing the call
+            tenant_id: Tenant that owns the session
+            block: Wait for queue space instead of failing immediately
+            timeout: Maximum seconds to wait for space when block is True
+
+        Returns:
+            Future resolved with the handler's result
+
+        Raises:
+            ValueError: If the tool does not exist
+            SchedulerQueueFullError: If the session or tenant queue is full
+        """
+        tool = self._registry.get_tool(tool_id)
+        if tool is None:
+            raise ValueError(f"Tool not found (ID: {tool_id})")
+        priority = self._priority_classes.get(tool["permission_level"], len(self._priority_classes))
+        cost = max(tool["average_execution_time_ms"], 1.0)
+        future: Future = Future()
+
+        with self._condition:
+            deadline = None if timeout is None else time.monotonic() + timeout
+            while self._is_full(tenant_id, session_id):
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if not block or (remaining is not None and remaining <= 0):
+                    raise SchedulerQueueFullError(
+                        f"Queue full for tenant {tenant_id} / session {session_id}")
+                self._space_available.wait(remaining)
+            if self._shutdown:
+                raise RuntimeError("Scheduler has been shut down")
+
+            tenant = self._tenants.get(tenant_id)
+            if tenant is None:
+                tenant = _TenantQueue(tenant_id, self._tenant_weights.get(tenant_id, 1.0))
+                self._tenants[tenant_id] = tenant
+            session = tenant.sessions.get(session_id)
+            if session is None:
+                session = _SessionQueue(session_id, self._session_weights.get(session_id, 1.0))
+                tenant.sessions[session_id] = session
+
+            # A flow that becomes backlogged starts no earlier than current virtual time
+            if tenant.queued == 0:
+                tenant.start_tag = max(tenant.start_tag, self._virtual_time)
+            if not session.pending:
+                session.start_tag = max(session.start_tag, tenant.virtual_time)
+
+            heapq.heappush(session.pending, (
+                priority, next(self._sequence), tool_id, parameters, cost, future, time.perf_counter()))
+            tenant.queued += 1
+            self._queued += 1
+            self._condition.notify()
+
+        return future
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Get queue wait and execution time metrics.
+
+        Returns:
+            Dictionary with per-tool and per-tenant statistics plus the current queue depth
+        """
+        with self._condition:
+            return {
+                "queued": self._queued,
+                "tools": {key: dict(stats) for key, stats in self._metrics["tools"].items()},
+                "tenants": {key: dict(stats) for key, stats in self._metrics["tenants"].items()},
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stop accepting work and stop the workers once the queues drain.
+
+        Args:
+            wait: Block until all worker threads have exited
+        """
+        with self._condition:
+            self._shutdown = True
+            self._condition.notify_all()
+        if wait:
+            for worker in self._workers:
+                worker.join()
+
+    def _is_full(self, tenant_id: str, session_id: str) -> bool:
+        """Check whether a new invocation would exceed a queue depth bound."""
+        tenant = self._tenants.get(tenant_id)
+        if tenant is None:
+            return False
+        if tenant.queued >= self._max_tenant_queue_depth:
+            return True
+        session = tenant.sessions.get(session_id)
+        return session is not None and len(session.pending) >= self._max_session_queue_depth
+
+    def _next_invocation(self) -> Optional[tuple]:
+        """Pop the next invocation according to weighted fair order. Caller holds the lock."""
+        backlogged = [tenant for tenant in self._tenants.values() if tenant.queued]
+        if not backlogged:
+            return None
+        tenant = min(backlogged, key=lambda t: t.start_tag)
+        session = min((s for s in tenant.sessions.values() if s.pending), key=lambda s: s.start_tag)
+        item = heapq.heappop(session.pending)
+        cost = item[4]
+
+        self._virtual_time = tenant.start_tag
+        tenant.virtual_time = session.start_tag
+        tenant.start_tag += cost / tenant.weight
+        session.start_tag += cost / session.weight
+        tenant.queued -= 1
+        self._queued -= 1
+
+        # Drop idle sessions so long-running tenants do not accumulate state
+        if not session.pending:
+            del tenant.sessions[session.session_id]
+        if not tenant.queued:
+            heapq.heappush(self._idle_tenants, (tenant.start_tag, tenant.tenant_id))
+        self._drop_idle_tenants()
+        self._space_available.notify_all()
+        return tenant.tenant_id, item
+
+    def _drop_idle_tenants(self) -> None:
+        """
+        Forget idle tenants whose fair-share state no longer matters. Caller holds the lock.
+
+        A tenant that becomes backlogged again starts at max(start_tag, virtual time),
+        so its state only affects fairness while its start tag is ahead of virtual
+        time. Once virtual time catches up, or nothing at all is queued, a fresh
+        queue behaves identically and the old one can be released.
+        """
+        if not self._queued and self._idle_tenants:
+            self._virtual_time = max(self._virtual_time, max(tag for tag, _ in self._idle_tenants))
+        while self._idle_tenants and self._idle_tenants[0][0] <= self._virtual_time:
+            _, tenant_id = heapq.heappop(self._idle_tenants)
+            tenant = self._tenants.get(tenant_id)
+            if tenant is not None and not tenant.queued and tenant.start_tag <= self._virtual_time:
+                del self._tenants[tenant_id]
+
+    def _worker_loop(self) -> None:
+        """Dispatch queued invocations until the scheduler shuts down."""
+        while True:
+            with self._condition:
+                next_item = self._next_invocation()
+                while next_item is None:
+                    if self._shutdown:
+                        return
+                    self._condition.wait()
+                    next_item = self._next_invocation()
+
+            tenant_id, (_, _, tool_id, parameters, _, future, enqueued_at) = next_item
+            if not future.set_running_or_notify_cancel():
+                continue
+
+            started_at = time.perf_counter()
+            try:
+                result = self._registry.invoke_tool(tool_id, parameters)
+            except Exception as e:
+                logger.warning(f"Scheduled invocation failed for tool {tool_id}: {e}")
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+            finished_at = time.perf_counter()
+
+            self._record_metrics(tool_id, tenant_id,
+                                 (started_at - enqueued_at) * 1000,
+                                 (finished_at - started_at) * 1000)
+
+    def _record_metrics(self, tool_id: str, tenant_id: str,
+                        wait_ms: float, execution_ms: float) -> None:
+        """Accumulate wait and execution statistics for a completed invocation."""
+        with self._condition:
+            for group, key in (("tools", tool_id), ("tenants", tenant_id)):
+                stats = self._metrics[group].setdefault(key, {
+                    "count": 0,
+                    "average_queue_wait_ms": 0.0,
+                    "max_queue_wait_ms": 0.0,
+                    "average_execution_time_ms": 0.0,
+                })
+                count = stats["count"] + 1
+                stats["average_queue_wait_ms"] += (wait_ms - stats["average_queue_wait_ms"]) / count
+                stats["average_execution_time_ms"] += (
+                    execution_ms - stats["average_execution_time_ms"]) / count
+                stats["max_queue_wait_ms"] = max(stats["max_queue_wait_ms"], wait_ms)
+                stats["count"] = count
+
+
+# Example usage
+if __name__ == "__main__":
+    configure_logging()
+
+    def read_file(path: str) -> Dict[str, Any]:
+        """Example read-only tool handler."""
+        time.sleep(0.01)
+        return {"status": "success", "path": path}
+
+    def write_file(path: str, content: str) -> Dict[str, Any]:
+        """Example tool handler that changes the system."""
+        time.sleep(0.02)
+        return {"status": "success", "path": path, "bytes_written": len(content)}
+
+    path_schema = {
+        "type": "object",
+        "required": ["path"],
+        "properties": {
+            "path": {"type": "string", "description": "Path of the file"},
+            "content": {"type": "string", "description": "Content to write"}
+        }
+    }
+
+    registry = ToolRegistry()
+    read_id = registry.register_tool(
+        name="read_file", description="Read a file", schema=path_schema,
+        handler_func=read_file, category=ToolCategory.FILE_SYSTEM,
+        permission_level=ToolPermissionLevel.SAFE)
+    write_id = registry.register_tool(
+        name="write_file", description="Write a file", schema=path_schema,
+        handler_func=write_file, category=ToolCategory.FILE_SYSTEM,
+        permission_level=ToolPermissionLevel.ELEVATED)
+
+    scheduler = ToolInvocationScheduler(registry, max_workers=2, max_session_queue_depth=50)
+
+    # A chatty session floods the queue with writes...
+    futures = [
+        scheduler.submit(write_id, {"path": f"out_{i}.txt", "content": "data"},
+                         session_id="chatty", tenant_id="acme")
+        for i in range(40)
+    ]
+    # ...and then a read, which its priority class moves ahead of the session's
+    # own queued writes (priority never reorders calls across sessions)
+    chatty_read = scheduler.submit(read_id, {"path": "notes.md"}, session_id="chatty", tenant_id="acme")
+    futures.append(chatty_read)
+    # A quiet session of another tenant gets prompt service through fair queueing
+    futures.append(scheduler.submit(read_id, {"path": "README.md"},
+                                    session_id="quiet", tenant_id="globex"))
+
+    chatty_read.result()
+    pending_writes = sum(not future.done() for future in futures[:40])
+    print(f"Chatty session's read finished with {pending_writes} of its writes still pending")
+    for future in futures:
+        future.result()
+
+    metrics = scheduler.get_metrics()
+    for tenant_id, stats in metrics["tenants"].items():
+        print(f"{tenant_id}: {stats['count']} calls, "
+              f"avg wait {stats['average_queue_wait_ms']:.1f}ms, "
+              f"avg execution {stats['average_execution_time_ms']:.1f}ms")
+    scheduler.shutdown()
@@ -0,0 +1,288 @@
+"""
+Tool Tracing Example
+
+This file demonstrates lightweight cross-component tracing of tool dispatch,
+as described in Chapter 9 of "Unified Agentic Systems: The Ultimate Guide to AI-Driven Tool Integration."
+
+The component performance heatmap in the benchmarks is built from an assumed
+impact matrix. Attached to a ToolRegistry, the tracer instead:
+1. Records registry dispatch, lookup, validation, validator caching, handler
+   execution and metrics updates as nested spans
+2. Tags every span with one of the six system components
+3. Appends finished spans to a local JSON-lines span file
+4. Derives a latency-attribution matrix from recorded spans, in the data
+   format of component_performance_heatmap.py
+
+Requires tool_registry_example.py from the same directory.
+"""
+
+import contextlib
+import itertools
+import json
+import logging
+import os
+import threading
+import time
+from typing import Dict, List, Optional, Any, Iterator
+
+from tool_registry_example import ToolRegistry, ToolPermissionLevel, ToolCategory, configure_logging
+
+logger = logging.getLogger(__name__)
+
+INTERACTION_LAYER = "Interaction Layer"
+TOOL_MANAGEMENT = "Tool Management"
+RESOURCE_INTERACTION = "Resource Interaction"
+MEMORY_MANAGEMENT = "Memory Management"
+OPERATION_PIPELINE = "Operation Pipeline"
+ERROR_HANDLING = "Error Handling"
+COMPONENTS = [INTERACTION_LAYER, TOOL_MANAGEMENT, RESOURCE_INTERACTION,
+              MEMORY_MANAGEMENT, OPERATION_PIPELINE, ERROR_HANDLING]
+
+# Component of each span the registry records; callers can add their own spans
+# (e.g. retries and fallbacks tagged ERROR_HANDLING). Schema validation is part
+# of normal dispatch, so it counts as tool management rather than error handling.
+DEFAULT_SPAN_COMPONENTS = {
+    "request": INTERACTION_LAYER,
+    "dispatch": OPERATION_PIPELINE,
+    "lookup": TOOL_MANAGEMENT,
+    "validate": TOOL_MANAGEMENT,
+    "validator_cache": MEMORY_MANAGEMENT,
+    "handler": RESOURCE_INTERACTION,
+    "metrics": TOOL_MANAGEMENT,
+}
+
+
+class SpanTracer:
+    """
+    Records nested spans and appends them to a JSON-lines file.
+
+    Parent/child links follow the nesting of span() blocks within a thread.
+    Finished spans are buffered and written in batches, so a span costs two
+    clock reads and a dictionary append on the hot path. Use the tracer as a
+    context manager, or call close(), so spans still buffered are written.
+    """
+
+    def __init__(self,
+                 path: str,
+                 span_components: Optional[Dict[str, str]] = None,
+                 buffer_size: int = 512):
+        """
+        Initialize the tracer.
+
+        Args:
+            path: Span file; spans are appended
+            span_components: Maps span names to components (defaults to
+                DEFAULT_SPAN_COMPONENTS); unmapped names need an explicit component
+            buffer_size: Number of finished spans buffered before writing
+        """
+        self._path = path
+        self._span_components = dict(DEFAULT_SPAN_COMPONENTS, **(span_components or {}))
+        self._buffer_size = buffer_size
+        self._buffer: List[Dict[str, Any]] = []
+        self._ids = itertools.count(1)
+        self._local = threading.local()
+        # _lock guards the buffer; _write_lock keeps batches in order in the file
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._pid = os.getpid()
+
+    @contextlib.contextmanager
+    def span(self, name: str, component: Optional[str] = None, **attributes: Any) -> Iterator[None]:
+        """
+        Record the enclosed block as a span.
+
+        Args:
+            name: Span name
+            component: Component the span's time is attributed to (defaults to
+                the mapping for name)
+            **attributes: Extra JSON-serializable fields stored with the span
+        """
+        component = component or self._span_components.get(name)
+        if component is None:
+            raise ValueError(f"No component given or mapped for span: {name}")
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        parent = stack[-1] if stack else None
+        span_id = next(self._ids)
+        trace_id = parent[1] if parent else span_id
+        stack.append((span_id, trace_id))
+
+        error = None
+        start_wall = time.time()
+        start = time.perf_counter_ns()
+        try:
+            yield
+        except BaseException as e:
+            error = type(e).__name__
+            raise
+        finally:
+            duration_ns = time.perf_counter_ns() - start
+            stack.pop()
+            record = {
+                "pid": self._pid,
+                "trace": trace_id,
+                "span": span_id,
+                "parent": parent[0] if parent else None,
+                "name": name,
+                "component": component,
+                "start": start_wall,
+                "duration_us": duration_ns / 1000,
+            }
+            if attributes:
+                record["attributes"] = attributes
+            if error:
+                record["error"] = error
+            with self._lock:
+                self._buffer.append(record)
+                full = len(self._buffer) >= self._buffer_size
+            if full:
+                self.flush()
+
+    def flush(self) -> None:
+        """Write buffered spans to the span file."""
+        with self._write_lock:
+            with self._lock:
+                spans, self._buffer = self._buffer, []
+            if not spans:
+                return
+            with open(self._path, "a") as f:
+                for record in spans:
+                    f.write(json.dumps(record) + "\n")
+
+    def close(self) -> None:
+        """Write any buffered spans; spans recorded afterwards are buffered again."""
+        self.flush()
+
+    def __enter__(self) -> "SpanTracer":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+def load_spans(path: str) -> List[Dict[str, Any]]:
+    """
+    Read a span file.
+
+    Args:
+        path: JSON-lines file written by SpanTracer
+
+    Returns:
+        List of span records
+    """
+    with open(path) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def attribute_latency(spans: List[Dict[str, Any]], components: Optional[List[str]] = None) -> Dict[str, Any]:
+    """
+    Attribute traced latency to components.
+
+    Only exclusive time is attributed: a span's self time (its duration minus
+    its children's) is charged to its own component, on behalf of the component
+    of the span that called it. Nested time is therefore never counted twice,
+    and the matrix cells add up to the traced time.
+
+    Args:
+        spans: Span records from load_spans
+        components: Row/column order of the matrix (defaults to the components
+            that occur in the spans, in COMPONENTS order); components that occur
+            in the spans but are not listed are appended
+
+    Returns:
+        Dictionary with components, traced_ms (total duration of root spans),
+        self_time_ms per component and matrix_ms, where matrix_ms[i][j] is the
+        self time of component j's spans called from component i (root spans
+        count as called by their own component), so column j sums to component
+        j's self time
+    """
+    seen = {s["component"] for s in spans}
+    if components is None:
+        components = [component for component in COMPONENTS if component in seen]
+    components = list(components) + sorted(seen - set(components))
+    index = {component: i for i, component in enumerate(components)}
+    spans_by_id = {(s["pid"], s["span"]): s for s in spans}
+
+    parents: Dict[tuple, Optional[Dict[str, Any]]] = {}
+    child_us: Dict[tuple, float] = {}
+    traced_us = 0.0
+    for span in spans:
+        parent = spans_by_id.get((span["pid"], span["parent"])) if span["parent"] is not None else None
+        parents[(span["pid"], span["span"])] = parent
+        if parent is None:
+            traced_us += span["duration_us"]
+            continue
+        key = (parent["pid"], parent["span"])
+        child_us[key] = child_us.get(key, 0.0) + span["duration_us"]
+
+    matrix = [[0.0] * len(components) for _ in components]
+    self_time = dict.fromkeys(components, 0.0)
+    for span in spans:
+        key = (span["pid"], span["span"])
+        own_us = max(0.0, span["duration_us"] - child_us.get(key, 0.0))
+        caller = parents[key] or span
+        matrix[index[caller["component"]]][index[span["component"]]] += own_us
+        self_time[span["component"]] += own_us
+
+    return {
+        "components": components,
+        "traced_ms": traced_us / 1000,
+        "self_time_ms": {component: own_us / 1000 for component, own_us in self_time.items()},
+        "matrix_ms": [[value / 1000 for value in row] for row in matrix],
+    }
+
+
+def heatmap_data(attribution: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Convert a latency attribution into component_performance_heatmap.py data.
+
+    Args:
+        attribution: Result of attribute_latency
+
+    Returns:
+        Heatmap data with the matrix as a percentage of traced time (the
+        cells sum to 100%)
+    """
+    total_ms = attribution["traced_ms"] or 1.0
+    return {
+        "source": "Latency attribution from recorded tracing spans",
+        "title": "Component Latency Attribution",
+        "scale": "Share of Traced Latency (%)",
+        "format": ".1f",
+        "components": attribution["components"],
+        "impact_matrix": [[round(value / total_ms * 100, 2) for value in row]
+                          for row in attribution["matrix_ms"]],
+        "annotations": [],
+    }
+
+
+# Example usage
+if __name__ == "__main__":
+    import tempfile
+
+    configure_logging()
+
+    def fetch_page(url: str) -> Dict[str, Any]:
+        """Example IO-bound tool."""
+        time.sleep(0.002)
+        return {"url": url, "status": 200}
+
+    registry = ToolRegistry()
+    tool_id = registry.register_tool(
+        "fetch_page", "Fetch a web page",
+        {"type": "object", "required": ["url"], "properties": {"url": {"type": "string", "description": "URL"}}},
+        fetch_page, ToolCategory.EXTERNAL_SERVICE, ToolPermissionLevel.SAFE)
+
+    with tempfile.TemporaryDirectory() as directory:
+        span_path = os.path.join(directory, "spans.jsonl")
+        with SpanTracer(span_path) as tracer:
+            registry.set_tracer(tracer)
+            for i in range(200):
+                with tracer.span("request", session=f"session-{i % 4}"):
+                    registry.invoke_tool(tool_id, {"url": f"https://example.com/{i}"}, validate=True)
+
+        attribution = attribute_latency(load_spans(span_path))
+        print(f"Traced {attribution['traced_ms']:.1f}ms across 200 requests")
+        for component, own_ms in sorted(attribution["self_time_ms"].items(), key=lambda item: -item[1]):
+            print(f"  {component:22} {own_ms:8.2f}ms self time")